@@ -1,5 +1,6 @@
 import ffmpeg
-from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, List, Optional, Tuple
 from pydantic import BaseModel
 import os
 
@@ -70,3 +71,35 @@ class ClipAssembler:
                 ffmpeg_command="ffmpeg concat",
                 error=str(e)
             )
+
+    def assemble_scenes(
+        self,
+        scenes: List[Tuple[str, List[str], str]],
+        max_workers: int = 4,
+        progress_callback: Optional[Callable[[int, int], None]] = None
+    ) -> List[AssemblyResult]:
+        """Assemble several scenes concurrently.
+
+        Each scene is an independent stream-copy concat in its own ffmpeg
+        process, so threads are enough to keep several running; the limit
+        is disk bandwidth rather than CPU.
+
+        Args:
+            scenes: (scene_id, clip_paths, output_path) per scene
+            max_workers: Maximum ffmpeg processes running at once
+            progress_callback: Optional callback receiving (completed, total)
+
+        Returns:
+            AssemblyResult per scene, in the same order as scenes
+        """
+        results: List[Optional[AssemblyResult]] = [None] * len(scenes)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self.assemble_scene, scene_id, clip_paths, output_path): i
+                for i, (scene_id, clip_paths, output_path) in enumerate(scenes)
+            }
+            for completed, future in enumerate(as_completed(futures), start=1):
+                results[futures[future]] = future.result()
+                if progress_callback:
+                    progress_callback(completed, len(scenes))
+        return results
@@ -19,6 +19,7 @@ BATCH_SIZE = 10  # Number of chunks to process per LLM call (increased for faste
 # Storage Configuration
 DB_PATH = Path(os.getenv("DB_PATH", "./output/pipeline.db"))
 CHROMA_PATH = Path(os.getenv("CHROMA_PATH", "./output/chroma"))
+DEDUP_PREFIX_BYTES = 1 << 20  # Leading PDF bytes hashed for the quick duplicate check
 
 # Ensure output directories exist
 DB_PATH.parent.mkdir(parents=True, exist_ok=True)
@@ -26,17 +27,30 @@ CHROMA_PATH.mkdir(parents=True, exist_ok=True)
 
 # Embedding Configuration
 EMBEDDING_MODEL = "all-MiniLM-L6-v2"
+EMBEDDING_BATCH_SIZE = int(os.getenv("EMBEDDING_BATCH_SIZE", "128"))  # Chunks per encode/add call
 
 # Rate Limiting
 API_CALL_DELAY = 2.0  # Seconds between API calls (increased to avoid rate limits)
 MAX_RETRIES = 3
+MAX_CONCURRENT_LLM_CALLS = int(os.getenv("MAX_CONCURRENT_LLM_CALLS", "5"))  # In-flight calls for batched extraction
 RETRY_BACKOFF_MULTIPLIER = 2
+JOB_SUBMIT_BATCH_SIZE = int(os.getenv("JOB_SUBMIT_BATCH_SIZE", "16"))  # Video jobs per batch submission
+MAX_CONCURRENT_ASSEMBLIES = int(os.getenv("MAX_CONCURRENT_ASSEMBLIES", str(min(4, os.cpu_count() or 1))))  # Parallel ffmpeg concats (disk bound)
 
 # Output Paths
 OUTPUT_DIR = Path("./output")
 STORY_BIBLES_DIR = OUTPUT_DIR / "story_bibles"
 CHUNKS_DIR = OUTPUT_DIR / "chunks"
+SCREENPLAYS_DIR = OUTPUT_DIR / "screenplays"
+SCENE_BREAKDOWNS_DIR = OUTPUT_DIR / "scene_breakdowns"
+PROMPTS_DIR = OUTPUT_DIR / "prompts"
+JOBS_DIR = OUTPUT_DIR / "jobs"
+CLIPS_DIR = OUTPUT_DIR / "clips"
+SCENES_DIR = OUTPUT_DIR / "scenes"
 
 # Ensure output directories exist
-STORY_BIBLES_DIR.mkdir(parents=True, exist_ok=True)
-CHUNKS_DIR.mkdir(parents=True, exist_ok=True)
+for _output_dir in (
+    STORY_BIBLES_DIR, CHUNKS_DIR, SCREENPLAYS_DIR,
+    SCENE_BREAKDOWNS_DIR, PROMPTS_DIR, JOBS_DIR, CLIPS_DIR, SCENES_DIR
+):
+    _output_dir.mkdir(parents=True, exist_ok=True)
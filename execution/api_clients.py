@@ -1,8 +1,10 @@
 import abc
 import time
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from pydantic import BaseModel
 
+import config
+
 class JobStatus(BaseModel):
     status: str                 # "queued" | "processing" | "completed" | "failed"
     progress: int               # 0-100
@@ -15,6 +17,9 @@ class RateLimits(BaseModel):
     requests_per_day: int
 
 class BaseVideoAPIClient(abc.ABC):
+    # True when submit_batch/get_statuses hit a bulk endpoint rather than looping
+    supports_batch = False
+
     def __init__(self, api_key: str, base_url: str):
         self.api_key = api_key
         self.base_url = base_url
@@ -39,10 +44,24 @@ class BaseVideoAPIClient(abc.ABC):
         """Return API rate limit configuration"""
         pass
 
+    async def submit_batch(self, prompts: List[Dict[str, Any]]) -> List[str]:
+        """Submit several generation jobs, return provider job IDs in order"""
+        return [await self.submit_job(prompt) for prompt in prompts]
+
+    async def get_statuses(self, job_ids: List[str]) -> Dict[str, JobStatus]:
+        """Check the status of several jobs"""
+        return {job_id: await self.poll_status(job_id) for job_id in job_ids}
+
+    async def aclose(self) -> None:
+        """Release any pooled connections held by the client"""
+        pass
+
 class SeedanceClient(BaseVideoAPIClient):
     """
     Seedance 2.0 API client
     """
+    supports_batch = True
+
     async def submit_job(self, prompt: Dict[str, Any]) -> str:
         # Placeholder for actual API call
         # In a real implementation, this would use httpx to POST to the API
@@ -51,7 +70,12 @@ class SeedanceClient(BaseVideoAPIClient):
 
     async def poll_status(self, job_id: str) -> JobStatus:
         # Placeholder status
-        return JobStatus(status=config.TEST_STATUS or "completed", progress=100, eta_seconds=0, error=None)
+        return JobStatus(status=getattr(config, "TEST_STATUS", None) or "completed", progress=100, eta_seconds=0, error=None)
+
+    async def submit_batch(self, prompts: List[Dict[str, Any]]) -> List[str]:
+        """Submit several generation jobs in one request, return provider job IDs in order"""
+        # Placeholder for a single batched POST
+        return [f"seedance_job_{int(time.time())}_{i}" for i in range(len(prompts))]
 
     async def get_result_url(self, job_id: str) -> str:
         # Placeholder URL
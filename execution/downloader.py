@@ -13,6 +13,19 @@ class DownloadResult(BaseModel):
 class VideoDownloader:
     def __init__(self, output_base_path: str):
         self.output_base_path = Path(output_base_path)
+        # Shared across downloads so connections (and TLS sessions) are reused
+        self._http: httpx.AsyncClient | None = None
+
+    def _client(self) -> httpx.AsyncClient:
+        if self._http is None or self._http.is_closed:
+            self._http = httpx.AsyncClient()
+        return self._http
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client; must run on the loop that used it"""
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
 
     async def download(
         self,
@@ -31,12 +44,11 @@ class VideoDownloader:
             filename = f"clip_{clip_index:03d}.mp4"
             file_path = scene_dir / filename
             
-            async with httpx.AsyncClient() as client:
-                response = await client.get(video_url)
-                response.raise_for_status()
-                
-                async with aiofiles.open(file_path, 'wb') as f:
-                    await f.write(response.content)
+            response = await self._client().get(video_url)
+            response.raise_for_status()
+            
+            async with aiofiles.open(file_path, 'wb') as f:
+                await f.write(response.content)
             
             return DownloadResult(
                 success=True,
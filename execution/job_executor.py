@@ -1,13 +1,22 @@
 import asyncio
+import hashlib
+import json
 import time
-from typing import List, Dict, Any, Optional
+from pathlib import Path
+from typing import Callable, List, Dict, Any, Optional
 from pydantic import BaseModel
 
 from .api_clients import BaseVideoAPIClient, SeedanceClient
-from .poller import AsyncJobPoller
+from .poller import AsyncJobPoller, PollResult
 from .downloader import VideoDownloader, DownloadResult
 from .rate_limiter import RateLimiter
 from .retry_handler import RetryHandler
+from generation.job_queue import JobQueue
+
+def prompt_hash(prompt: Dict[str, Any]) -> str:
+    """Hash a prompt payload so identical prompts map to the same cached clip."""
+    canonical = json.dumps(prompt, sort_keys=True, separators=(",", ":"))
+    return hashlib.blake2b(canonical.encode("utf-8")).hexdigest()
 
 class JobResult(BaseModel):
     success: bool
@@ -45,25 +54,54 @@ class JobExecutor:
         self.downloader = downloader or VideoDownloader("output")
         self.rate_limiter = rate_limiter or RateLimiter(db)
         self.retry_handler = retry_handler or RetryHandler()
+        self.queue = JobQueue(db)
 
     async def execute_queue(
         self,
         novel_id: str,
         max_concurrent_jobs: int = 5,
-        resume: bool = True
+        resume: bool = True,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+        batch_size: int = 1,
+        use_cache: bool = True
     ) -> ExecutionReport:
-        # Fetch jobs from DB
-        # This is a placeholder for DB fetch logic
-        # jobs = self.db.get_pending_jobs(novel_id)
-        # For now, we simulate
-        jobs = [] 
-        
+        """Run a novel's queued jobs with at most max_concurrent_jobs in flight.
+
+        Each job (or batch of jobs, if the client supports batch submission)
+        is gated by a semaphore and results are folded into the report as
+        they complete, so a long queue never has more than
+        max_concurrent_jobs provider requests open at once.
+
+        With use_cache, a job whose prompt matches one that already produced
+        a clip reuses that clip and is marked skipped instead of being sent
+        to the provider. Identical prompts within one run are generated once.
+
+        Args:
+            novel_id: Novel UUID
+            max_concurrent_jobs: Maximum jobs (or batches) submitted/polled concurrently
+            resume: Skip jobs that already completed in a previous run
+            progress_callback: Optional callback receiving (completed, total)
+            batch_size: Jobs per submission when the client supports_batch
+            use_cache: Reuse clips generated for identical prompts
+
+        Returns:
+            ExecutionReport summarizing the run
+        """
+        statuses = ("queued", "running", "failed")
+        if not resume:
+            statuses += ("complete", "skipped")
+        jobs = self.queue.get_jobs_for_execution(novel_id, statuses)
+        skipped = 0
+        if resume:
+            stats = self.queue.get_queue_stats(novel_id)
+            skipped = stats.complete + stats.skipped
+
         report = ExecutionReport(
             novel_id=novel_id,
-            total_jobs=len(jobs),
+            total_jobs=len(jobs) + skipped,
             completed=0,
             failed=0,
-            skipped=0,
+            skipped=skipped,
             total_generation_time_seconds=0,
             total_cost_usd=0,
             average_cost_per_clip=0,
@@ -71,20 +109,107 @@ class JobExecutor:
             error_summary={}
         )
 
-        # Semaphore for concurrency
+        total = len(jobs)
+        done = 0
+        # Jobs sharing a prompt with one dispatched this run, keyed by prompt hash
+        duplicates: Dict[str, List[Dict[str, Any]]] = {}
+        if use_cache:
+            for job in jobs:
+                job['prompt_hash'] = prompt_hash(job['prompt'])
+            cached_clips = self.db.get_clips_by_prompt_hashes({job['prompt_hash'] for job in jobs})
+
+            to_run = []
+            for job in jobs:
+                cached_path = cached_clips.get(job['prompt_hash'])
+                if cached_path and Path(cached_path).exists():
+                    self.queue.mark_skipped(job['id'], cached_path)
+                    report.skipped += 1
+                    done += 1
+                elif job['prompt_hash'] in duplicates:
+                    duplicates[job['prompt_hash']].append(job)
+                else:
+                    duplicates[job['prompt_hash']] = []
+                    to_run.append(job)
+            jobs = to_run
+
+        # Size the progress bar (and count cache hits) before any job runs
+        if progress_callback:
+            progress_callback(done, total)
+
+        if batch_size > 1 and self.client.supports_batch:
+            by_provider: Dict[str, List[Dict[str, Any]]] = {}
+            for job in jobs:
+                by_provider.setdefault(job['api_provider'], []).append(job)
+            batches = [
+                provider_jobs[i:i + batch_size]
+                for provider_jobs in by_provider.values()
+                for i in range(0, len(provider_jobs), batch_size)
+            ]
+        else:
+            batches = [[job] for job in jobs]
+
         sem = asyncio.Semaphore(max_concurrent_jobs)
 
-        async def _worker(job):
+        async def _guard(batch: List[Dict[str, Any]]):
             async with sem:
-                return await self.execute_single_job(job)  # type: ignore
+                self.queue.mark_running_many([job['id'] for job in batch])
+                try:
+                    if len(batch) == 1:
+                        results = [await self.execute_single_job(batch[0])]
+                    else:
+                        results = await self.execute_batch(batch)
+                except Exception as e:
+                    results = [
+                        JobResult(success=False, error=str(e), file_path=None, generation_time_seconds=None, cost_usd=None)
+                        for _ in batch
+                    ]
+                return zip(batch, results)
+
+        try:
+            for fut in asyncio.as_completed([_guard(batch) for batch in batches]):
+                for job, result in await fut:
+                    self._record_result(report, job, result)
+                    done += 1
+
+                    if not use_cache:
+                        continue
+                    if result.success:
+                        self.db.insert_clip_hash(job['prompt_hash'], result.file_path, job['id'])
+                    for duplicate in duplicates.pop(job['prompt_hash'], []):
+                        if result.success:
+                            self.queue.mark_skipped(duplicate['id'], result.file_path)
+                            report.skipped += 1
+                        else:
+                            self._record_result(report, duplicate, result)
+                        done += 1
+                if progress_callback:
+                    progress_callback(done, total)
+        finally:
+            # The downloader pools connections on this event loop, so close it here
+            await self.downloader.aclose()
+
+        if report.completed:
+            report.average_cost_per_clip = report.total_cost_usd / report.completed
 
-        # tasks = [_worker(job) for job in jobs]
-        # results = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        # Process results...
-        
         return report
 
+    def _record_result(self, report: ExecutionReport, job: Dict[str, Any], result: JobResult) -> None:
+        """Persist a finished job's outcome and fold it into the report."""
+        if result.success:
+            report.completed += 1
+            report.total_generation_time_seconds += result.generation_time_seconds or 0
+            report.total_cost_usd += result.cost_usd or 0
+            self.queue.mark_complete(
+                job['id'], result.file_path, result.cost_usd or 0.0,
+                int(result.generation_time_seconds or 0)
+            )
+        else:
+            error = result.error or "Unknown error"
+            report.failed += 1
+            report.failed_job_ids.append(job['id'])
+            report.error_summary[error] = report.error_summary.get(error, 0) + 1
+            self.queue.mark_failed(job['id'], error)
+
     async def execute_single_job(self, job: Dict[str, Any]) -> JobResult:
         # 1. Rate limiter
         await self.rate_limiter.acquire(job.get('api_provider', 'seedance'))
@@ -102,10 +227,42 @@ class JobExecutor:
             provider_job_id
         )
 
+        # 4. Download
+        return await self._download_result(job, poll_result, start_time)
+
+    async def execute_batch(self, jobs: List[Dict[str, Any]]) -> List[JobResult]:
+        """Submit and poll several jobs with one request each instead of one per job.
+
+        Args:
+            jobs: Job dicts sharing one API provider
+
+        Returns:
+            JobResult per job, in the same order
+        """
+        await self.rate_limiter.acquire(jobs[0].get('api_provider', 'seedance'))
+
+        start_time = time.time()
+        try:
+            provider_job_ids = await self.client.submit_batch([job.get('prompt', {}) for job in jobs])
+        except Exception as e:
+            return [
+                JobResult(success=False, error=str(e), file_path=None, generation_time_seconds=None, cost_usd=None)
+                for _ in jobs
+            ]
+
+        poll_results = await self.poller.poll_many_until_complete(
+            [(job['id'], provider_job_id) for job, provider_job_id in zip(jobs, provider_job_ids)]
+        )
+
+        return list(await asyncio.gather(*(
+            self._download_result(job, poll_results[job['id']], start_time) for job in jobs
+        )))
+
+    async def _download_result(self, job: Dict[str, Any], poll_result: PollResult, start_time: float) -> JobResult:
+        """Download a polled job's video and build its JobResult."""
         if poll_result.status != 'completed':
             return JobResult(success=False, error=poll_result.error, file_path=None, generation_time_seconds=None, cost_usd=None)
 
-        # 4. Download
         download_result = await self.downloader.download(
             poll_result.video_url,
             job['id'],
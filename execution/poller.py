@@ -1,6 +1,6 @@
 import asyncio
 import time
-from typing import List, Tuple, Any
+from typing import Dict, List, Tuple, Any
 from pydantic import BaseModel
 from .api_clients import BaseVideoAPIClient, JobStatus
 
@@ -61,3 +61,65 @@ class AsyncJobPoller:
             video_url=None,
             error="Polling timed out"
         )
+
+    async def poll_many_until_complete(
+        self,
+        jobs: List[Tuple[str, str]],
+        max_wait_seconds: int = 300,
+        poll_interval_seconds: int = 5
+    ) -> Dict[str, PollResult]:
+        """Poll a batch of jobs with one status request per interval.
+
+        Falls back to polling each job individually unless the client
+        supports_batch.
+
+        Args:
+            jobs: (job_id, provider_job_id) pairs
+            max_wait_seconds: Give up on unfinished jobs after this long
+            poll_interval_seconds: Delay between status requests
+
+        Returns:
+            PollResult for every job, keyed by job_id
+        """
+        if not self.client.supports_batch:
+            results = await asyncio.gather(*(
+                self.poll_until_complete(job_id, provider_job_id, max_wait_seconds, poll_interval_seconds)
+                for job_id, provider_job_id in jobs
+            ))
+            return {result.job_id: result for result in results}
+
+        pending = dict(jobs)
+        results: Dict[str, PollResult] = {}
+        start_time = time.time()
+
+        while pending and (time.time() - start_time) < max_wait_seconds:
+            try:
+                statuses = await self.client.get_statuses(list(pending.values()))
+            except Exception:
+                await asyncio.sleep(poll_interval_seconds)
+                continue
+
+            for job_id, provider_job_id in list(pending.items()):
+                status = statuses.get(provider_job_id)
+                if status is None or status.status not in ("completed", "failed"):
+                    continue
+
+                if status.status == "completed":
+                    try:
+                        video_url = await self.client.get_result_url(provider_job_id)
+                    except Exception:
+                        # Leave the job pending so the next interval retries it
+                        continue
+                    results[job_id] = PollResult(job_id=job_id, status="completed", video_url=video_url, error=None)
+                else:
+                    results[job_id] = PollResult(
+                        job_id=job_id, status="failed", video_url=None, error=status.error or "Unknown failure"
+                    )
+                del pending[job_id]
+
+            if pending:
+                await asyncio.sleep(poll_interval_seconds)
+
+        for job_id in pending:
+            results[job_id] = PollResult(job_id=job_id, status="timeout", video_url=None, error="Polling timed out")
+        return results
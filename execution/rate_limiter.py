@@ -11,31 +11,39 @@ class RateLimitStatus:
 class RateLimiter:
     def __init__(self, db: Any):
         self.db = db
-        # In-memory cache for simple rate limiting
+        # In-memory pacing: each provider hands out request slots spaced
+        # 60/rpm seconds apart on the monotonic clock
         self.limits = {
-            "seedance": {"rpm": 30, "last_request": 0},
-            "kling": {"rpm": 10, "last_request": 0}
+            "seedance": {"rpm": 30, "next_slot": 0.0},
+            "kling": {"rpm": 10, "next_slot": 0.0}
         }
 
+    def set_rate(self, api_provider: str, requests_per_minute: int) -> None:
+        """Set (or add) a provider's requests-per-minute quota"""
+        limit_info = self.limits.setdefault(api_provider, {"rpm": requests_per_minute, "next_slot": 0.0})
+        limit_info["rpm"] = requests_per_minute
+
     async def acquire(self, api_provider: str) -> None:
-        """Block until rate limit allows request"""
+        """Block until rate limit allows request.
+
+        The caller's slot is reserved before sleeping, so concurrent callers
+        queue up behind each other instead of all seeing the same idle
+        limiter and bursting past the quota together.
+        """
         if api_provider not in self.limits:
             return
 
         limit_info = self.limits[api_provider]
-        rpm = limit_info["rpm"]
-        interval = 60.0 / rpm
-        
-        last_request = limit_info["last_request"]
-        now = time.time()
-        
-        elapsed = now - last_request
-        if elapsed < interval:
-            wait_time = interval - elapsed
-            await asyncio.sleep(wait_time)
-            
-        self.limits[api_provider]["last_request"] = time.time()
+        interval = 60.0 / limit_info["rpm"]
+
+        now = time.monotonic()
+        slot = max(now, limit_info["next_slot"])
+        limit_info["next_slot"] = slot + interval
+
+        if slot > now:
+            await asyncio.sleep(slot - now)
 
     def record_request(self, api_provider: str) -> None:
         if api_provider in self.limits:
-            self.limits[api_provider]["last_request"] = time.time()
+            limit_info = self.limits[api_provider]
+            limit_info["next_slot"] = time.monotonic() + 60.0 / limit_info["rpm"]
@@ -1,5 +1,5 @@
 """Pydantic models for Story Bible extraction."""
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 from typing import List, Dict, Optional, Tuple
 from datetime import datetime
 
@@ -114,6 +114,24 @@ class Screenplay(BaseModel):
     model_used: str = ""
 
 
+class SceneListing(BaseModel):
+    """The fields of a ScreenplayScene shown in scene listings."""
+    scene_number: int
+    slug_line: str
+    scene_type: str
+    characters_present: List[str] = Field(default_factory=list)
+
+
+class ScreenplayListing(BaseModel):
+    """Read-only view of a screenplay JSON file for listing its scenes.
+    
+    Validating into this instead of Screenplay skips the Fountain text,
+    action lines and dialogue, which make up most of the file.
+    """
+    scenes: List[SceneListing] = Field(default_factory=list)
+    page_count_estimate: int = 0
+
+
 class VisualComposition(BaseModel):
     """Visual composition details for a scene."""
     key_moment_description: str  # What the camera shows at the scene's peak
@@ -156,6 +174,10 @@ class SceneBreakdown(BaseModel):
     prompt_ready: bool = False  # True if all required fields are populated
 
 
+# Serializes a whole breakdowns file in one pydantic-core pass
+SceneBreakdownList = TypeAdapter(List[SceneBreakdown])
+
+
 # ==================== Phase 3 Models ====================
 
 class ShotSpec(BaseModel):
@@ -190,6 +212,10 @@ class VideoPrompt(BaseModel):
     created_at: str = Field(default_factory=lambda: datetime.utcnow().isoformat())
 
 
+# Validates/serializes a whole prompts file in one pydantic-core pass
+VideoPromptList = TypeAdapter(List[VideoPrompt])
+
+
 class GenerationJob(BaseModel):
     """A video generation job for Phase 4 execution."""
     job_id: str  # UUID
@@ -237,6 +263,7 @@ class QueueStats(BaseModel):
     running: int = 0
     complete: int = 0
     failed: int = 0
+    skipped: int = 0
     estimated_total_cost_usd: float = 0.0
     estimated_total_duration_minutes: float = 0.0
 
@@ -1,8 +1,9 @@
 """Story Bible extraction using LLM."""
+import asyncio
 import json
 import time
-from typing import List, Dict, Any
-from anthropic import Anthropic
+from typing import Callable, List, Dict, Any, Optional
+from anthropic import Anthropic, AsyncAnthropic
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 
 from utils.logger import setup_logger
@@ -29,24 +30,42 @@ class ExtractionError(Exception):
 class StoryBibleExtractor:
     """Extracts Story Bible from narrative chunks using LLM."""
     
+    MAX_LLM_RETRIES = 10  # More retries for overload errors
+    RETRY_BASE_DELAY = 2.0
+    
     def __init__(
         self,
         anthropic_client: Anthropic,
-        model: str = config.ANTHROPIC_MODEL
+        model: str = config.ANTHROPIC_MODEL,
+        max_concurrency: int = config.MAX_CONCURRENT_LLM_CALLS
     ):
         """Initialize extractor.
         
         Args:
             anthropic_client: Anthropic API client
             model: Model name to use
+            max_concurrency: Maximum in-flight LLM calls for batched stages
         """
         self.client = anthropic_client
         self.model = model
+        self.max_concurrency = max_concurrency
         self.total_tokens_used = 0
         
+        # Progress reporting state for the current extract() call
+        self._progress_callback: Optional[Callable[[int, int], None]] = None
+        self._steps_done = 0
+        self._steps_total = 0
+        
         logger.info(f"StoryBibleExtractor initialized with model: {model}")
     
-    def extract(self, chunks: List[NarrativeChunk], novel_title: str, novel_id: str = None, use_checkpoints: bool = True) -> StoryBible:
+    def extract(
+        self,
+        chunks: List[NarrativeChunk],
+        novel_title: str,
+        novel_id: str = None,
+        use_checkpoints: bool = True,
+        progress_callback: Optional[Callable[[int, int], None]] = None
+    ) -> StoryBible:
         """Extract complete Story Bible from chunks.
         
         Args:
@@ -54,6 +73,8 @@ class StoryBibleExtractor:
             novel_title: Novel title
             novel_id: Novel ID for checkpointing
             use_checkpoints: Whether to use checkpointing
+            progress_callback: Optional callback receiving (steps_done, total_steps),
+                where a step is one LLM batch or stage
             
         Returns:
             Complete StoryBible
@@ -76,10 +97,17 @@ class StoryBibleExtractor:
         # Process in batches using map-reduce approach
         batch_size = config.BATCH_SIZE
         
+        # Characters and locations take one step per batch; the other four stages one each
+        batch_count = -(-len(chunks) // batch_size)
+        self._progress_callback = progress_callback
+        self._steps_done = 0
+        self._steps_total = 2 * batch_count + 4
+        
         # Extract characters
         if checkpoint_data and 'characters' in checkpoint_data:
             logger.info("✓ Loading characters from checkpoint...")
             characters = [CharacterProfile(**c) for c in checkpoint_data['characters']]
+            self._advance(batch_count)
         else:
             logger.info("Extracting characters...")
             characters = self._extract_characters(chunks, batch_size)
@@ -96,6 +124,7 @@ class StoryBibleExtractor:
         if checkpoint_data and 'locations' in checkpoint_data:
             logger.info("✓ Loading locations from checkpoint...")
             locations = [Location(**loc) for loc in checkpoint_data['locations']]
+            self._advance(batch_count)
         else:
             logger.info("Extracting locations...")
             locations = self._extract_locations(chunks, batch_size)
@@ -130,6 +159,8 @@ class StoryBibleExtractor:
                 })
                 checkpoint.save(checkpoint_data)
         
+        self._advance()
+        
         # Extract plot
         if checkpoint_data and 'plot' in checkpoint_data:
             logger.info("✓ Loading plot from checkpoint...")
@@ -148,6 +179,8 @@ class StoryBibleExtractor:
                 })
                 checkpoint.save(checkpoint_data)
         
+        self._advance()
+        
         # Extract world rules
         if checkpoint_data and 'world_rules' in checkpoint_data:
             logger.info("✓ Loading world rules from checkpoint...")
@@ -166,6 +199,8 @@ class StoryBibleExtractor:
                 })
                 checkpoint.save(checkpoint_data)
         
+        self._advance()
+        
         # Extract timeline from sample
         if checkpoint_data and 'timeline' in checkpoint_data:
             logger.info("✓ Loading timeline from checkpoint...")
@@ -184,6 +219,8 @@ class StoryBibleExtractor:
                 })
                 checkpoint.save(checkpoint_data)
         
+        self._advance()
+        
         # Generate visual style notes
         visual_style_notes = self._generate_visual_style_notes(tone, locations)
         
@@ -207,6 +244,16 @@ class StoryBibleExtractor:
         
         return story_bible
     
+    def _advance(self, steps: int = 1) -> None:
+        """Record completed extraction steps and report progress.
+        
+        Args:
+            steps: Number of steps just completed
+        """
+        self._steps_done += steps
+        if self._progress_callback:
+            self._progress_callback(self._steps_done, self._steps_total)
+    
     def _get_sample_chunks(self, chunks: List[NarrativeChunk], n: int = 10) -> List[NarrativeChunk]:
         """Get representative sample of chunks.
         
@@ -240,22 +287,16 @@ class StoryBibleExtractor:
         """
         all_profiles = []
         
-        # Process in batches
-        for i in range(0, len(chunks), batch_size):
-            batch = chunks[i:i + batch_size]
-            chunk_texts = [chunk.text for chunk in batch]
-            
-            prompt = prompts.character_extraction_prompt(chunk_texts)
-            result = self._call_llm(prompt, expect_json=True)
-            
+        # Process batches concurrently; results come back in batch order
+        results = self._run_batches(chunks, batch_size, prompts.character_extraction_prompt)
+        
+        for i, result in zip(range(0, len(chunks), batch_size), results):
             try:
                 profiles_data = json.loads(result)
                 for profile_dict in profiles_data:
                     all_profiles.append(CharacterProfile(**profile_dict))
             except Exception as e:
                 logger.warning(f"Failed to parse character profiles from batch {i}: {e}")
-            
-            time.sleep(config.API_CALL_DELAY)
         
         # Merge duplicates
         if len(all_profiles) > 0:
@@ -280,14 +321,10 @@ class StoryBibleExtractor:
         all_locations = []
         location_names_seen = set()
         
-        # Process in batches
-        for i in range(0, len(chunks), batch_size):
-            batch = chunks[i:i + batch_size]
-            chunk_texts = [chunk.text for chunk in batch]
-            
-            prompt = prompts.location_extraction_prompt(chunk_texts)
-            result = self._call_llm(prompt, expect_json=True)
-            
+        # Process batches concurrently; results come back in batch order
+        results = self._run_batches(chunks, batch_size, prompts.location_extraction_prompt)
+        
+        for i, result in zip(range(0, len(chunks), batch_size), results):
             try:
                 locations_data = json.loads(result)
                 for loc_dict in locations_data:
@@ -297,8 +334,6 @@ class StoryBibleExtractor:
                         location_names_seen.add(loc_dict['name'])
             except Exception as e:
                 logger.warning(f"Failed to parse locations from batch {i}: {e}")
-            
-            time.sleep(config.API_CALL_DELAY)
         
         return all_locations
     
@@ -467,6 +502,53 @@ Return ONLY valid JSON, no other text."""
 
 Use these notes to maintain visual consistency across all generated video prompts."""
     
+    def _run_batches(
+        self,
+        chunks: List[NarrativeChunk],
+        batch_size: int,
+        build_prompt: Callable[[List[str]], str]
+    ) -> List[str]:
+        """Send one prompt per chunk batch, with bounded concurrency.
+        
+        Args:
+            chunks: Narrative chunks
+            batch_size: Chunks per batch
+            build_prompt: Builds a prompt from a batch's chunk texts
+            
+        Returns:
+            Response texts, in batch order
+        """
+        batch_prompts = [
+            build_prompt([chunk.text for chunk in chunks[i:i + batch_size]])
+            for i in range(0, len(chunks), batch_size)
+        ]
+        logger.info(f"Sending {len(batch_prompts)} batches ({self.max_concurrency} concurrent)")
+        return asyncio.run(self._gather_prompts(batch_prompts))
+    
+    async def _gather_prompts(self, prompt_texts: List[str]) -> List[str]:
+        """Run prompts concurrently on an async client, capped by a semaphore.
+        
+        Args:
+            prompt_texts: Prompts to send
+            
+        Returns:
+            Response texts, in the same order as prompt_texts
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        
+        # The async client's connection pool is bound to this event loop
+        async with AsyncAnthropic(api_key=self.client.api_key) as async_client:
+            
+            async def bounded_call(prompt: str) -> str:
+                async with semaphore:
+                    result = await self._acall_llm(async_client, prompt, expect_json=True)
+                    self._advance()
+                    # Keep each slot paced as the sequential loop was
+                    await asyncio.sleep(config.API_CALL_DELAY)
+                    return result
+            
+            return await asyncio.gather(*(bounded_call(p) for p in prompt_texts))
+    
     def _call_llm(self, prompt: str, expect_json: bool = True) -> str:
         """Call Anthropic API with retry logic.
         
@@ -480,10 +562,7 @@ Use these notes to maintain visual consistency across all generated video prompt
         Raises:
             ExtractionError: If call fails after retries
         """
-        max_retries = 10  # More retries for overload errors
-        base_delay = 2.0
-        
-        for attempt in range(max_retries):
+        for attempt in range(self.MAX_LLM_RETRIES):
             try:
                 message = self.client.messages.create(
                     model=self.model,
@@ -493,99 +572,162 @@ Use these notes to maintain visual consistency across all generated video prompt
                         {"role": "user", "content": prompt}
                     ]
                 )
-                
-                # Track token usage
-                self.total_tokens_used += message.usage.input_tokens + message.usage.output_tokens
-                
-                response_text = message.content[0].text
-                
-                # If expecting JSON, try to validate and extract it
-                if expect_json:
-                    # First, try to parse as-is
-                    try:
-                        json.loads(response_text)
-                        return response_text
-                    except json.JSONDecodeError:
-                        # Try to extract JSON from markdown code blocks
-                        extracted = None
-                        
-                        # Try ```json ... ```
-                        if "```json" in response_text:
-                            parts = response_text.split("```json")
-                            if len(parts) > 1:
-                                extracted = parts[1].split("```")[0].strip()
-                        # Try ``` ... ``` (generic code block)
-                        elif "```" in response_text:
-                            parts = response_text.split("```")
-                            if len(parts) >= 3:
-                                extracted = parts[1].strip()
-                        
-                        # If we extracted something, try to parse it
-                        if extracted:
-                            try:
-                                json.loads(extracted)
-                                return extracted
-                            except json.JSONDecodeError:
-                                pass
-                        
-                        # Last resort: look for JSON array or object patterns
-                        # Try to find first [ or { and last ] or }
-                        start_arr = response_text.find('[')
-                        start_obj = response_text.find('{')
-                        
-                        if start_arr != -1 or start_obj != -1:
-                            # Use whichever comes first
-                            if start_arr == -1:
-                                start = start_obj
-                                end_char = '}'
-                            elif start_obj == -1:
-                                start = start_arr
-                                end_char = ']'
-                            else:
-                                start = min(start_arr, start_obj)
-                                end_char = ']' if start == start_arr else '}'
-                            
-                            end = response_text.rfind(end_char)
-                            if end != -1:
-                                extracted = response_text[start:end+1]
-                                try:
-                                    json.loads(extracted)
-                                    return extracted
-                                except json.JSONDecodeError:
-                                    pass
-                        
-                        # If we still can't parse, log the actual response and raise
-                        logger.error(f"Could not extract valid JSON from response. First 500 chars: {response_text[:500]}")
-                        raise json.JSONDecodeError("Could not parse or extract JSON", response_text, 0)
-                
-                return response_text
+                return self._read_response(message, expect_json)
                 
             except Exception as e:
-                # Check if it's an overload error
-                is_overload = "overloaded_error" in str(e) or "529" in str(e)
-                is_rate_limit = "rate_limit_error" in str(e) or "429" in str(e)
+                time.sleep(self._retry_wait(e, attempt))
+        
+        raise ExtractionError(f"LLM call failed after {self.MAX_LLM_RETRIES} retries")
+    
+    async def _acall_llm(
+        self,
+        async_client: AsyncAnthropic,
+        prompt: str,
+        expect_json: bool = True
+    ) -> str:
+        """Async counterpart of _call_llm with the same retry policy.
+        
+        Args:
+            async_client: Async Anthropic API client
+            prompt: Prompt text
+            expect_json: Whether to expect JSON response
+            
+        Returns:
+            Response text
+            
+        Raises:
+            ExtractionError: If call fails after retries
+        """
+        for attempt in range(self.MAX_LLM_RETRIES):
+            try:
+                message = await async_client.messages.create(
+                    model=self.model,
+                    max_tokens=4096,
+                    temperature=config.LLM_TEMPERATURE,
+                    messages=[
+                        {"role": "user", "content": prompt}
+                    ]
+                )
+                return self._read_response(message, expect_json)
                 
-                if is_overload or is_rate_limit:
-                    # Exponential backoff for overload/rate limit errors
-                    wait_time = min(base_delay * (2 ** attempt), 60)  # Cap at 60s
-                    
-                    if attempt < max_retries - 1:
-                        logger.warning(f"{'Overload' if is_overload else 'Rate limit'} error. Waiting {wait_time:.1f}s before retry {attempt + 1}/{max_retries}")
-                        time.sleep(wait_time)
-                        continue
-                    else:
-                        logger.error(f"Failed after {max_retries} retries due to {'overload' if is_overload else 'rate limit'}")
-                        raise ExtractionError(f"LLM call failed after {max_retries} retries: {e}")
-                else:
-                    # For other errors, retry with shorter wait
-                    if attempt < 3:  # Only 3 retries for non-overload errors
-                        wait_time = base_delay * (attempt + 1)
-                        logger.warning(f"API error: {e}. Retrying in {wait_time}s...")
-                        time.sleep(wait_time)
-                        continue
-                    else:
-                        logger.error(f"LLM call failed: {e}")
-                        raise ExtractionError(f"LLM call failed: {e}")
-        
-        raise ExtractionError(f"LLM call failed after {max_retries} retries")
-
+            except Exception as e:
+                await asyncio.sleep(self._retry_wait(e, attempt))
+        
+        raise ExtractionError(f"LLM call failed after {self.MAX_LLM_RETRIES} retries")
+    
+    def _retry_wait(self, error: Exception, attempt: int) -> float:
+        """Decide how long to wait before retrying a failed LLM call.
+        
+        Args:
+            error: Exception raised by the call
+            attempt: Zero-based attempt number
+            
+        Returns:
+            Seconds to wait before the next attempt
+            
+        Raises:
+            ExtractionError: If no retries remain for this kind of error
+        """
+        # Check if it's an overload error
+        is_overload = "overloaded_error" in str(error) or "529" in str(error)
+        is_rate_limit = "rate_limit_error" in str(error) or "429" in str(error)
+        
+        if is_overload or is_rate_limit:
+            # Exponential backoff for overload/rate limit errors
+            wait_time = min(self.RETRY_BASE_DELAY * (2 ** attempt), 60)  # Cap at 60s
+            
+            if attempt < self.MAX_LLM_RETRIES - 1:
+                logger.warning(f"{'Overload' if is_overload else 'Rate limit'} error. Waiting {wait_time:.1f}s before retry {attempt + 1}/{self.MAX_LLM_RETRIES}")
+                return wait_time
+            
+            logger.error(f"Failed after {self.MAX_LLM_RETRIES} retries due to {'overload' if is_overload else 'rate limit'}")
+            raise ExtractionError(f"LLM call failed after {self.MAX_LLM_RETRIES} retries: {error}")
+        
+        # For other errors, retry with shorter wait
+        if attempt < 3:  # Only 3 retries for non-overload errors
+            wait_time = self.RETRY_BASE_DELAY * (attempt + 1)
+            logger.warning(f"API error: {error}. Retrying in {wait_time}s...")
+            return wait_time
+        
+        logger.error(f"LLM call failed: {error}")
+        raise ExtractionError(f"LLM call failed: {error}")
+    
+    def _read_response(self, message: Any, expect_json: bool) -> str:
+        """Record token usage and return the response text.
+        
+        Args:
+            message: Anthropic API message
+            expect_json: Whether to validate and extract JSON
+            
+        Returns:
+            Response text (the extracted JSON if expect_json)
+            
+        Raises:
+            json.JSONDecodeError: If JSON was expected but none could be extracted
+        """
+        # Track token usage
+        self.total_tokens_used += message.usage.input_tokens + message.usage.output_tokens
+        
+        response_text = message.content[0].text
+        
+        if not expect_json:
+            return response_text
+        
+        # First, try to parse as-is
+        try:
+            json.loads(response_text)
+            return response_text
+        except json.JSONDecodeError:
+            pass
+        
+        # Try to extract JSON from markdown code blocks
+        extracted = None
+        
+        # Try ```json ... ```
+        if "```json" in response_text:
+            parts = response_text.split("```json")
+            if len(parts) > 1:
+                extracted = parts[1].split("```")[0].strip()
+        # Try ``` ... ``` (generic code block)
+        elif "```" in response_text:
+            parts = response_text.split("```")
+            if len(parts) >= 3:
+                extracted = parts[1].strip()
+        
+        # If we extracted something, try to parse it
+        if extracted:
+            try:
+                json.loads(extracted)
+                return extracted
+            except json.JSONDecodeError:
+                pass
+        
+        # Last resort: look for JSON array or object patterns
+        # Try to find first [ or { and last ] or }
+        start_arr = response_text.find('[')
+        start_obj = response_text.find('{')
+        
+        if start_arr != -1 or start_obj != -1:
+            # Use whichever comes first
+            if start_arr == -1:
+                start = start_obj
+                end_char = '}'
+            elif start_obj == -1:
+                start = start_arr
+                end_char = ']'
+            else:
+                start = min(start_arr, start_obj)
+                end_char = ']' if start == start_arr else '}'
+            
+            end = response_text.rfind(end_char)
+            if end != -1:
+                extracted = response_text[start:end+1]
+                try:
+                    json.loads(extracted)
+                    return extracted
+                except json.JSONDecodeError:
+                    pass
+        
+        # If we still can't parse, log the actual response and raise
+        logger.error(f"Could not extract valid JSON from response. First 500 chars: {response_text[:500]}")
+        raise json.JSONDecodeError("Could not parse or extract JSON", response_text, 0)
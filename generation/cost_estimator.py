@@ -5,7 +5,7 @@ Pre-generation cost estimation for budget planning.
 Uses API adapter pricing to calculate estimates per scene and per novel.
 """
 
-from typing import List, Dict
+from typing import List, Dict, Tuple
 from extraction.models import VideoPrompt, CostBreakdown
 from generation.api_adapters import VideoAPIAdapter, get_adapter
 
@@ -13,6 +13,8 @@ from generation.api_adapters import VideoAPIAdapter, get_adapter
 class CostEstimator:
     """Estimate video generation costs before committing API credits."""
 
+    PROVIDERS = ["seedance", "kling", "runwayml"]
+
     def __init__(self, api_provider: str = "seedance"):
         self.adapter = get_adapter(api_provider)
         self.provider = api_provider
@@ -23,28 +25,50 @@ class CostEstimator:
 
     def estimate_novel_cost(self, prompts: List[VideoPrompt]) -> CostBreakdown:
         """Compute detailed cost breakdown for all prompts in a novel."""
-        # Group by scene
-        scene_prompts: Dict[str, List[VideoPrompt]] = {}
-        for prompt in prompts:
-            scene_prompts.setdefault(prompt.scene_id, []).append(prompt)
+        breakdown, _ = self._estimate(prompts, {})
+        return breakdown
 
-        breakdown_by_scene = {}
-        for scene_id, sp in scene_prompts.items():
-            breakdown_by_scene[scene_id] = round(
-                sum(self.adapter.estimate_cost(p) for p in sp), 4
-            )
+    def compare_providers(self, prompts: List[VideoPrompt]) -> Dict[str, float]:
+        """Compare estimated cost across all supported providers."""
+        return self.estimate_with_comparison(prompts)[1]
 
-        # Group by resolution
+    def estimate_with_comparison(
+        self, prompts: List[VideoPrompt]
+    ) -> Tuple[CostBreakdown, Dict[str, float]]:
+        """Compute the cost breakdown and provider comparison in one pass over the prompts.
+
+        Returns:
+            (breakdown for this estimator's provider, total cost per provider)
+        """
+        others = {p: get_adapter(p) for p in self.PROVIDERS if p != self.provider}
+        return self._estimate(prompts, others)
+
+    def _estimate(
+        self, prompts: List[VideoPrompt], other_adapters: Dict[str, VideoAPIAdapter]
+    ) -> Tuple[CostBreakdown, Dict[str, float]]:
+        """Walk the prompts once, costing each with this and any other adapters."""
+        scene_costs: Dict[str, float] = {}
         resolution_costs: Dict[str, float] = {}
+        other_totals = dict.fromkeys(other_adapters, 0.0)
+        own_total = 0.0
+        total_duration = 0
+
         for prompt in prompts:
-            res = prompt.generation_params.get("resolution", "1080p")
             cost = self.adapter.estimate_cost(prompt)
+            own_total += cost
+            scene_costs[prompt.scene_id] = scene_costs.get(prompt.scene_id, 0) + cost
+
+            res = prompt.generation_params.get("resolution", "1080p")
             resolution_costs[res] = resolution_costs.get(res, 0) + cost
 
-        total_duration = sum(p.duration_seconds for p in prompts)
+            total_duration += prompt.duration_seconds
+            for name, adapter in other_adapters.items():
+                other_totals[name] += adapter.estimate_cost(prompt)
+
+        breakdown_by_scene = {k: round(v, 4) for k, v in scene_costs.items()}
         total_cost = sum(breakdown_by_scene.values())
 
-        return CostBreakdown(
+        breakdown = CostBreakdown(
             total_clips=len(prompts),
             total_duration_minutes=round(total_duration / 60.0, 1),
             estimated_cost_usd=round(total_cost, 2),
@@ -52,12 +76,6 @@ class CostEstimator:
             breakdown_by_resolution={k: round(v, 2) for k, v in resolution_costs.items()},
         )
 
-    def compare_providers(self, prompts: List[VideoPrompt]) -> Dict[str, float]:
-        """Compare estimated cost across all supported providers."""
-        providers = ["seedance", "kling", "runwayml"]
-        comparison = {}
-        for provider in providers:
-            adapter = get_adapter(provider)
-            total = sum(adapter.estimate_cost(p) for p in prompts)
-            comparison[provider] = round(total, 2)
-        return comparison
+        totals = {**other_totals, self.provider: own_total}
+        comparison = {p: round(totals[p], 2) for p in self.PROVIDERS if p in totals}
+        return breakdown, comparison
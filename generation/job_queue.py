@@ -13,6 +13,7 @@ from datetime import datetime
 from pathlib import Path
 
 from extraction.models import VideoPrompt, GenerationJob, QueueStats
+from utils.json_io import dump_json
 from utils.logger import setup_logger
 
 logger = setup_logger(__name__)
@@ -102,12 +103,66 @@ class JobQueue:
             return self._row_to_job(row)
         return None
 
+    def get_jobs_for_execution(
+        self, novel_id: str, statuses: tuple = ("queued", "running")
+    ) -> List[Dict[str, Any]]:
+        """Get a novel's jobs with the prompt payload needed to submit them.
+
+        Args:
+            novel_id: Novel UUID
+            statuses: Job statuses to include
+
+        Returns:
+            Job dicts in scene/clip order, each with a 'prompt' dict
+        """
+        placeholders = ", ".join("?" for _ in statuses)
+        with self.db._get_connection() as conn:
+            rows = conn.execute(
+                f"""SELECT gj.id, gj.novel_id, gj.scene_id, gj.clip_index,
+                           gj.api_provider, vp.prompt_text, vp.negative_prompt,
+                           vp.duration_seconds, vp.aspect_ratio, vp.motion_intensity,
+                           vp.camera_movement, vp.audio_prompt, vp.generation_params,
+                           vp.estimated_cost_usd
+                    FROM generation_jobs gj
+                    JOIN video_prompts vp ON gj.prompt_id = vp.id
+                    WHERE gj.novel_id = ? AND gj.status IN ({placeholders})
+                    ORDER BY gj.scene_id, gj.clip_index""",
+                (novel_id, *statuses)
+            ).fetchall()
+
+        return [
+            {
+                "id": row["id"],
+                "novel_id": row["novel_id"],
+                "scene_id": row["scene_id"],
+                "clip_index": row["clip_index"],
+                "api_provider": row["api_provider"],
+                "estimated_cost_usd": row["estimated_cost_usd"],
+                "prompt": {
+                    "prompt_text": row["prompt_text"],
+                    "negative_prompt": row["negative_prompt"] or "",
+                    "duration_seconds": row["duration_seconds"],
+                    "aspect_ratio": row["aspect_ratio"],
+                    "motion_intensity": row["motion_intensity"],
+                    "camera_movement": row["camera_movement"],
+                    "audio_prompt": row["audio_prompt"] or "",
+                    "generation_params": self._safe_json_load(row["generation_params"]),
+                },
+            }
+            for row in rows
+        ]
+
     def mark_running(self, job_id: str) -> None:
         """Mark a job as currently running."""
+        self.mark_running_many([job_id])
+
+    def mark_running_many(self, job_ids: List[str]) -> None:
+        """Mark several jobs as running in one transaction."""
+        started_at = datetime.utcnow().isoformat()
         with self.db._get_connection() as conn:
-            conn.execute(
+            conn.executemany(
                 "UPDATE generation_jobs SET status = 'running', started_at = ? WHERE id = ?",
-                (datetime.utcnow().isoformat(), job_id)
+                [(started_at, job_id) for job_id in job_ids]
             )
             conn.commit()
 
@@ -137,6 +192,18 @@ class JobQueue:
             )
             conn.commit()
 
+    def mark_skipped(self, job_id: str, output_path: str) -> None:
+        """Mark a job as skipped because an identical prompt's clip was reused."""
+        with self.db._get_connection() as conn:
+            conn.execute(
+                """UPDATE generation_jobs
+                   SET status = 'skipped', output_video_path = ?,
+                       actual_cost_usd = 0, completed_at = ?
+                   WHERE id = ?""",
+                (output_path, datetime.utcnow().isoformat(), job_id)
+            )
+            conn.commit()
+
     def get_queue_stats(self, novel_id: str) -> QueueStats:
         """Get queue statistics for a novel."""
         with self.db._get_connection() as conn:
@@ -167,10 +234,49 @@ class JobQueue:
             running=counts.get("running", 0),
             complete=counts.get("complete", 0),
             failed=counts.get("failed", 0),
+            skipped=counts.get("skipped", 0),
             estimated_total_cost_usd=round(est_cost, 2),
             estimated_total_duration_minutes=round(est_duration_sec / 60.0, 1),
         )
 
+    def get_clip_paths(self, novel_id: str) -> Dict[str, List[str]]:
+        """Get the finished clip paths of every scene in a novel, in clip order.
+
+        Includes clips reused from the prompt cache, which may live in
+        another scene's directory.
+
+        Args:
+            novel_id: Novel UUID
+
+        Returns:
+            Dict mapping scene_id to its clip paths
+        """
+        with self.db._get_connection() as conn:
+            rows = conn.execute(
+                """SELECT scene_id, output_video_path FROM generation_jobs
+                   WHERE novel_id = ? AND status IN ('complete', 'skipped')
+                     AND output_video_path IS NOT NULL
+                   ORDER BY scene_id, clip_index""",
+                (novel_id,)
+            ).fetchall()
+
+        clips: Dict[str, List[str]] = {}
+        for row in rows:
+            clips.setdefault(row["scene_id"], []).append(row["output_video_path"])
+        return clips
+
+    def get_scene_clip_paths(self, scene_id: str) -> List[str]:
+        """Get a scene's finished clip paths in clip order."""
+        with self.db._get_connection() as conn:
+            rows = conn.execute(
+                """SELECT output_video_path FROM generation_jobs
+                   WHERE scene_id = ? AND status IN ('complete', 'skipped')
+                     AND output_video_path IS NOT NULL
+                   ORDER BY clip_index""",
+                (scene_id,)
+            ).fetchall()
+        return [row["output_video_path"] for row in rows]
+
     def export_queue(self, novel_id: str, output_path: str) -> None:
         """Export the job queue as JSON for Phase 4."""
         with self.db._get_connection() as conn:
@@ -210,8 +316,7 @@ class JobQueue:
             })
         
         Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-        with open(output_path, 'w') as f:
-            json.dump(jobs, f, indent=2)
+        dump_json(jobs, output_path)
         logger.info(f"Exported {len(jobs)} jobs to {output_path}")
 
     def _safe_json_load(self, data: Any) -> Any:
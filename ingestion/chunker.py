@@ -1,7 +1,7 @@
 """Narrative text chunking module."""
 import uuid
 import tiktoken
-from typing import List
+from typing import Iterator, List
 from utils.logger import setup_logger
 from ingestion.models import ExtractedDocument, NarrativeChunk
 import config
@@ -42,30 +42,57 @@ class NarrativeChunker:
         """
         logger.info(f"Chunking document: {doc.title}")
         
+        chapters = self.split_chapters(doc)
+        
         all_chunks = []
+        for chapter_chunks in self.iter_chapter_chunks(chapters, doc.title):
+            all_chunks.extend(chapter_chunks)
+        
+        logger.info(f"Created {len(all_chunks)} chunks from {len(chapters)} chapters")
+        
+        return all_chunks
+    
+    def split_chapters(self, doc: ExtractedDocument) -> List[str]:
+        """Split the document text into chapter texts.
         
+        Args:
+            doc: ExtractedDocument to split
+            
+        Returns:
+            List of chapter texts
+        """
         # Split text by chapter boundaries if available
         if doc.chapter_boundaries and len(doc.chapter_boundaries) > 1:
-            chapters = self._split_by_chapter(doc.raw_text, doc.chapter_boundaries)
-        else:
-            chapters = [doc.raw_text]
+            return self._split_by_chapter(doc.raw_text, doc.chapter_boundaries)
+        return [doc.raw_text]
+    
+    def iter_chapter_chunks(
+        self,
+        chapters: List[str],
+        novel_title: str
+    ) -> Iterator[List[NarrativeChunk]]:
+        """Lazily chunk chapters, yielding one batch of chunks per chapter.
+        
+        Lets callers start storing early chapters while later ones are
+        still being tokenized.
         
-        # Process each chapter
+        Args:
+            chapters: Chapter texts from split_chapters
+            novel_title: Novel title
+            
+        Yields:
+            List of chunks for each chapter, in order
+        """
         global_char_offset = 0
         
         for chapter_num, chapter_text in enumerate(chapters, start=1):
-            chapter_chunks = self._chunk_chapter(
+            yield self._chunk_chapter(
                 chapter_text,
                 chapter_num,
                 global_char_offset,
-                doc.title
+                novel_title
             )
-            all_chunks.extend(chapter_chunks)
             global_char_offset += len(chapter_text)
-        
-        logger.info(f"Created {len(all_chunks)} chunks from {len(chapters)} chapters")
-        
-        return all_chunks
     
     def _split_by_chapter(
         self,
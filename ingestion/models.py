@@ -1,5 +1,5 @@
 """Pydantic models for ingestion module."""
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 from typing import List, Dict, Any
 
 
@@ -23,11 +23,15 @@ class NarrativeChunk(BaseModel):
     start_char: int
     end_char: int
     
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for database insertion."""
+    def to_dict(self, novel_id: str = '') -> Dict[str, Any]:
+        """Convert to dictionary for database insertion.
+        
+        Args:
+            novel_id: Owning novel UUID, if already known
+        """
         return {
             'id': self.chunk_id,
-            'novel_id': '',  # Will be set by caller
+            'novel_id': novel_id,
             'chapter_number': self.chapter_number,
             'chunk_index': self.chunk_index,
             'text': self.text,
@@ -35,3 +39,7 @@ class NarrativeChunk(BaseModel):
             'start_char': self.start_char,
             'end_char': self.end_char
         }
+
+
+# Validates a novel's chunk rows in one pydantic-core pass
+NarrativeChunkList = TypeAdapter(List[NarrativeChunk])
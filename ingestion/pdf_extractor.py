@@ -2,7 +2,7 @@
 import fitz  # PyMuPDF
 import re
 from pathlib import Path
-from typing import List
+from typing import Callable, List, Optional, Union
 from utils.logger import setup_logger
 from ingestion.models import ExtractedDocument
 from ingestion.cleaner import clean_text, remove_headers_footers
@@ -18,11 +18,20 @@ class PDFExtractionError(Exception):
 class PDFExtractor:
     """Extracts text from PDF novels."""
     
-    def extract(self, pdf_path: str) -> ExtractedDocument:
+    def extract(
+        self,
+        pdf_path: str,
+        data: Optional[Union[bytes, memoryview]] = None,
+        progress_callback: Optional[Callable[[int, int], None]] = None
+    ) -> ExtractedDocument:
         """Extract clean text from a PDF novel.
         
         Args:
             pdf_path: Path to PDF file
+            data: Contents of the PDF (bytes or memoryview) if the caller has
+                already read or mapped it (e.g. to hash it); avoids reading
+                the file a second time
+            progress_callback: Optional callback receiving (pages_done, page_count)
             
         Returns:
             ExtractedDocument with cleaned text and metadata
@@ -32,31 +41,43 @@ class PDFExtractor:
         """
         pdf_path = Path(pdf_path)
         
-        if not pdf_path.exists():
+        if data is None and not pdf_path.exists():
             raise PDFExtractionError(f"PDF file not found: {pdf_path}")
         
         logger.info(f"Extracting text from {pdf_path.name}")
         
         try:
-            doc = fitz.open(pdf_path)
+            if data is not None:
+                doc = fitz.open(stream=data, filetype="pdf")
+            else:
+                doc = fitz.open(pdf_path)
         except Exception as e:
             raise PDFExtractionError(f"Failed to open PDF: {e}")
         
-        if doc.page_count == 0:
-            raise PDFExtractionError("PDF has no pages")
-        
-        # Extract text from each page
-        pages = []
-        for page_num in range(doc.page_count):
-            page = doc[page_num]
-            text = page.get_text()
-            pages.append(text)
-        
-        doc.close()
-        
-        # Check if PDF has extractable text
-        total_text = ''.join(pages)
-        if len(total_text.strip()) < 100:
+        try:
+            if doc.page_count == 0:
+                raise PDFExtractionError("PDF has no pages")
+            
+            # Extract text from each page
+            pages = []
+            for page_num in range(doc.page_count):
+                page = doc[page_num]
+                text = page.get_text()
+                pages.append(text)
+                if progress_callback:
+                    progress_callback(page_num + 1, doc.page_count)
+        finally:
+            # Release the document (and any caller-owned buffer it reads from)
+            doc.close()
+        
+        # Check if PDF has extractable text, stopping as soon as there is
+        # enough rather than joining a throwaway copy of the whole book
+        text_chars = 0
+        for text in pages:
+            text_chars += len(text.strip())
+            if text_chars >= 100:
+                break
+        if text_chars < 100:
             raise PDFExtractionError(
                 "PDF appears to contain no extractable text. "
                 "This may be a scanned image PDF. Please use an OCR'd version."
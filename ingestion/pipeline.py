@@ -0,0 +1,188 @@
+"""Pipelined chunk storage for ingestion.
+
+Chunking (tokenizer bound), SQLite inserts and embedding are independent
+enough per chapter that they can run as a three-stage pipeline instead of
+strictly one after the other.
+"""
+import queue
+import threading
+from typing import Any, Callable, Dict, List, Optional
+
+from utils.logger import setup_logger
+from ingestion.chunker import NarrativeChunker
+from ingestion.models import ExtractedDocument
+
+logger = setup_logger(__name__)
+
+# Sentinel marking the end of a stage's output
+_DONE = object()
+
+# Called as progress_callback(stage, chapters_completed)
+ProgressCallback = Callable[[str, int], None]
+
+
+class IngestionPipeline:
+    """Overlaps chunking, database inserts and embedding for one document.
+
+    Three worker threads are connected by bounded queues:
+
+    - chunk: tokenizes chapters and emits one chunk batch per chapter
+    - store: inserts each batch into the chunks table
+    - embed: embeds stored batches and adds them to the vector store,
+      merging whatever batches have queued up into a single call
+    """
+
+    STAGES = ("chunk", "store", "embed")
+
+    def __init__(
+        self,
+        db,
+        vector_store,
+        chunker: NarrativeChunker,
+        max_pending: int = 4
+    ):
+        """Initialize pipeline.
+
+        Args:
+            db: Database instance
+            vector_store: VectorStore instance
+            chunker: NarrativeChunker used to split the document
+            max_pending: Maximum batches buffered between two stages
+        """
+        self.db = db
+        self.vector_store = vector_store
+        self.chunker = chunker
+        self.max_pending = max_pending
+
+    def run(
+        self,
+        doc: ExtractedDocument,
+        novel_id: str,
+        chapters: Optional[List[str]] = None,
+        progress_callback: Optional[ProgressCallback] = None
+    ) -> int:
+        """Chunk a document and store the chunks in the database and vector store.
+
+        Args:
+            doc: Extracted document to chunk
+            novel_id: Novel UUID the chunks belong to
+            chapters: Chapter texts, if already split via chunker.split_chapters
+            progress_callback: Optional callback receiving (stage, chapters_completed)
+
+        Returns:
+            Number of chunks stored
+
+        Raises:
+            Exception: The first error raised by any stage
+        """
+        if chapters is None:
+            chapters = self.chunker.split_chapters(doc)
+
+        self._novel_id = novel_id
+        self._progress = progress_callback
+        self._errors: List[BaseException] = []
+        self._failed = threading.Event()
+        self._chunk_count = 0
+
+        to_store: queue.Queue = queue.Queue(maxsize=self.max_pending)
+        to_embed: queue.Queue = queue.Queue(maxsize=self.max_pending)
+
+        workers = [
+            threading.Thread(
+                target=self._chunk_stage, args=(chapters, doc.title, to_store),
+                name="ingest-chunk", daemon=True
+            ),
+            threading.Thread(
+                target=self._store_stage, args=(to_store, to_embed),
+                name="ingest-store", daemon=True
+            ),
+            threading.Thread(
+                target=self._embed_stage, args=(to_embed,),
+                name="ingest-embed", daemon=True
+            ),
+        ]
+
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+        if self._errors:
+            raise self._errors[0]
+
+        logger.info(f"Stored {self._chunk_count} chunks from {len(chapters)} chapters")
+        return self._chunk_count
+
+    def _chunk_stage(self, chapters: List[str], novel_title: str, outbox: queue.Queue) -> None:
+        """Produce one batch of chunk dicts per chapter."""
+        try:
+            for chapter_chunks in self.chunker.iter_chapter_chunks(chapters, novel_title):
+                if self._failed.is_set():
+                    break
+
+                outbox.put([chunk.to_dict(self._novel_id) for chunk in chapter_chunks])
+                self._report("chunk", 1)
+        except Exception as e:
+            self._fail("chunk", e)
+        finally:
+            outbox.put(_DONE)
+
+    def _store_stage(self, inbox: queue.Queue, outbox: queue.Queue) -> None:
+        """Insert chunk batches into the database and forward them for embedding."""
+        while True:
+            batch = inbox.get()
+            if batch is _DONE:
+                break
+            if self._failed.is_set():
+                continue  # Keep draining so the producer never blocks
+
+            try:
+                self.db.insert_chunks(batch)
+            except Exception as e:
+                self._fail("store", e)
+                continue
+
+            self._chunk_count += len(batch)
+            outbox.put(batch)
+            self._report("store", 1)
+
+        outbox.put(_DONE)
+
+    def _embed_stage(self, inbox: queue.Queue) -> None:
+        """Embed stored batches, merging any that queued up while embedding."""
+        done = False
+        while not done:
+            batches = [inbox.get()]
+
+            # Opportunistically merge batches that are already waiting
+            while batches[-1] is not _DONE:
+                try:
+                    batches.append(inbox.get_nowait())
+                except queue.Empty:
+                    break
+
+            if batches[-1] is _DONE:
+                batches.pop()
+                done = True
+            if not batches or self._failed.is_set():
+                continue
+
+            merged: List[Dict[str, Any]] = [c for batch in batches for c in batch]
+            try:
+                self.vector_store.add_chunks(merged, self._novel_id)
+            except Exception as e:
+                self._fail("embed", e)
+                continue
+
+            self._report("embed", len(batches))
+
+    def _report(self, stage: str, chapters_completed: int) -> None:
+        """Forward stage progress to the callback, if any."""
+        if self._progress:
+            self._progress(stage, chapters_completed)
+
+    def _fail(self, stage: str, error: BaseException) -> None:
+        """Record a stage failure and signal the other stages to wind down."""
+        logger.error(f"Ingestion {stage} stage failed: {error}")
+        self._errors.append(error)
+        self._failed.set()
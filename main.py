@@ -2,38 +2,290 @@
 import click
 import hashlib
 import json
+import mmap
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
-from anthropic import Anthropic
+from typing import Iterator, TYPE_CHECKING
 from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.table import Table
 
 from utils.logger import setup_logger
+from monitoring.progress_tracker import ProgressTracker
+from utils.json_io import iter_json_array, count_json_array, dump_json, write_bytes_atomic
+from utils import paths
 from storage.database import Database
-from storage.vector_store import VectorStore
-from ingestion.pdf_extractor import PDFExtractor, PDFExtractionError
-from ingestion.chunker import NarrativeChunker
-from extraction.story_bible_extractor import StoryBibleExtractor
 import config
 
+# Heavy dependencies (anthropic, chromadb/sentence-transformers, PyMuPDF,
+# tiktoken) are imported inside the commands and factories that use them,
+# so `--help` and the lightweight commands start quickly.
+if TYPE_CHECKING:
+    from anthropic import Anthropic
+    from storage.vector_store import VectorStore
+    from ingestion.chunker import NarrativeChunker
+    from extraction.models import Screenplay
+
 logger = setup_logger(__name__)
 console = Console()
+progress_tracker = ProgressTracker(console)
+
+
+@contextmanager
+def map_file(path: Path) -> Iterator[memoryview]:
+    """Map a file read-only into memory for hashing and parsing.
+    
+    The pages come straight from the OS page cache, so the file is never
+    copied into a Python bytes object. Anything holding the buffer (e.g. an
+    open PyMuPDF document) must be closed before the block exits.
+    
+    Args:
+        path: File to map
+        
+    Yields:
+        Read-only memoryview of the file contents
+    """
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield memoryview(b'')  # mmap cannot map an empty file
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            view = memoryview(mm)
+            try:
+                yield view
+            finally:
+                view.release()
 
 
-def compute_file_hash(file_path: Path) -> str:
-    """Compute SHA256 hash of a file.
+def compute_file_hash(data) -> str:
+    """Compute SHA256 hash of a file's contents.
+    
+    The whole buffer is hashed in a single C call, and the same buffer is
+    handed to PDFExtractor, so hashing does not cost a second read of the file.
     
     Args:
-        file_path: Path to file
+        data: File contents (bytes or a memoryview from map_file)
         
     Returns:
         Hex digest of hash
     """
-    sha256_hash = hashlib.sha256()
-    with open(file_path, "rb") as f:
-        for byte_block in iter(lambda: f.read(4096), b""):
-            sha256_hash.update(byte_block)
-    return sha256_hash.hexdigest()
+    return hashlib.sha256(data).hexdigest()
+
+
+def compute_quick_key(path: Path, data) -> dict:
+    """Compute a cheap duplicate key for a file: size, mtime and a prefix hash.
+    
+    Only the first config.DEDUP_PREFIX_BYTES are hashed, so an unchanged,
+    already-ingested PDF is recognised without reading the rest of it.
+    
+    Args:
+        path: File path
+        data: File contents (bytes or a memoryview from map_file)
+        
+    Returns:
+        Dict of file_size, file_mtime_ns and prefix_hash, matching the
+        Database.insert_novel / get_novel_by_quick_key keyword arguments
+    """
+    stat = path.stat()
+    return {
+        'file_size': stat.st_size,
+        'file_mtime_ns': stat.st_mtime_ns,
+        'prefix_hash': hashlib.blake2b(data[:config.DEDUP_PREFIX_BYTES]).hexdigest(),
+    }
+
+
+def task_callback(progress, task):
+    """Build a progress_callback that drives a Rich progress task.
+    
+    Args:
+        progress: Rich Progress instance
+        task: Task ID within progress
+        
+    Returns:
+        Callback receiving (completed, total)
+    """
+    return lambda completed, total: progress.update(task, completed=completed, total=total)
+
+
+def store_chunks(db: Database, vector_store: "VectorStore", chunker: "NarrativeChunker", doc, novel_id: str) -> int:
+    """Chunk a document and store it, overlapping chunking, DB inserts and embedding.
+    
+    Args:
+        db: Database instance
+        vector_store: VectorStore instance
+        chunker: NarrativeChunker instance
+        doc: ExtractedDocument to chunk
+        novel_id: Novel UUID
+        
+    Returns:
+        Number of chunks stored
+    """
+    from ingestion.pipeline import IngestionPipeline
+    
+    chapters = chunker.split_chapters(doc)
+    pipeline = IngestionPipeline(db, vector_store, chunker)
+    
+    with progress_tracker.create_progress() as progress:
+        tasks = {
+            "chunk": progress.add_task("Chunking narrative...", total=len(chapters)),
+            "store": progress.add_task("Storing chunks in database...", total=len(chapters)),
+            "embed": progress.add_task("Generating embeddings...", total=len(chapters)),
+        }
+        return pipeline.run(
+            doc,
+            novel_id,
+            chapters=chapters,
+            progress_callback=lambda stage, advance: progress.advance(tasks[stage], advance)
+        )
+
+
+@lru_cache(maxsize=1)
+def get_db() -> Database:
+    """Get the Database shared by every command in this process.
+    
+    Schema setup and migrations run once, however many commands are chained.
+    """
+    return Database()
+
+
+@lru_cache(maxsize=1)
+def get_vector_store() -> "VectorStore":
+    """Get the VectorStore shared by every command, loading the embedding model once."""
+    from storage.vector_store import VectorStore
+    return VectorStore()
+
+
+def prefetch_vector_store() -> "Future[VectorStore]":
+    """Start loading the shared VectorStore on a background thread.
+    
+    Loading the embedding model takes seconds, so ingestion overlaps it with
+    PDF extraction and only waits on the future once chunks are ready to embed.
+    
+    Returns:
+        Future resolving to get_vector_store()
+    """
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="vector-store")
+    future = executor.submit(get_vector_store)
+    executor.shutdown(wait=False)
+    return future
+
+
+@lru_cache(maxsize=1)
+def get_anthropic_client() -> "Anthropic":
+    """Get the Anthropic client shared by every command, reusing its connection pool."""
+    from anthropic import Anthropic
+    return Anthropic(api_key=config.ANTHROPIC_API_KEY)
+
+
+def find_prompt_file(novel_id: str):
+    """Locate the exported video prompts JSON for a novel.
+    
+    Args:
+        novel_id: Novel UUID
+        
+    Returns:
+        Path to the prompts file, or None if prompts have not been generated
+    """
+    novel = get_db().get_novel_by_id(novel_id)
+    if not novel:
+        return None
+    prompt_file = paths.prompts_path(novel['slug'])
+    if prompt_file.exists():
+        return prompt_file
+    # Files exported before slugs existed were named from the lowercased title
+    legacy_file = config.PROMPTS_DIR / f"{novel['title'].lower().replace(' ', '_')}_prompts.json"
+    if legacy_file.exists():
+        return legacy_file
+    return None
+
+
+def get_video_client():
+    """Get the video API client shared by every command in this CLI invocation.
+    
+    The client is created on first use and stored on the root Click context,
+    so commands chained with ctx.invoke (as phase4 does) reuse one client and
+    its connections. It is closed when the root context is torn down.
+    
+    Returns:
+        BaseVideoAPIClient instance
+    """
+    import asyncio
+    from execution.api_clients import SeedanceClient
+    
+    ctx = click.get_current_context().find_root()
+    ctx.ensure_object(dict)
+    if 'video_client' not in ctx.obj:
+        # In production, we would load API key from env/config
+        client = SeedanceClient(api_key="test_key", base_url="https://api.example.com")
+        ctx.obj['video_client'] = client
+        ctx.call_on_close(lambda: asyncio.run(client.aclose()))
+    return ctx.obj['video_client']
+
+
+@lru_cache(maxsize=4)
+def _load_prompts_cached(path: str, mtime_ns: int) -> list:
+    """Parse a prompts file; mtime_ns is part of the cache key so edits invalidate it."""
+    from extraction.models import VideoPromptList
+    # Parse and validate the raw bytes in one pass inside pydantic-core,
+    # without building an intermediate list of dicts
+    with open(path, 'rb') as f:
+        return VideoPromptList.validate_json(f.read())
+
+
+def save_prompts(prompts: list, prompt_file: Path) -> None:
+    """Atomically write VideoPrompts as indented JSON, serialized straight from the models.
+    
+    Args:
+        prompts: VideoPrompt objects
+        prompt_file: Destination path
+    """
+    from extraction.models import VideoPromptList
+    write_bytes_atomic(prompt_file, VideoPromptList.dump_json(prompts, indent=2))
+
+
+def save_breakdowns(breakdowns: list, breakdown_file: Path) -> None:
+    """Atomically write SceneBreakdowns as indented JSON, serialized straight from the models.
+    
+    Args:
+        breakdowns: SceneBreakdown objects
+        breakdown_file: Destination path
+    """
+    from extraction.models import SceneBreakdownList
+    write_bytes_atomic(breakdown_file, SceneBreakdownList.dump_json(breakdowns, indent=2))
+
+
+def load_prompts(prompt_file: Path) -> list:
+    """Load VideoPrompts from a prompts file, reusing the parse while the file is unchanged.
+    
+    Args:
+        prompt_file: Path to prompts JSON
+        
+    Returns:
+        List of VideoPrompt objects (shared between callers; do not mutate)
+    """
+    return _load_prompts_cached(str(prompt_file), prompt_file.stat().st_mtime_ns)
+
+
+@lru_cache(maxsize=4)
+def _load_screenplay_cached(path: str, mtime_ns: int) -> "Screenplay":
+    """Parse a screenplay JSON file; mtime_ns is part of the cache key so rewrites invalidate it."""
+    from extraction.models import Screenplay
+    with open(path, 'rb') as f:
+        return Screenplay.model_validate_json(f.read())
+
+
+def load_screenplay(screenplay_file: Path) -> "Screenplay":
+    """Load a Screenplay from its JSON export, reusing the parse while the file is unchanged.
+    
+    Args:
+        screenplay_file: Path to screenplay JSON
+        
+    Returns:
+        Screenplay object (shared between callers; do not mutate)
+    """
+    return _load_screenplay_cached(str(screenplay_file), screenplay_file.stat().st_mtime_ns)
 
 
 @click.group()
@@ -51,35 +303,42 @@ def ingest(pdf):
     pdf_path = Path(pdf)
     
     # Initialize components
-    db = Database()
-    vector_store = VectorStore()
+    from ingestion.pdf_extractor import PDFExtractor, PDFExtractionError
+    from ingestion.chunker import NarrativeChunker
+    
+    db = get_db()
     extractor = PDFExtractor()
     chunker = NarrativeChunker()
     
-    # Compute file hash
-    console.print("Computing file hash...")
-    file_hash = compute_file_hash(pdf_path)
-    
-    # Check if already processed
-    existing_novel = db.get_novel_by_hash(file_hash)
-    if existing_novel:
-        console.print(f"[yellow]Novel already ingested: {existing_novel['title']} (ID: {existing_novel['id']})[/yellow]")
-        return
-    
-    # Extract PDF
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console
-    ) as progress:
-        task = progress.add_task("Extracting PDF text...", total=None)
-        
-        try:
-            doc = extractor.extract(str(pdf_path))
-            progress.update(task, completed=True)
-        except PDFExtractionError as e:
-            console.print(f"[red]Error: {e}[/red]")
+    # Check for duplicates over a read-only mapping of the PDF, which the
+    # extractor then parses from memory
+    console.print("Checking for duplicates...")
+    with map_file(pdf_path) as pdf_data:
+        # Check if already processed: an unchanged file matches on the quick
+        # key, anything else needs the full hash
+        quick_key = compute_quick_key(pdf_path, pdf_data)
+        existing_novel = db.get_novel_by_quick_key(**quick_key)
+        if not existing_novel:
+            file_hash = compute_file_hash(pdf_data)
+            existing_novel = db.get_novel_by_hash(file_hash)
+        if existing_novel:
+            console.print(f"[yellow]Novel already ingested: {existing_novel['title']} (ID: {existing_novel['id']})[/yellow]")
             return
+        
+        # Load the embedding model while the PDF is extracted
+        vector_store_future = prefetch_vector_store()
+        
+        # Extract PDF
+        with progress_tracker.create_progress() as progress:
+            task = progress.add_task("Extracting PDF text...", total=None)
+            
+            try:
+                doc = extractor.extract(
+                    str(pdf_path), data=pdf_data, progress_callback=task_callback(progress, task)
+                )
+            except PDFExtractionError as e:
+                console.print(f"[red]Error: {e}[/red]")
+                return
     
     # Insert novel into database
     novel_id = db.insert_novel(
@@ -87,38 +346,18 @@ def ingest(pdf):
         file_path=str(pdf_path.absolute()),
         file_hash=file_hash,
         page_count=doc.page_count,
-        word_count=doc.metadata.get('word_count', 0)
+        word_count=doc.metadata.get('word_count', 0),
+        **quick_key
     )
     
-    # Chunk text
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console
-    ) as progress:
-        task = progress.add_task("Chunking narrative...", total=None)
-        chunks = chunker.chunk(doc)
-        progress.update(task, completed=True)
-    
-    # Store chunks in database
-    console.print("Storing chunks in database...")
-    chunk_dicts = []
-    for chunk in chunks:
-        chunk_dict = chunk.to_dict()
-        chunk_dict['novel_id'] = novel_id
-        chunk_dicts.append(chunk_dict)
-    
-    db.insert_chunks(chunk_dicts)
-    
-    # Store chunks in vector store
-    console.print("Generating embeddings and storing in vector database...")
-    vector_store.add_chunks(chunk_dicts, novel_id)
+    # Chunk, store and embed (stages overlap)
+    chunk_count = store_chunks(db, vector_store_future.result(), chunker, doc, novel_id)
     
     console.print(f"\n[green]✓ Ingestion complete![/green]")
     console.print(f"Novel ID: [cyan]{novel_id}[/cyan]")
     console.print(f"Title: [cyan]{doc.title}[/cyan]")
     console.print(f"Pages: {doc.page_count}")
-    console.print(f"Chunks: {len(chunks)}")
+    console.print(f"Chunks: {chunk_count}")
 
 
 @cli.command()
@@ -133,52 +372,41 @@ def extract_bible(novel_id):
         return
     
     # Initialize components
-    db = Database()
+    db = get_db()
     
     # Get chunks
     console.print(f"Loading chunks for novel [cyan]{novel_id}[/cyan]...")
-    chunk_dicts = db.get_chunks(novel_id)
+    chunk_dicts = db.get_chunk_fields(novel_id)
     
     if not chunk_dicts:
         console.print("[red]Error: No chunks found for this novel ID[/red]")
         return
     
     # Convert to NarrativeChunk objects
-    from ingestion.models import NarrativeChunk
-    chunks = [
-        NarrativeChunk(
-            chunk_id=c['id'],
-            novel_title=c.get('novel_title', ''),
-            chapter_number=c['chapter_number'],
-            chunk_index=c['chunk_index'],
-            text=c['text'],
-            token_count=c['token_count'],
-            start_char=c['start_char'],
-            end_char=c['end_char']
-        )
-        for c in chunk_dicts
-    ]
+    from ingestion.models import NarrativeChunkList
+    chunks = NarrativeChunkList.validate_python(chunk_dicts)
     
-    novel_title = chunks[0].novel_title if chunks else "Unknown"
+    novel = db.get_novel_by_id(novel_id)
+    novel_title = novel['title'] if novel else "Unknown"
+    slug = novel['slug'] if novel else paths.slugify_title(novel_title)
     
     console.print(f"Found {len(chunks)} chunks")
     console.print(f"Initializing LLM extractor with model: [cyan]{config.ANTHROPIC_MODEL}[/cyan]\n")
     
     # Initialize extractor
-    client = Anthropic(api_key=config.ANTHROPIC_API_KEY)
+    from extraction.story_bible_extractor import StoryBibleExtractor
+    
+    client = get_anthropic_client()
     extractor = StoryBibleExtractor(client, config.ANTHROPIC_MODEL)
     
     # Extract Story Bible
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console
-    ) as progress:
+    with progress_tracker.create_progress() as progress:
         task = progress.add_task("Extracting Story Bible (this may take several minutes)...", total=None)
         
         try:
-            story_bible = extractor.extract(chunks, novel_title, novel_id=novel_id)
-            progress.update(task, completed=True)
+            story_bible = extractor.extract(
+                chunks, novel_title, novel_id=novel_id, progress_callback=task_callback(progress, task)
+            )
         except Exception as e:
             console.print(f"[red]Error during extraction: {e}[/red]")
             logger.exception("Extraction failed")
@@ -190,9 +418,8 @@ def extract_bible(novel_id):
     db.insert_story_bible(novel_id, bible_dict, config.ANTHROPIC_MODEL)
     
     # Export to JSON file
-    output_path = config.STORY_BIBLES_DIR / f"{novel_title}.json"
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(bible_dict, f, indent=2, ensure_ascii=False)
+    output_path = paths.story_bible_path(slug)
+    write_bytes_atomic(output_path, story_bible.model_dump_json(indent=2).encode('utf-8'))
     
     console.print(f"\n[green]✓ Story Bible extraction complete![/green]")
     console.print(f"Characters: {len(story_bible.characters)}")
@@ -217,102 +444,84 @@ def run_all(pdf):
     # Step 1: Ingest
     console.print("[bold]Step 1: Ingesting PDF[/bold]\n")
     
-    db = Database()
-    vector_store = VectorStore()
+    from ingestion.pdf_extractor import PDFExtractor, PDFExtractionError
+    from ingestion.chunker import NarrativeChunker
+    
+    db = get_db()
     extractor = PDFExtractor()
     chunker = NarrativeChunker()
     
-    # Compute file hash
-    file_hash = compute_file_hash(pdf_path)
-    
-    # Check if already processed
-    existing_novel = db.get_novel_by_hash(file_hash)
-    if existing_novel:
-        console.print(f"[yellow]Novel already ingested, skipping ingestion[/yellow]")
-        novel_id = existing_novel['id']
-        novel_title = existing_novel['title']
-    else:
-        # Extract and chunk
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console
-        ) as progress:
-            task1 = progress.add_task("Extracting PDF...", total=None)
-            try:
-                doc = extractor.extract(str(pdf_path))
-                progress.update(task1, completed=True)
-            except PDFExtractionError as e:
-                console.print(f"[red]Error: {e}[/red]")
-                return
+    # Check for duplicates (and extract, if new) from a read-only mapping of the PDF
+    with map_file(pdf_path) as pdf_data:
+        # Check if already processed: an unchanged file matches on the quick
+        # key, anything else needs the full hash
+        quick_key = compute_quick_key(pdf_path, pdf_data)
+        existing_novel = db.get_novel_by_quick_key(**quick_key)
+        if not existing_novel:
+            file_hash = compute_file_hash(pdf_data)
+            existing_novel = db.get_novel_by_hash(file_hash)
+        if existing_novel:
+            console.print(f"[yellow]Novel already ingested, skipping ingestion[/yellow]")
+            novel_id = existing_novel['id']
+            novel_title = existing_novel['title']
+            slug = existing_novel['slug']
+        else:
+            # Load the embedding model while the PDF is extracted
+            vector_store_future = prefetch_vector_store()
             
-            task2 = progress.add_task("Chunking...", total=None)
-            chunks = chunker.chunk(doc)
-            progress.update(task2, completed=True)
-        
-        # Store in database
-        novel_id = db.insert_novel(
-            title=doc.title,
-            file_path=str(pdf_path.absolute()),
-            file_hash=file_hash,
-            page_count=doc.page_count,
-            word_count=doc.metadata.get('word_count', 0)
-        )
-        
-        chunk_dicts = []
-        for chunk in chunks:
-            chunk_dict = chunk.to_dict()
-            chunk_dict['novel_id'] = novel_id
-            chunk_dicts.append(chunk_dict)
-        
-        db.insert_chunks(chunk_dicts)
-        
-        console.print("Storing in vector database...")
-        vector_store.add_chunks(chunk_dicts, novel_id)
-        
-        novel_title = doc.title
-        console.print(f"[green]✓ Ingestion complete ({len(chunks)} chunks)[/green]\n")
+            # Extract
+            with progress_tracker.create_progress() as progress:
+                task1 = progress.add_task("Extracting PDF...", total=None)
+                try:
+                    doc = extractor.extract(
+                        str(pdf_path), data=pdf_data, progress_callback=task_callback(progress, task1)
+                    )
+                except PDFExtractionError as e:
+                    console.print(f"[red]Error: {e}[/red]")
+                    return
+            
+            # Store in database
+            novel_id = db.insert_novel(
+                title=doc.title,
+                file_path=str(pdf_path.absolute()),
+                file_hash=file_hash,
+                page_count=doc.page_count,
+                word_count=doc.metadata.get('word_count', 0),
+                **quick_key
+            )
+            
+            # Chunk, store and embed (stages overlap)
+            chunk_count = store_chunks(db, vector_store_future.result(), chunker, doc, novel_id)
+            
+            novel_title = doc.title
+            slug = paths.slugify_title(novel_title)
+            console.print(f"[green]✓ Ingestion complete ({chunk_count} chunks)[/green]\n")
     
     # Step 2: Extract Story Bible
     console.print("[bold]Step 2: Extracting Story Bible[/bold]\n")
     
     # Get chunks
-    chunk_dicts = db.get_chunks(novel_id)
-    from ingestion.models import NarrativeChunk
-    chunks = [
-        NarrativeChunk(
-            chunk_id=c['id'],
-            novel_title=novel_title,
-            chapter_number=c['chapter_number'],
-            chunk_index=c['chunk_index'],
-            text=c['text'],
-            token_count=c['token_count'],
-            start_char=c['start_char'],
-            end_char=c['end_char']
-        )
-        for c in chunk_dicts
-    ]
+    from ingestion.models import NarrativeChunkList
+    chunks = NarrativeChunkList.validate_python(db.get_chunk_fields(novel_id, novel_title))
     
     # Extract
-    client = Anthropic(api_key=config.ANTHROPIC_API_KEY)
+    from extraction.story_bible_extractor import StoryBibleExtractor
+    
+    client = get_anthropic_client()
     bible_extractor = StoryBibleExtractor(client, config.ANTHROPIC_MODEL)
     
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console
-    ) as progress:
+    with progress_tracker.create_progress() as progress:
         task = progress.add_task("Extracting Story Bible...", total=None)
-        story_bible = bible_extractor.extract(chunks, novel_title, novel_id=novel_id)
-        progress.update(task, completed=True)
+        story_bible = bible_extractor.extract(
+            chunks, novel_title, novel_id=novel_id, progress_callback=task_callback(progress, task)
+        )
     
     # Save
     bible_dict = story_bible.model_dump()
     db.insert_story_bible(novel_id, bible_dict, config.ANTHROPIC_MODEL)
     
-    output_path = config.STORY_BIBLES_DIR / f"{novel_title}.json"
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(bible_dict, f, indent=2, ensure_ascii=False)
+    output_path = paths.story_bible_path(slug)
+    write_bytes_atomic(output_path, story_bible.model_dump_json(indent=2).encode('utf-8'))
     
     # Summary
     console.print("\n[bold green]✓ Pipeline Complete![/bold green]\n")
@@ -331,7 +540,7 @@ def run_all(pdf):
 @cli.command()
 def status():
     """Show all processed novels."""
-    db = Database()
+    db = get_db()
     novels = db.get_all_novels()
     
     if not novels:
@@ -362,7 +571,7 @@ def status():
 @click.option('--output', required=True, type=click.Path(), help='Output JSON path')
 def export_bible(novel_id, output):
     """Export Story Bible to JSON file."""
-    db = Database()
+    db = get_db()
     
     story_bible = db.get_story_bible(novel_id)
     
@@ -371,8 +580,7 @@ def export_bible(novel_id, output):
         return
     
     output_path = Path(output)
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(story_bible, f, indent=2, ensure_ascii=False)
+    dump_json(story_bible, output_path)
     
     console.print(f"[green]✓ Story Bible exported to {output_path}[/green]")
 
@@ -395,18 +603,18 @@ def phase2(novel_id):
     from screenplay.scene_breakdown import SceneBreakdownExtractor
     from extraction.models import StoryBible
     
-    db = Database()
-    vector_store = VectorStore()
-    client = Anthropic(api_key=config.ANTHROPIC_API_KEY)
+    db = get_db()
+    vector_store = get_vector_store()
+    client = get_anthropic_client()
     
     # Get novel info
-    novels = db.get_all_novels()
-    novel = next((n for n in novels if n['id'] == novel_id), None)
+    novel = db.get_novel_by_id(novel_id)
     if not novel:
         console.print(f"[red]Error: Novel {novel_id} not found[/red]")
         return
     
     novel_title = novel['title']
+    slug = novel['slug']
     console.print(f"Processing: [cyan]{novel_title}[/cyan]\n")
     
     # Step 1: Convert to screenplay
@@ -414,16 +622,13 @@ def phase2(novel_id):
     
     converter = ScreenplayConverter(client, db, vector_store, config.ANTHROPIC_MODEL)
     
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console
-    ) as progress:
+    with progress_tracker.create_progress() as progress:
         task = progress.add_task("Converting novel to screenplay...", total=None)
         
         try:
-            screenplay = converter.convert(novel_id, use_checkpoints=True)
-            progress.update(task, completed=True)
+            screenplay = converter.convert(
+                novel_id, use_checkpoints=True, progress_callback=task_callback(progress, task)
+            )
         except Exception as e:
             console.print(f"[red]Error during conversion: {e}[/red]")
             logger.exception("Conversion failed")
@@ -434,18 +639,11 @@ def phase2(novel_id):
     # Step 2: Format and export screenplay
     console.print("[bold]Step 2: Formatting Screenplay[/bold]\n")
     
-    formatter = FountainFormatter()
-    screenplay.fountain_text = formatter.format(screenplay)
-    
     # Export files
-    screenplay_dir = config.OUTPUT_DIR / "screenplays"
-    screenplay_dir.mkdir(parents=True, exist_ok=True)
+    fountain_path = paths.fountain_path(slug)
+    json_path = paths.screenplay_json_path(slug)
     
-    fountain_path = screenplay_dir / f"{novel_title}.fountain"
-    json_path = screenplay_dir / f"{novel_title}_screenplay.json"
-    
-    formatter.export_fountain_file(screenplay, str(fountain_path))
-    formatter.export_json(screenplay, str(json_path))
+    FountainFormatter().export_files(screenplay, str(fountain_path), str(json_path))
     
     console.print(f"[green]✓ Exported screenplay[/green]")
     console.print(f"  Fountain: {fountain_path}")
@@ -455,33 +653,25 @@ def phase2(novel_id):
     console.print("[bold]Step 3: Generating Scene Breakdowns[/bold]\n")
     
     # Load Story Bible
-    story_bible_dict = db.get_story_bible(novel_id)
-    story_bible = StoryBible(**story_bible_dict)
+    story_bible = StoryBible.model_validate_json(db.get_story_bible_json(novel_id))
     
     breakdown_extractor = SceneBreakdownExtractor(client, db, config.ANTHROPIC_MODEL)
     
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console
-    ) as progress:
-        task = progress.add_task(f"Processing {len(screenplay.scenes)} scenes...", total=None)
+    with progress_tracker.create_progress() as progress:
+        task = progress.add_task(f"Processing {len(screenplay.scenes)} scenes...", total=len(screenplay.scenes))
         
         try:
-            breakdowns = breakdown_extractor.process_all_scenes(screenplay.scenes, story_bible)
-            progress.update(task, completed=True)
+            breakdowns = breakdown_extractor.process_all_scenes(
+                screenplay.scenes, story_bible, progress_callback=task_callback(progress, task)
+            )
         except Exception as e:
             console.print(f"[red]Error during breakdown: {e}[/red]")
             logger.exception("Breakdown failed")
             return
     
     # Export scene breakdowns
-    breakdown_dir = config.OUTPUT_DIR / "scene_breakdowns"
-    breakdown_dir.mkdir(parents=True, exist_ok=True)
-    
-    breakdown_path = breakdown_dir / f"{novel_title}_breakdown.json"
-    with open(breakdown_path, 'w', encoding='utf-8') as f:
-        json.dump([b.model_dump() for b in breakdowns], f, indent=2, ensure_ascii=False)
+    breakdown_path = paths.breakdown_path(slug)
+    save_breakdowns(breakdowns, breakdown_path)
     
     console.print(f"[green]✓ Exported scene breakdowns to {breakdown_path}[/green]\n")
     
@@ -512,34 +702,27 @@ def convert_script(novel_id):
     from screenplay.converter import ScreenplayConverter
     from screenplay.formatter import FountainFormatter
     
-    db = Database()
-    vector_store = VectorStore()
-    client = Anthropic(api_key=config.ANTHROPIC_API_KEY)
+    db = get_db()
+    novel = db.get_novel_by_id(novel_id)
+    if not novel:
+        console.print(f"[red]Error: Novel not found[/red]")
+        return
+    
+    vector_store = get_vector_store()
+    client = get_anthropic_client()
     
     converter = ScreenplayConverter(client, db, vector_store, config.ANTHROPIC_MODEL)
     
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console
-    ) as progress:
+    with progress_tracker.create_progress() as progress:
         task = progress.add_task("Converting...", total=None)
-        screenplay = converter.convert(novel_id)
-        progress.update(task, completed=True)
+        screenplay = converter.convert(novel_id, progress_callback=task_callback(progress, task))
     
-    # Format and export
-    formatter = FountainFormatter()
-    screenplay.fountain_text = formatter.format(screenplay)
+    # Format and export under the stored slug that later steps read from
+    slug = novel['slug']
+    fountain_path = paths.fountain_path(slug)
+    json_path = paths.screenplay_json_path(slug)
     
-    screenplay_dir = config.OUTPUT_DIR / "screenplays"
-    screenplay_dir.mkdir(parents=True, exist_ok=True)
-    
-    novel_title = screenplay.novel_title
-    fountain_path = screenplay_dir / f"{novel_title}.fountain"
-    json_path = screenplay_dir / f"{novel_title}_screenplay.json"
-    
-    formatter.export_fountain_file(screenplay, str(fountain_path))
-    formatter.export_json(screenplay, str(json_path))
+    FountainFormatter().export_files(screenplay, str(fountain_path), str(json_path))
     
     console.print(f"\n[green]✓ Screenplay created: {screenplay.scene_count} scenes[/green]")
     console.print(f"Exported to: {fountain_path}")
@@ -558,50 +741,39 @@ def breakdown_scenes(novel_id):
     from screenplay.scene_breakdown import SceneBreakdownExtractor
     from extraction.models import StoryBible
     
-    db = Database()
-    client = Anthropic(api_key=config.ANTHROPIC_API_KEY)
+    db = get_db()
+    client = get_anthropic_client()
     
     # Load screenplay from JSON
-    novels = db.get_all_novels()
-    novel = next((n for n in novels if n['id'] == novel_id), None)
+    novel = db.get_novel_by_id(novel_id)
     if not novel:
         console.print(f"[red]Error: Novel not found[/red]")
         return
     
-    novel_title = novel['title']
-    screenplay_path = config.OUTPUT_DIR / "screenplays" / f"{novel_title}_screenplay.json"
+    slug = novel['slug']
+    screenplay_path = paths.screenplay_json_path(slug)
     
     if not screenplay_path.exists():
         console.print(f"[red]Error: Screenplay not found. Run convert-script first.[/red]")
         return
     
-    with open(screenplay_path, 'r') as f:
-        from extraction.models import Screenplay
-        screenplay = Screenplay(**json.load(f))
+    screenplay = load_screenplay(screenplay_path)
     
     # Load Story Bible
-    story_bible_dict = db.get_story_bible(novel_id)
-    story_bible = StoryBible(**story_bible_dict)
+    story_bible = StoryBible.model_validate_json(db.get_story_bible_json(novel_id))
     
     # Generate breakdowns
     extractor = SceneBreakdownExtractor(client, db, config.ANTHROPIC_MODEL)
     
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console
-    ) as progress:
-        task = progress.add_task(f"Processing {len(screenplay.scenes)} scenes...", total=None)
-        breakdowns = extractor.process_all_scenes(screenplay.scenes, story_bible)
-        progress.update(task, completed=True)
+    with progress_tracker.create_progress() as progress:
+        task = progress.add_task(f"Processing {len(screenplay.scenes)} scenes...", total=len(screenplay.scenes))
+        breakdowns = extractor.process_all_scenes(
+            screenplay.scenes, story_bible, progress_callback=task_callback(progress, task)
+        )
     
     # Export
-    breakdown_dir = config.OUTPUT_DIR / "scene_breakdowns"
-    breakdown_dir.mkdir(parents=True, exist_ok=True)
-    
-    breakdown_path = breakdown_dir / f"{novel_title}_breakdown.json"
-    with open(breakdown_path, 'w', encoding='utf-8') as f:
-        json.dump([b.model_dump() for b in breakdowns], f, indent=2, ensure_ascii=False)
+    breakdown_path = paths.breakdown_path(slug)
+    save_breakdowns(breakdowns, breakdown_path)
     
     console.print(f"\n[green]✓ Generated {len(breakdowns)} scene breakdowns[/green]")
     console.print(f"Exported to: {breakdown_path}")
@@ -611,25 +783,23 @@ def breakdown_scenes(novel_id):
 @click.option('--novel-id', required=True, help='Novel UUID')
 def list_scenes(novel_id):
     """List all scenes in a screenplay."""
-    from extraction.models import Screenplay
-    
-    db = Database()
-    novels = db.get_all_novels()
-    novel = next((n for n in novels if n['id'] == novel_id), None)
+    db = get_db()
+    novel = db.get_novel_by_id(novel_id)
     
     if not novel:
         console.print("[red]Error: Novel not found[/red]")
         return
     
     novel_title = novel['title']
-    screenplay_path = config.OUTPUT_DIR / "screenplays" / f"{novel_title}_screenplay.json"
+    slug = novel['slug']
+    screenplay_path = paths.screenplay_json_path(slug)
     
     if not screenplay_path.exists():
         console.print("[red]Error: Screenplay not found. Run convert-script first.[/red]")
         return
     
-    with open(screenplay_path, 'r') as f:
-        screenplay = Screenplay(**json.load(f))
+    from extraction.models import ScreenplayListing
+    screenplay = ScreenplayListing.model_validate_json(screenplay_path.read_bytes())
     
     table = Table(title=f"Scenes - {novel_title}")
     table.add_column("#", style="cyan", justify="right")
@@ -663,7 +833,7 @@ def phase3(novel_id: str, api: str):
 
     console.print("[bold cyan]Phase 3: Video Prompt Engineering & Generation Orchestration[/bold cyan]\n")
 
-    db = Database()
+    db = get_db()
 
     # Load Phase 1 Story Bible
     story_bible_data = db.get_story_bible(novel_id)
@@ -671,43 +841,43 @@ def phase3(novel_id: str, api: str):
         console.print("[red]Error: Story Bible not found. Run Phase 1 first.[/red]")
         return
 
+    novel = db.get_novel_by_id(novel_id)
+    if not novel:
+        console.print(f"[red]Error: Novel {novel_id} not found.[/red]")
+        return
+
     # Load Phase 2 scene breakdowns
-    breakdown_path = None
-    output_dir = Path(config.OUTPUT_DIR) / "scene_breakdowns"
-    if output_dir.exists():
-        for f in output_dir.glob("*_breakdown.json"):
-            breakdown_path = f
-            break
-    
-    if not breakdown_path or not breakdown_path.exists():
+    slug = novel['slug']
+    breakdown_path = paths.breakdown_path(slug)
+    if not breakdown_path.exists():
         console.print("[red]Error: Scene breakdowns not found. Run Phase 2 first.[/red]")
         return
 
     console.print(f"Loading breakdown from: {breakdown_path}")
     try:
-        with open(breakdown_path, 'r') as f:
-            breakdowns = json.load(f)
-    except json.JSONDecodeError as e:
+        scene_count = count_json_array(breakdown_path)
+    except ValueError as e:
         console.print(f"[red]JSON Error in {breakdown_path}: {e}[/red]")
         with open(breakdown_path, 'r') as f:
             console.print(f"First 100 bytes: {f.read(100)}")
         return
 
-    console.print(f"[green]✓ Loaded {len(breakdowns)} scene breakdowns[/green]")
+    console.print(f"[green]✓ Found {scene_count} scene breakdowns[/green]")
 
     # --- Step 1: Generate prompts ---
     console.print("\n[bold green]Step 1: Generating video prompts...[/bold green]")
     engineer = VideoPromptEngineer(story_bible_data)
 
-    with Progress(SpinnerColumn(), TextColumn("{task.description}"), console=console) as progress:
-        task = progress.add_task(f"Processing {len(breakdowns)} scenes...", total=len(breakdowns))
+    # Breakdowns are streamed from disk one scene at a time
+    with progress_tracker.create_progress() as progress:
+        task = progress.add_task(f"Processing {scene_count} scenes...", total=scene_count)
         all_prompts = []
-        for breakdown in breakdowns:
+        for breakdown in iter_json_array(breakdown_path):
             scene_prompts = engineer.generate_prompts_for_scene(breakdown, novel_id)
             all_prompts.extend(scene_prompts)
             progress.advance(task)
 
-    console.print(f"[green]✓ Generated {len(all_prompts)} video prompts from {len(breakdowns)} scenes[/green]")
+    console.print(f"[green]✓ Generated {len(all_prompts)} video prompts from {scene_count} scenes[/green]")
 
     # --- Step 2: Validate prompts ---
     console.print("\n[bold green]Step 2: Validating prompts...[/bold green]")
@@ -741,14 +911,14 @@ def phase3(novel_id: str, api: str):
     # --- Step 3: Save prompts to database ---
     console.print("\n[bold green]Step 3: Saving prompts to database...[/bold green]")
     with db._get_connection() as conn:
-        for prompt in all_prompts:
-            conn.execute(
-                """INSERT OR REPLACE INTO video_prompts
-                   (id, scene_id, novel_id, clip_index, prompt_type, prompt_text,
-                    negative_prompt, duration_seconds, aspect_ratio, motion_intensity,
-                    camera_movement, reference_image_path, character_consistency_tags,
-                    audio_prompt, generation_params, estimated_cost_usd, created_at)
-                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+        conn.executemany(
+            """INSERT OR REPLACE INTO video_prompts
+               (id, scene_id, novel_id, clip_index, prompt_type, prompt_text,
+                negative_prompt, duration_seconds, aspect_ratio, motion_intensity,
+                camera_movement, reference_image_path, character_consistency_tags,
+                audio_prompt, generation_params, estimated_cost_usd, created_at)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+            (
                 (prompt.prompt_id, prompt.scene_id, prompt.novel_id, prompt.clip_index,
                  prompt.prompt_type, prompt.prompt_text, prompt.negative_prompt,
                  prompt.duration_seconds, prompt.aspect_ratio, prompt.motion_intensity,
@@ -756,7 +926,9 @@ def phase3(novel_id: str, api: str):
                  json.dumps(prompt.character_consistency_tags),
                  prompt.audio_prompt, json.dumps(prompt.generation_params),
                  prompt.estimated_cost_usd, prompt.created_at)
+                for prompt in all_prompts
             )
+        )
         conn.commit()
     console.print(f"[green]✓ Saved {len(all_prompts)} prompts to database[/green]")
 
@@ -769,14 +941,13 @@ def phase3(novel_id: str, api: str):
     # --- Step 5: Cost estimation ---
     console.print("\n[bold green]Step 5: Cost estimation...[/bold green]")
     estimator = CostEstimator(api_provider=api)
-    cost = estimator.estimate_novel_cost(all_prompts)
+    cost, comparison = estimator.estimate_with_comparison(all_prompts)
 
     console.print(f"  Total clips: [cyan]{cost.total_clips}[/cyan]")
     console.print(f"  Total video duration: [cyan]{cost.total_duration_minutes} minutes[/cyan]")
     console.print(f"  Estimated cost ({api}): [cyan]${cost.estimated_cost_usd:.2f} USD[/cyan]")
 
     # Compare providers
-    comparison = estimator.compare_providers(all_prompts)
     console.print("\n  Provider cost comparison:")
     for provider, prov_cost in comparison.items():
         marker = " ← selected" if provider == api else ""
@@ -786,18 +957,30 @@ def phase3(novel_id: str, api: str):
     console.print("\n[bold green]Step 6: Exporting outputs...[/bold green]")
 
     # Export prompts JSON
-    prompts_dir = Path(config.OUTPUT_DIR) / "prompts"
-    prompts_dir.mkdir(parents=True, exist_ok=True)
+    prompts_path = paths.prompts_path(slug)
     
-    # Determine title for filenames
-    title = story_bible_data.get("novel_title", "novel").lower().replace(" ", "_")
-    prompts_path = prompts_dir / f"{title}_prompts.json"
-    
-    prompts_data = [p.model_dump() for p in all_prompts]
-    with open(prompts_path, 'w') as f:
-        json.dump(prompts_data, f, indent=2)
+    save_prompts(all_prompts, prompts_path)
     console.print(f"[green]✓ Exported prompts to {prompts_path}[/green]")
 
+    # Export job queue JSON
+    queue_path = paths.queue_path(slug, api)
+    job_queue.export_queue(novel_id, str(queue_path))
+    console.print(f"[green]✓ Exported job queue to {queue_path}[/green]")
+
+    # Summary
+    console.print("\n" + "=" * 60)
+    console.print("[bold green]Phase 3 Complete![/bold green]")
+    console.print(f"  Scenes processed: {scene_count}")
+    console.print(f"  Prompts generated: {len(all_prompts)}")
+    console.print(f"  Jobs queued: {len(jobs)}")
+    console.print(f"  Estimated cost: ${cost.estimated_cost_usd:.2f} USD ({api})")
+    console.print(f"  Estimated duration: {cost.total_duration_minutes} min of video")
+    if validation["total_errors"] == 0:
+        console.print("  Validation: [green]✓ PASSED[/green]")
+    else:
+        console.print(f"  Validation: [yellow]⚠ {validation['total_errors']} errors[/yellow]")
+    console.print("=" * 60)
+
 
 # ==================== Phase 4 Commands ====================
 
@@ -805,24 +988,21 @@ def phase3(novel_id: str, api: str):
 @click.option('--novel-id', required=True, help='Novel UUID')
 @click.option('--max-concurrent', default=5, help='Max concurrent jobs')
 @click.option('--resume', is_flag=True, default=True, help='Resume from last state')
-def execute_queue(novel_id, max_concurrent, resume):
+@click.option('--batch-size', default=config.JOB_SUBMIT_BATCH_SIZE, help='Jobs per batch submission')
+@click.option('--no-cache', is_flag=True, help='Regenerate clips even for previously generated prompts')
+def execute_queue(novel_id, max_concurrent, resume, batch_size, no_cache):
     """Run video generation job queue (Phase 4)."""
     import asyncio
     from execution.job_executor import JobExecutor
-    from execution.api_clients import SeedanceClient, RateLimits
-    from monitoring.progress_tracker import ProgressTracker
     
     console.print("[bold cyan]Phase 4: Video Generation Execution[/bold cyan]\n")
     
-    db = Database()
+    db = get_db()
     
     # Initialize components
-    # In production, we would load API key from env/config
-    api_key = "test_key" 
     console.print("[yellow]Note: Using placeholder API key and client[/yellow]")
     
-    client = SeedanceClient(api_key=api_key, base_url="https://api.example.com")
-    executor = JobExecutor(db, client=client)
+    executor = JobExecutor(db, client=get_video_client())
     
     # Run execution
     console.print(f"Starting execution for novel [cyan]{novel_id}[/cyan]...")
@@ -831,11 +1011,16 @@ def execute_queue(novel_id, max_concurrent, resume):
     
     try:
         # Since we are in a synchronous CLI command, we need to run async code
-        report = asyncio.run(executor.execute_queue(
-            novel_id=novel_id,
-            max_concurrent_jobs=max_concurrent,
-            resume=resume
-        ))
+        with progress_tracker.create_progress() as progress:
+            task = progress.add_task("Generating clips...", total=None)
+            report = asyncio.run(executor.execute_queue(
+                novel_id=novel_id,
+                max_concurrent_jobs=max_concurrent,
+                resume=resume,
+                progress_callback=task_callback(progress, task),
+                batch_size=batch_size,
+                use_cache=not no_cache
+            ))
         
         console.print("\n[bold green]✓ Execution Complete![/bold green]\n")
         table = Table(show_header=False)
@@ -856,38 +1041,40 @@ def execute_queue(novel_id, max_concurrent, resume):
 def assemble_scene(scene_id, output):
     """Assemble clips for a single scene."""
     from assembly.clip_assembler import ClipAssembler
-    import glob
+    from generation.job_queue import JobQueue
     
     console.print("[bold cyan]Scene Assembly[/bold cyan]\n")
     
     assembler = ClipAssembler()
     
-    # Find clips for this scene
-    # This assumes a specific directory structure. In a real app we might query DB for paths.
-    # For now, let's assume we can find them in output/clips/<novel_id>/<scene_id>/*.mp4
-    # But we only have scene_id here. 
-    # Let's search recursively in output/clips for the scene_id folder
-    
-    base_dir = config.OUTPUT_DIR / "clips"
-    scene_dir = None
+    # Finished jobs record their clip paths, so no directory scan is needed
+    clip_paths = JobQueue(get_db()).get_scene_clip_paths(scene_id)
     
-    # Simple search
-    for d in base_dir.glob("*/*"):
-        if d.name == scene_id:
-            scene_dir = d
-            break
+    if clip_paths:
+        console.print(f"Found {len(clip_paths)} generated clips")
+    else:
+        # Clips not tracked by the queue (e.g. copied in by hand) are looked
+        # up under output/clips/<novel_id>/<scene_id>/*.mp4
+        base_dir = config.CLIPS_DIR
+        novel_id = get_db().get_novel_id_for_scene(scene_id)
+        
+        if novel_id:
+            scene_dir = base_dir / novel_id / scene_id
+        else:
+            scene_dir = next(base_dir.glob(f"*/{scene_id}"), None)
+                
+        if not scene_dir or not scene_dir.is_dir():
+            console.print(f"[red]Error: Could not find clip directory for scene {scene_id}[/red]")
+            return
             
-    if not scene_dir:
-        console.print(f"[red]Error: Could not find clip directory for scene {scene_id}[/red]")
-        return
+        clip_paths = paths.scene_clip_paths(scene_dir)
         
-    clip_paths = sorted([str(p) for p in scene_dir.glob("*.mp4")])
+        if not clip_paths:
+            console.print(f"[red]Error: No mp4 clips found in {scene_dir}[/red]")
+            return
+            
+        console.print(f"Found {len(clip_paths)} clips in {scene_dir}")
     
-    if not clip_paths:
-        console.print(f"[red]Error: No mp4 clips found in {scene_dir}[/red]")
-        return
-        
-    console.print(f"Found {len(clip_paths)} clips in {scene_dir}")
     console.print(f"Assembling to: {output}...")
     
     result = assembler.assemble_scene(scene_id, clip_paths, output)
@@ -908,34 +1095,49 @@ def phase4(novel_id):
     
     # 1. Execute Queue
     console.print("[bold]Step 1: Executing Job Queue[/bold]")
-    ctx.invoke(execute_queue, novel_id=novel_id, max_concurrent=5, resume=True)
+    ctx.invoke(execute_queue, novel_id=novel_id, max_concurrent=5, resume=True, batch_size=config.JOB_SUBMIT_BATCH_SIZE, no_cache=False)
     
-    # 2. Assemble Scenes (Placeholder loop)
-    # In a real implementation this would iterate over all scenes and assemble them
+    # 2. Assemble Scenes
     console.print("\n[bold]Step 2: Assembling Scenes[/bold]")
-    console.print("[yellow]Scene assembly in 'phase4' command is currently a placeholder. Use 'assemble-scene' for individual scenes.[/yellow]")
-
-
-    # Export job queue JSON
-    jobs_dir = Path(config.OUTPUT_DIR) / "jobs"
-    jobs_dir.mkdir(parents=True, exist_ok=True)
-    queue_path = jobs_dir / f"{title}_{api}_queue.json"
-    job_queue.export_queue(novel_id, str(queue_path))
-    console.print(f"[green]✓ Exported job queue to {queue_path}[/green]")
-
-    # Summary
-    console.print("\n" + "=" * 60)
-    console.print("[bold green]Phase 3 Complete![/bold green]")
-    console.print(f"  Scenes processed: {len(breakdowns)}")
-    console.print(f"  Prompts generated: {len(all_prompts)}")
-    console.print(f"  Jobs queued: {len(jobs)}")
-    console.print(f"  Estimated cost: ${cost.estimated_cost_usd:.2f} USD ({api})")
-    console.print(f"  Estimated duration: {cost.total_duration_minutes} min of video")
-    if validation["total_errors"] == 0:
-        console.print("  Validation: [green]✓ PASSED[/green]")
-    else:
-        console.print(f"  Validation: [yellow]⚠ {validation['total_errors']} errors[/yellow]")
-    console.print("=" * 60)
+    from assembly.clip_assembler import ClipAssembler
+    from generation.job_queue import JobQueue
+    
+    novel = get_db().get_novel_by_id(novel_id)
+    slug = novel['slug'] if novel else novel_id
+    
+    # Finished jobs record their clip paths (including clips reused from the
+    # prompt cache); fall back to output/clips/<novel_id>/<scene_id>/ for
+    # clips the queue doesn't know about
+    scene_clips = JobQueue(get_db()).get_clip_paths(novel_id)
+    if not scene_clips:
+        novel_clips_dir = config.CLIPS_DIR / novel_id
+        if novel_clips_dir.is_dir():
+            for scene_dir in sorted(d for d in novel_clips_dir.iterdir() if d.is_dir()):
+                scene_clips[scene_dir.name] = paths.scene_clip_paths(scene_dir)
+    
+    scenes = [
+        (scene_id, clip_paths, str(paths.scene_video_path(slug, scene_id)))
+        for scene_id, clip_paths in scene_clips.items()
+        if clip_paths
+    ]
+    
+    if not scenes:
+        console.print("[yellow]No generated clips found to assemble.[/yellow]")
+        return
+    
+    with progress_tracker.create_progress() as progress:
+        task = progress.add_task(f"Assembling {len(scenes)} scenes...", total=len(scenes))
+        results = ClipAssembler().assemble_scenes(
+            scenes,
+            max_workers=config.MAX_CONCURRENT_ASSEMBLIES,
+            progress_callback=task_callback(progress, task)
+        )
+    
+    assembled = sum(1 for r in results if r.success)
+    console.print(f"[green]✓ Assembled {assembled}/{len(scenes)} scenes → {config.SCENES_DIR}[/green]")
+    for (scene_id, _, _), result in zip(scenes, results):
+        if not result.success:
+            console.print(f"  [red]{scene_id}: {result.error}[/red]")
 
 
 @cli.command('generate-prompts')
@@ -945,37 +1147,30 @@ def generate_prompts(novel_id: str):
     from prompts.video_prompt_engineer import VideoPromptEngineer
 
     console.print("[bold cyan]Generating video prompts...[/bold cyan]\n")
-    db = Database()
+    db = get_db()
     story_bible_data = db.get_story_bible(novel_id)
     if not story_bible_data:
         console.print("[red]Error: Story Bible not found.[/red]")
         return
 
-    # Find breakdowns
-    output_dir = Path(config.OUTPUT_DIR) / "scene_breakdowns"
-    breakdown_path = None
-    if output_dir.exists():
-        for f in output_dir.glob("*_breakdown.json"):
-            breakdown_path = f
-            break
-    if not breakdown_path:
-        console.print("[red]Error: Scene breakdowns not found.[/red]")
+    novel = db.get_novel_by_id(novel_id)
+    if not novel:
+        console.print(f"[red]Error: Novel {novel_id} not found.[/red]")
         return
 
-    with open(breakdown_path, 'r') as f:
-        breakdowns = json.load(f)
+    breakdown_path = paths.breakdown_path(novel['slug'])
+    if not breakdown_path.exists():
+        console.print("[red]Error: Scene breakdowns not found.[/red]")
+        return
 
+    # Breakdowns are streamed from disk one scene at a time
     engineer = VideoPromptEngineer(story_bible_data)
-    all_prompts = engineer.generate_prompts_for_all_scenes(breakdowns, novel_id)
+    all_prompts = engineer.generate_prompts_for_all_scenes(iter_json_array(breakdown_path), novel_id)
 
     # Save prompts JSON
-    title = story_bible_data.get("novel_title", "novel").lower().replace(" ", "_")
-    prompts_dir = Path(config.OUTPUT_DIR) / "prompts"
-    prompts_dir.mkdir(parents=True, exist_ok=True)
-    prompts_path = prompts_dir / f"{title}_prompts.json"
+    prompts_path = paths.prompts_path(novel['slug'])
 
-    with open(prompts_path, 'w') as f:
-        json.dump([p.model_dump() for p in all_prompts], f, indent=2)
+    save_prompts(all_prompts, prompts_path)
 
     console.print(f"[green]✓ Generated {len(all_prompts)} prompts → {prompts_path}[/green]")
 
@@ -985,24 +1180,16 @@ def generate_prompts(novel_id: str):
 def validate_prompts(novel_id: str):
     """Validate generated video prompts."""
     from prompts.validators import PromptValidator
-    from extraction.models import VideoPrompt as VP
 
     console.print("[bold cyan]Validating video prompts...[/bold cyan]\n")
 
     # Load prompts from JSON
-    prompts_dir = Path(config.OUTPUT_DIR) / "prompts"
-    prompt_file = None
-    if prompts_dir.exists():
-        for f in prompts_dir.glob("*_prompts.json"):
-            prompt_file = f
-            break
+    prompt_file = find_prompt_file(novel_id)
     if not prompt_file:
         console.print("[red]Error: No prompts found. Run generate-prompts first.[/red]")
         return
 
-    with open(prompt_file, 'r') as f:
-        prompts_data = json.load(f)
-    prompts = [VP(**p) for p in prompts_data]
+    prompts = load_prompts(prompt_file)
 
     validation = PromptValidator.validate_all(prompts)
 
@@ -1030,32 +1217,25 @@ def validate_prompts(novel_id: str):
 def estimate_cost(novel_id: str, api: str):
     """Estimate video generation cost."""
     from generation.cost_estimator import CostEstimator
-    from extraction.models import VideoPrompt as VP
 
     console.print("[bold cyan]Estimating generation cost...[/bold cyan]\n")
 
-    prompts_dir = Path(config.OUTPUT_DIR) / "prompts"
-    prompt_file = None
-    if prompts_dir.exists():
-        for f in prompts_dir.glob("*_prompts.json"):
-            prompt_file = f
-            break
+    prompt_file = find_prompt_file(novel_id)
     if not prompt_file:
         console.print("[red]Error: No prompts found.[/red]")
         return
 
-    with open(prompt_file, 'r') as f:
-        prompts = [VP(**p) for p in json.load(f)]
+    prompts = load_prompts(prompt_file)
 
     estimator = CostEstimator(api_provider=api)
-    cost = estimator.estimate_novel_cost(prompts)
+    cost, comparison = estimator.estimate_with_comparison(prompts)
 
     console.print(f"Clips: {cost.total_clips}")
     console.print(f"Video duration: {cost.total_duration_minutes} minutes")
     console.print(f"Estimated cost ({api}): [bold]${cost.estimated_cost_usd:.2f} USD[/bold]")
 
     console.print("\nProvider comparison:")
-    for provider, prov_cost in estimator.compare_providers(prompts).items():
+    for provider, prov_cost in comparison.items():
         console.print(f"  {provider}: ${prov_cost:.2f}")
 
 
@@ -1064,12 +1244,7 @@ def estimate_cost(novel_id: str, api: str):
 @click.option('--output', default=None, help='Output path')
 def export_prompts(novel_id: str, output: str):
     """Export generated prompts to JSON."""
-    prompts_dir = Path(config.OUTPUT_DIR) / "prompts"
-    prompt_file = None
-    if prompts_dir.exists():
-        for f in prompts_dir.glob("*_prompts.json"):
-            prompt_file = f
-            break
+    prompt_file = find_prompt_file(novel_id)
     if not prompt_file:
         console.print("[red]Error: No prompts found.[/red]")
         return
@@ -1080,9 +1255,7 @@ def export_prompts(novel_id: str, output: str):
         console.print(f"[green]✓ Exported prompts to {output}[/green]")
     else:
         console.print(f"[green]Prompts at: {prompt_file}[/green]")
-        with open(prompt_file, 'r') as f:
-            data = json.load(f)
-        console.print(f"Total prompts: {len(data)}")
+        console.print(f"Total prompts: {count_json_array(prompt_file)}")
 
 
 if __name__ == '__main__':
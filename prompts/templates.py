@@ -13,6 +13,36 @@ Template philosophy:
 
 from typing import List, Optional
 
+# Eras that need no period cues in the prompt
+_MODERN = frozenset({"modern", "contemporary", "present"})
+
+# Negative prompts are built from fixed exclusion lists, so join them once
+_BASE_NEGATIVE_PROMPT = ", ".join([
+    "blurry", "low resolution", "pixelated",
+    "text overlays", "logos", "watermarks",
+    "face distortion", "hand deformities", "morphing artifacts",
+    "duplicate characters in frame",
+    "unrealistic physics",
+    "anime style", "cartoon style",
+])
+_PERIOD_NEGATIVE_PROMPT = _BASE_NEGATIVE_PROMPT + ", " + ", ".join([
+    "modern vehicles", "smartphones", "electric lights (unless period-appropriate)",
+    "contemporary clothing",
+])
+
+_CINEMATIC_SUFFIX = (
+    "Cinematic quality, photorealistic, "
+    "shot on 35mm film, shallow depth of field, "
+    "anamorphic lens, natural film grain."
+)
+
+# Fixed closing text of each shot type, prejoined with the cinematic suffix
+_TAIL_TWO_SHOT = "Camera: static or gentle drift. " + _CINEMATIC_SUFFIX
+_TAIL_OVER_SHOULDER = "Shallow depth of field, speaker sharp, listener softly blurred. " + _CINEMATIC_SUFFIX
+_TAIL_REACTION = "Extreme shallow depth of field, only the eyes in sharp focus. " + _CINEMATIC_SUFFIX
+_TAIL_TRANSITION = "Smooth, atmospheric. " + _CINEMATIC_SUFFIX
+_TAIL_INSERT = "Macro lens feel, razor-thin depth of field. " + _CINEMATIC_SUFFIX
+
 
 class PromptTemplates:
     """Library of shot-type templates for video generation prompts."""
@@ -20,11 +50,7 @@ class PromptTemplates:
     # ------------------------------------------------------------------
     # Style suffixes (appended to all prompts for consistent look)
     # ------------------------------------------------------------------
-    CINEMATIC_SUFFIX = (
-        "Cinematic quality, photorealistic, "
-        "shot on 35mm film, shallow depth of field, "
-        "anamorphic lens, natural film grain."
-    )
+    CINEMATIC_SUFFIX = _CINEMATIC_SUFFIX
 
     # ------------------------------------------------------------------
     # Shot-type templates
@@ -41,18 +67,13 @@ class PromptTemplates:
         camera_movement: str = "slow pan",
     ) -> str:
         """Wide shot establishing a location — typically the first clip in a new scene."""
-        parts = [
-            f"Wide establishing shot of {location}.",
-            f"{time_of_day}, {weather}.",
-            f"Atmosphere: {atmosphere}.",
-        ]
-        if era and era.lower() not in ("modern", "contemporary", "present"):
-            parts.append(f"Era: {era}.")
-        if colour_palette:
-            parts.append(f"Colour palette: {colour_palette}.")
-        parts.append(f"Camera: {camera_movement}.")
-        parts.append(PromptTemplates.CINEMATIC_SUFFIX)
-        return " ".join(parts)
+        era_part = f"Era: {era}. " if era and era.lower() not in _MODERN else ""
+        palette_part = f"Colour palette: {colour_palette}. " if colour_palette else ""
+        return (
+            f"Wide establishing shot of {location}. {time_of_day}, {weather}. "
+            f"Atmosphere: {atmosphere}. {era_part}{palette_part}"
+            f"Camera: {camera_movement}. {_CINEMATIC_SUFFIX}"
+        )
 
     @staticmethod
     def character_introduction(
@@ -65,16 +86,12 @@ class PromptTemplates:
         camera_movement: str = "slow push-in",
     ) -> str:
         """First appearance of a character in a scene."""
-        parts = [
-            f"Medium shot of {character_name} ({physical_description}).",
-            f"{character_name} {action}.",
-            f"Setting: {location_context}.",
-            f"Lighting: {lighting}.",
-            f"Mood: {mood}.",
-            f"Camera: {camera_movement}.",
-            PromptTemplates.CINEMATIC_SUFFIX,
-        ]
-        return " ".join(parts)
+        return (
+            f"Medium shot of {character_name} ({physical_description}). "
+            f"{character_name} {action}. Setting: {location_context}. "
+            f"Lighting: {lighting}. Mood: {mood}. Camera: {camera_movement}. "
+            f"{_CINEMATIC_SUFFIX}"
+        )
 
     @staticmethod
     def dialogue_two_shot(
@@ -88,19 +105,12 @@ class PromptTemplates:
         action_hint: str = "",
     ) -> str:
         """Two characters in frame during a dialogue exchange."""
-        parts = [
-            f"Medium two-shot of {char1_name} ({char1_desc}) and {char2_name} ({char2_desc}).",
-            f"They face each other, {emotional_dynamic}.",
-        ]
-        if action_hint:
-            parts.append(f"{action_hint}.")
-        parts.extend([
-            f"Setting: {setting_detail}.",
-            f"Lighting: {lighting}.",
-            "Camera: static or gentle drift.",
-            PromptTemplates.CINEMATIC_SUFFIX,
-        ])
-        return " ".join(parts)
+        action_part = f"{action_hint}. " if action_hint else ""
+        return (
+            f"Medium two-shot of {char1_name} ({char1_desc}) and {char2_name} ({char2_desc}). "
+            f"They face each other, {emotional_dynamic}. {action_part}"
+            f"Setting: {setting_detail}. Lighting: {lighting}. {_TAIL_TWO_SHOT}"
+        )
 
     @staticmethod
     def dialogue_over_shoulder(
@@ -113,16 +123,12 @@ class PromptTemplates:
         camera_movement: str = "static",
     ) -> str:
         """Over-the-shoulder shot during dialogue. Focus on the speaker's face."""
-        parts = [
-            f"Over-the-shoulder shot from behind {listening_char} ({listening_char_desc}),",
-            f"looking at {speaking_char} ({speaking_char_desc}) speaking.",
-            f"Emotional beat: {emotional_beat}.",
-            f"Background: {background}.",
-            f"Camera: {camera_movement}.",
-            "Shallow depth of field, speaker sharp, listener softly blurred.",
-            PromptTemplates.CINEMATIC_SUFFIX,
-        ]
-        return " ".join(parts)
+        return (
+            f"Over-the-shoulder shot from behind {listening_char} ({listening_char_desc}), "
+            f"looking at {speaking_char} ({speaking_char_desc}) speaking. "
+            f"Emotional beat: {emotional_beat}. Background: {background}. "
+            f"Camera: {camera_movement}. {_TAIL_OVER_SHOULDER}"
+        )
 
     @staticmethod
     def action_sequence(
@@ -135,18 +141,14 @@ class PromptTemplates:
         sound_design_hint: str = "",
     ) -> str:
         """Dynamic action — movement, chase, fight, physical activity."""
-        parts = [
-            f"{action_description}.",
-            f"Characters: {characters_in_shot}.",
-            f"Environment: {environment}.",
-            f"Camera: {camera_movement}, {motion_intensity} motion intensity.",
-        ]
-        if lighting:
-            parts.append(f"Lighting: {lighting}.")
-        if sound_design_hint:
-            parts.append(f"Sound design: {sound_design_hint}.")
-        parts.append(PromptTemplates.CINEMATIC_SUFFIX)
-        return " ".join(parts)
+        lighting_part = f"Lighting: {lighting}. " if lighting else ""
+        sound_part = f"Sound design: {sound_design_hint}. " if sound_design_hint else ""
+        return (
+            f"{action_description}. Characters: {characters_in_shot}. "
+            f"Environment: {environment}. "
+            f"Camera: {camera_movement}, {motion_intensity} motion intensity. "
+            f"{lighting_part}{sound_part}{_CINEMATIC_SUFFIX}"
+        )
 
     @staticmethod
     def reaction_close_up(
@@ -158,15 +160,11 @@ class PromptTemplates:
         camera_movement: str = "very slow push-in",
     ) -> str:
         """Close-up on character's face capturing emotional response."""
-        parts = [
-            f"Tight close-up on {character_name}'s face ({character_desc}).",
-            f"Expression: {emotion} — {micro_expression}.",
-            f"Lighting: {lighting}.",
-            f"Camera: {camera_movement}.",
-            "Extreme shallow depth of field, only the eyes in sharp focus.",
-            PromptTemplates.CINEMATIC_SUFFIX,
-        ]
-        return " ".join(parts)
+        return (
+            f"Tight close-up on {character_name}'s face ({character_desc}). "
+            f"Expression: {emotion} — {micro_expression}. Lighting: {lighting}. "
+            f"Camera: {camera_movement}. {_TAIL_REACTION}"
+        )
 
     @staticmethod
     def transition_shot(
@@ -177,15 +175,11 @@ class PromptTemplates:
         visual_bridge: str = "",
     ) -> str:
         """Visual bridge between scenes or locations."""
-        parts = [f"Transition shot: {transition_type}."]
-        if time_passage != "none":
-            parts.append(f"Time passage: {time_passage}.")
-        if visual_bridge:
-            parts.append(f"{visual_bridge}.")
-        else:
-            parts.append(f"From {from_element} to {to_element}.")
-        parts.append("Smooth, atmospheric. " + PromptTemplates.CINEMATIC_SUFFIX)
-        return " ".join(parts)
+        time_part = f"Time passage: {time_passage}. " if time_passage != "none" else ""
+        bridge = visual_bridge or f"From {from_element} to {to_element}"
+        return (
+            f"Transition shot: {transition_type}. {time_part}{bridge}. {_TAIL_TRANSITION}"
+        )
 
     @staticmethod
     def montage_clip(
@@ -196,17 +190,12 @@ class PromptTemplates:
         music_sync_hint: str = "",
     ) -> str:
         """Single clip in a montage sequence."""
-        parts = [
-            f"{activity}.",
-            f"Characters: {characters}.",
-            f"Setting: {setting}.",
-        ]
-        if progression_note:
-            parts.append(f"Progression: {progression_note}.")
-        if music_sync_hint:
-            parts.append(f"Music sync: {music_sync_hint}.")
-        parts.append(PromptTemplates.CINEMATIC_SUFFIX)
-        return " ".join(parts)
+        progression_part = f"Progression: {progression_note}. " if progression_note else ""
+        music_part = f"Music sync: {music_sync_hint}. " if music_sync_hint else ""
+        return (
+            f"{activity}. Characters: {characters}. Setting: {setting}. "
+            f"{progression_part}{music_part}{_CINEMATIC_SUFFIX}"
+        )
 
     @staticmethod
     def insert_shot(
@@ -217,18 +206,11 @@ class PromptTemplates:
         camera_movement: str = "static",
     ) -> str:
         """Detail shot of an object or prop with narrative importance."""
-        parts = [
-            f"{framing} of {object_focus}.",
-            f"Narrative significance: {significance}.",
-        ]
-        if lighting:
-            parts.append(f"Lighting: {lighting}.")
-        parts.extend([
-            f"Camera: {camera_movement}.",
-            "Macro lens feel, razor-thin depth of field.",
-            PromptTemplates.CINEMATIC_SUFFIX,
-        ])
-        return " ".join(parts)
+        lighting_part = f"Lighting: {lighting}. " if lighting else ""
+        return (
+            f"{framing} of {object_focus}. Narrative significance: {significance}. "
+            f"{lighting_part}Camera: {camera_movement}. {_TAIL_INSERT}"
+        )
 
     # ------------------------------------------------------------------
     # Negative prompt builder
@@ -240,20 +222,10 @@ class PromptTemplates:
         extra_exclusions: Optional[List[str]] = None,
     ) -> str:
         """Build a negative prompt to exclude common video-gen artifacts."""
-        exclusions = [
-            "blurry", "low resolution", "pixelated",
-            "text overlays", "logos", "watermarks",
-            "face distortion", "hand deformities", "morphing artifacts",
-            "duplicate characters in frame",
-            "unrealistic physics",
-            "anime style", "cartoon style",
-        ]
+        negative_prompt = _BASE_NEGATIVE_PROMPT
         # Era-specific exclusions
-        if era and era.lower() not in ("modern", "contemporary", "present", ""):
-            exclusions.extend([
-                "modern vehicles", "smartphones", "electric lights (unless period-appropriate)",
-                "contemporary clothing",
-            ])
+        if era and era.lower() not in _MODERN:
+            negative_prompt = _PERIOD_NEGATIVE_PROMPT
         if extra_exclusions:
-            exclusions.extend(extra_exclusions)
-        return ", ".join(exclusions)
+            negative_prompt = f"{negative_prompt}, {', '.join(extra_exclusions)}"
+        return negative_prompt
@@ -5,9 +5,19 @@ Validates prompt length, character consistency, temporal coherence,
 and required fields before prompts enter the job queue.
 """
 
-from typing import List, Dict, Set
+from collections import defaultdict
+from itertools import pairwise
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 from extraction.models import VideoPrompt, ValidationResult, ConsistencyReport, TemporalReport
 
+try:
+    import ahocorasick
+except ImportError:  # pragma: no cover - falls back to one substring test per name
+    ahocorasick = None
+
+# A prompt's lowercased text and (lowercased, original) consistency tags
+LoweredPrompt = Tuple[str, List[Tuple[str, str]]]
+
 
 class PromptValidator:
     """Quality checks on generated video prompts."""
@@ -18,9 +28,32 @@ class PromptValidator:
 
     REQUIRED_FIELDS = ["prompt_text", "duration_seconds", "scene_id", "prompt_type"]
 
+    VALID_ASPECT_RATIOS = frozenset({"16:9", "9:16", "1:1"})
+    VALID_MOTION_INTENSITIES = frozenset({"low", "medium", "high"})
+
+    # Time-of-day markers in story order; the first one found in a clip wins
+    TIME_INDICATORS = {
+        "dawn": 0, "morning": 1, "day": 2, "afternoon": 3,
+        "dusk": 4, "evening": 5, "night": 6,
+    }
+
     @staticmethod
     def validate_prompt(prompt: VideoPrompt) -> ValidationResult:
         """Run all validation checks on a single prompt."""
+        errors, warnings = PromptValidator._check_prompt(prompt)
+        return ValidationResult(
+            is_valid=len(errors) == 0,
+            errors=errors,
+            warnings=warnings,
+        )
+
+    @staticmethod
+    def _check_prompt(prompt: VideoPrompt) -> Tuple[List[str], List[str]]:
+        """Collect a prompt's validation errors and warnings.
+
+        Returns:
+            (errors, warnings); both empty for a clean prompt
+        """
         errors = []
         warnings = []
 
@@ -31,63 +64,126 @@ class PromptValidator:
                 errors.append(f"Missing required field: {field}")
 
         # Prompt length
-        if len(prompt.prompt_text) > PromptValidator.MAX_PROMPT_LENGTH:
+        text_length = len(prompt.prompt_text)
+        if text_length > PromptValidator.MAX_PROMPT_LENGTH:
             warnings.append(
-                f"Prompt length ({len(prompt.prompt_text)} chars) exceeds "
+                f"Prompt length ({text_length} chars) exceeds "
                 f"recommended max ({PromptValidator.MAX_PROMPT_LENGTH}). "
                 f"May be truncated by API."
             )
-        if len(prompt.prompt_text) < PromptValidator.MIN_PROMPT_LENGTH:
+        elif text_length < PromptValidator.MIN_PROMPT_LENGTH:
             errors.append(
-                f"Prompt too short ({len(prompt.prompt_text)} chars). "
+                f"Prompt too short ({text_length} chars). "
                 f"Minimum {PromptValidator.MIN_PROMPT_LENGTH} chars for quality."
             )
 
         # Duration bounds
-        if prompt.duration_seconds < 2:
-            errors.append(f"Duration too short: {prompt.duration_seconds}s (min 2s)")
-        if prompt.duration_seconds > 20:
-            warnings.append(f"Duration {prompt.duration_seconds}s exceeds typical API max (15s)")
+        duration = prompt.duration_seconds
+        if duration < 2:
+            errors.append(f"Duration too short: {duration}s (min 2s)")
+        elif duration > 20:
+            warnings.append(f"Duration {duration}s exceeds typical API max (15s)")
 
         # Aspect ratio
-        valid_ratios = {"16:9", "9:16", "1:1"}
-        if prompt.aspect_ratio not in valid_ratios:
+        if prompt.aspect_ratio not in PromptValidator.VALID_ASPECT_RATIOS:
             warnings.append(f"Non-standard aspect ratio: {prompt.aspect_ratio}")
 
         # Motion intensity
-        valid_motion = {"low", "medium", "high"}
-        if prompt.motion_intensity not in valid_motion:
+        if prompt.motion_intensity not in PromptValidator.VALID_MOTION_INTENSITIES:
             warnings.append(f"Unknown motion intensity: {prompt.motion_intensity}")
 
-        return ValidationResult(
-            is_valid=len(errors) == 0,
-            errors=errors,
-            warnings=warnings,
-        )
+        return errors, warnings
+
+    @staticmethod
+    def lowercase_prompts(prompts: List[VideoPrompt]) -> List[LoweredPrompt]:
+        """Lowercase each prompt's text and consistency tags once.
+
+        Returns:
+            (prompt_text_lower, [(tag_lower, tag), ...]) per prompt, in order
+        """
+        return [
+            (
+                prompt.prompt_text.lower(),
+                [(tag.lower(), tag) for tag in prompt.character_consistency_tags],
+            )
+            for prompt in prompts
+        ]
 
     @staticmethod
     def check_character_consistency(
         prompts: List[VideoPrompt],
         character_name: str,
+        prompts_lc: Optional[List[LoweredPrompt]] = None,
     ) -> ConsistencyReport:
         """
         Check that the same character is described consistently across all prompts.
 
         Looks for the character's consistency tags and verifies they match
         across all clips featuring that character.
+
+        Args:
+            prompts: Prompts to check
+            character_name: Character to look for
+            prompts_lc: Output of lowercase_prompts(prompts), so callers
+                checking many characters lowercase each prompt only once
         """
-        appearances = []
-        descriptions_seen: Set[str] = set()
+        if prompts_lc is None:
+            prompts_lc = PromptValidator.lowercase_prompts(prompts)
+        index = PromptValidator.index_characters(prompts, [character_name], prompts_lc)
+        return PromptValidator._consistency_report(character_name, *index[character_name.lower()])
 
-        for prompt in prompts:
-            # Check if character appears in this prompt
-            if character_name.lower() in prompt.prompt_text.lower():
+    @staticmethod
+    def index_characters(
+        prompts: List[VideoPrompt],
+        character_names: Iterable[str],
+        prompts_lc: List[LoweredPrompt],
+    ) -> Dict[str, Tuple[List[str], Set[str]]]:
+        """Collect every character's appearances and tags in one pass over the prompts.
+
+        A character appears in a prompt whose text contains its name; the
+        prompt's consistency tags that mention the name are its descriptions.
+        Names are matched case-insensitively, so names differing only in
+        case share one entry. With pyahocorasick installed, each prompt's
+        text is scanned once for all names instead of once per name.
+
+        Args:
+            prompts: Prompts to scan
+            character_names: Characters to look for
+            prompts_lc: Output of lowercase_prompts(prompts)
+
+        Returns:
+            Dict mapping lowercased name to (appearing prompt_ids, descriptions)
+        """
+        index: Dict[str, Tuple[List[str], Set[str]]] = {
+            name.lower(): ([], set()) for name in character_names
+        }
+        # An empty name (from a tag like ": desc") matches nothing; the
+        # automaton cannot hold one, so the substring loop skips it too
+        names_lc = [name_lc for name_lc in index if name_lc]
+        automaton = None
+        if ahocorasick is not None and names_lc:
+            # One automaton scan per prompt finds every name, overlapping ones included
+            automaton = ahocorasick.Automaton()
+            for name_lc in names_lc:
+                automaton.add_word(name_lc, name_lc)
+            automaton.make_automaton()
+
+        for prompt, (text_lc, tags_lc) in zip(prompts, prompts_lc):
+            if automaton is not None:
+                found = {name_lc for _, name_lc in automaton.iter(text_lc)}
+            else:
+                found = [name_lc for name_lc in names_lc if name_lc in text_lc]
+            for name_lc in found:
+                appearances, descriptions = index[name_lc]
                 appearances.append(prompt.prompt_id)
-                # Extract consistency tags for this character
-                for tag in prompt.character_consistency_tags:
-                    if character_name.lower() in tag.lower():
-                        descriptions_seen.add(tag)
+                descriptions.update(tag for tag_lc, tag in tags_lc if name_lc in tag_lc)
+        return index
 
+    @staticmethod
+    def _consistency_report(
+        character_name: str, appearances: List[str], descriptions_seen: Set[str]
+    ) -> ConsistencyReport:
+        """Build a character's ConsistencyReport from its indexed appearances."""
         discrepancies = []
         if len(descriptions_seen) > 1:
             discrepancies.append(
@@ -105,46 +201,50 @@ class PromptValidator:
     @staticmethod
     def check_temporal_coherence(
         prompts: List[VideoPrompt],
+        prompts_lc: Optional[List[LoweredPrompt]] = None,
     ) -> TemporalReport:
         """
         Check that time of day flows logically across sequential clips within a scene.
 
         Validates that clips within the same scene don't have contradictory
         temporal markers.
+
+        Args:
+            prompts: Prompts to check
+            prompts_lc: Output of lowercase_prompts(prompts), if already built
         """
-        issues = []
+        if prompts_lc is None:
+            prompts_lc = PromptValidator.lowercase_prompts(prompts)
 
-        # Group prompts by scene
-        scene_prompts: Dict[str, List[VideoPrompt]] = {}
-        for prompt in prompts:
-            scene_prompts.setdefault(prompt.scene_id, []).append(prompt)
+        # Group (clip_index, lowered text) by scene
+        scene_clips: Dict[str, List[Tuple[int, str]]] = defaultdict(list)
+        for prompt, (text_lc, _) in zip(prompts, prompts_lc):
+            scene_clips[prompt.scene_id].append((prompt.clip_index, text_lc))
 
-        time_indicators = {
-            "dawn": 0, "morning": 1, "day": 2, "afternoon": 3,
-            "dusk": 4, "evening": 5, "night": 6,
-        }
+        return PromptValidator._temporal_report(scene_clips)
+
+    @staticmethod
+    def _temporal_report(scene_clips: Dict[str, List[Tuple[int, str]]]) -> TemporalReport:
+        """Build the TemporalReport from each scene's (clip_index, lowered text) pairs."""
+        issues = []
 
-        for scene_id, scene_clips in scene_prompts.items():
-            sorted_clips = sorted(scene_clips, key=lambda p: p.clip_index)
+        for scene_id, clips in scene_clips.items():
+            clips.sort(key=lambda clip: clip[0])
             times_found = []
-            for clip in sorted_clips:
-                text_lower = clip.prompt_text.lower()
-                for time_word, order in time_indicators.items():
+            for clip_index, text_lower in clips:
+                for time_word, order in PromptValidator.TIME_INDICATORS.items():
                     if time_word in text_lower:
-                        times_found.append((clip.clip_index, time_word, order))
+                        times_found.append((clip_index, time_word, order))
                         break
 
             # Check for temporal regression within a scene
-            if len(times_found) >= 2:
-                for i in range(1, len(times_found)):
-                    prev_clip, prev_time, prev_order = times_found[i - 1]
-                    curr_clip, curr_time, curr_order = times_found[i]
-                    if curr_order < prev_order:
-                        issues.append(
-                            f"Scene {scene_id}: time goes backwards from "
-                            f"'{prev_time}' (clip {prev_clip}) to "
-                            f"'{curr_time}' (clip {curr_clip})"
-                        )
+            for (prev_clip, prev_time, prev_order), (curr_clip, curr_time, curr_order) in pairwise(times_found):
+                if curr_order < prev_order:
+                    issues.append(
+                        f"Scene {scene_id}: time goes backwards from "
+                        f"'{prev_time}' (clip {prev_clip}) to "
+                        f"'{curr_time}' (clip {curr_clip})"
+                    )
 
         return TemporalReport(
             is_coherent=len(issues) == 0,
@@ -153,31 +253,41 @@ class PromptValidator:
 
     @staticmethod
     def validate_all(prompts: List[VideoPrompt]) -> Dict:
-        """Run all validations on a full set of prompts."""
-        # Individual prompt validation
-        results = []
+        """Run all validations on a full set of prompts.
+
+        Field checks, lowercasing, character discovery and scene grouping
+        share one pass over the prompts; the character index needs the
+        full cast, so it runs as a second pass over the lowered text.
+        """
         total_errors = 0
         total_warnings = 0
-        for prompt in prompts:
-            result = PromptValidator.validate_prompt(prompt)
-            results.append(result)
-            total_errors += len(result.errors)
-            total_warnings += len(result.warnings)
-
-        # Character consistency
         all_chars: Set[str] = set()
+        prompts_lc: List[LoweredPrompt] = []
+        scene_clips: Dict[str, List[Tuple[int, str]]] = defaultdict(list)
         for prompt in prompts:
+            # Individual prompt validation; only the counts are reported, so
+            # skip building a ValidationResult per prompt
+            errors, warnings = PromptValidator._check_prompt(prompt)
+            total_errors += len(errors)
+            total_warnings += len(warnings)
+
+            text_lc = prompt.prompt_text.lower()
+            tags_lc = []
             for tag in prompt.character_consistency_tags:
-                char_name = tag.split(":")[0].strip()
-                all_chars.add(char_name)
+                all_chars.add(tag.split(":", 1)[0].strip())
+                tags_lc.append((tag.lower(), tag))
+            prompts_lc.append((text_lc, tags_lc))
+            scene_clips[prompt.scene_id].append((prompt.clip_index, text_lc))
 
-        consistency_reports = []
-        for char in all_chars:
-            report = PromptValidator.check_character_consistency(prompts, char)
-            consistency_reports.append(report)
+        # Character consistency
+        index = PromptValidator.index_characters(prompts, all_chars, prompts_lc)
+        consistency_reports = [
+            PromptValidator._consistency_report(char, *index[char.lower()])
+            for char in all_chars
+        ]
 
         # Temporal coherence
-        temporal_report = PromptValidator.check_temporal_coherence(prompts)
+        temporal_report = PromptValidator._temporal_report(scene_clips)
 
         return {
             "total_prompts": len(prompts),
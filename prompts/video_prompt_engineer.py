@@ -8,7 +8,7 @@ self-contained prompts for video generation APIs.
 import uuid
 import json
 import logging
-from typing import List, Dict, Optional, Any
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 from pathlib import Path
 from datetime import datetime
 
@@ -64,6 +64,24 @@ class VideoPromptEngineer:
         "montage": "tracking",
     }
 
+    # Seedance 2.0 approximate pricing (USD per minute) by resolution
+    COST_PER_MINUTE = {
+        "720p": 0.10,
+        "1080p": 0.30,
+        "2k": 0.80,
+    }
+
+    # Micro-expressions by emotional-beat keywords, checked in priority order
+    MICRO_EXPRESSIONS = (
+        (("fear", "terror", "horror", "dread"), "widened eyes, tightened jaw, slight tremor"),
+        (("anger", "rage", "fury"), "clenched jaw, narrowed eyes, flared nostrils"),
+        (("sad", "grief", "loss", "sorrow"), "glistening eyes, quivering lower lip, downcast gaze"),
+        (("joy", "happy", "relief", "hope"), "slight smile, brightened eyes, relaxed brow"),
+        (("shock", "surprise", "discover"), "raised eyebrows, parted lips, widened eyes"),
+        (("tension", "suspense", "wary"), "tight lips, alert eyes, subtle frown"),
+        (("determination", "resolve"), "set jaw, focused gaze, squared shoulders"),
+    )
+
     def __init__(self, story_bible: Dict[str, Any]):
         """
         Args:
@@ -71,6 +89,18 @@ class VideoPromptEngineer:
         """
         self.story_bible = story_bible
         self.templates = PromptTemplates()
+        # Prompt text builder per shot type; unknown types get a generic prompt
+        self._prompt_builders: Dict[str, Callable[[ShotSpec, Dict[str, Any]], str]] = {
+            "establishing": self._build_establishing_prompt,
+            "character_intro": self._build_character_intro_prompt,
+            "dialogue_two_shot": self._build_dialogue_two_shot_prompt,
+            "dialogue_over_shoulder": self._build_dialogue_over_shoulder_prompt,
+            "action": self._build_action_prompt,
+            "reaction": self._build_reaction_prompt,
+            "transition": self._build_transition_prompt,
+            "insert": self._build_insert_prompt,
+            "montage": self._build_montage_prompt,
+        }
         self._character_cache: Dict[str, Dict] = {}
         self._build_character_cache()
 
@@ -103,12 +133,13 @@ class VideoPromptEngineer:
         # Step 1: Determine shot sequence
         shot_specs = self._determine_shot_sequence(scene_breakdown)
         
-        # Step 2: Build prompts from shot specs
+        # Step 2: Build prompts from shot specs, sharing the scene-level values
+        scene_context = self._build_scene_context(scene_breakdown)
         prompts = []
         for shot in shot_specs:
             prompt = self._build_prompt_from_shot_spec(
                 shot_spec=shot,
-                scene_breakdown=scene_breakdown,
+                scene_context=scene_context,
                 novel_id=novel_id,
                 scene_id=scene_id,
             )
@@ -116,6 +147,43 @@ class VideoPromptEngineer:
         
         return prompts
 
+    def _build_scene_context(self, scene_breakdown: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Derive the values every shot of a scene shares.
+
+        Args:
+            scene_breakdown: Scene breakdown dict from Phase 2
+
+        Returns:
+            Dict of template inputs, per-character descriptions and consistency
+            tags, and the scene's negative and audio prompts
+        """
+        characters_with_descs = scene_breakdown.get("characters_with_descriptions", {})
+        composition = scene_breakdown.get("composition", {})
+        slug_line = scene_breakdown.get("slug_line", "")
+        era = self.story_bible.get("timeline", {}).get("era", "")
+        resolved = {
+            name: self._resolve_character(name, characters_with_descs)
+            for name in characters_with_descs
+        }
+        return {
+            # Each character's description resolves once, not once per shot
+            "char_descs": {name: desc for name, (desc, _) in resolved.items()},
+            "consistency_tags": {name: tags for name, (_, tags) in resolved.items()},
+            "composition": composition,
+            "location_desc": scene_breakdown.get("location_visual_description", ""),
+            "slug_line": slug_line,
+            # Determine time of day and weather from slug line
+            "time_of_day": self._extract_time_of_day(slug_line),
+            "weather": self._extract_weather(scene_breakdown),
+            "atmosphere": scene_breakdown.get("emotional_beat", ""),
+            "era": era,
+            "colour_palette": composition.get("colour_palette", ""),
+            "lighting": composition.get("lighting", ""),
+            "negative_prompt": self.templates.build_negative_prompt(era=era),
+            "audio_prompt": self._build_audio_prompt(scene_breakdown),
+        }
+
     def _determine_shot_sequence(
         self, scene_breakdown: Dict[str, Any]
     ) -> List[ShotSpec]:
@@ -134,6 +202,8 @@ class VideoPromptEngineer:
         
         characters_with_descs = scene_breakdown.get("characters_with_descriptions", {})
         character_names = list(characters_with_descs.keys())
+        # Shots feature at most the first two characters
+        main_chars = character_names[:2]
         slug_line = scene_breakdown.get("slug_line", "")
         dialogue_present = scene_breakdown.get("dialogue_present", False)
         composition = scene_breakdown.get("composition", {})
@@ -154,7 +224,7 @@ class VideoPromptEngineer:
             clip_index += 1
 
         # 2. Character introductions — one per character, up to 2
-        for char_name in character_names[:2]:
+        for char_name in main_chars:
             shots.append(ShotSpec(
                 shot_type="character_intro",
                 clip_index=clip_index,
@@ -172,7 +242,7 @@ class VideoPromptEngineer:
             shots.append(ShotSpec(
                 shot_type="dialogue_two_shot",
                 clip_index=clip_index,
-                characters=character_names[:2],
+                characters=main_chars,
                 camera_movement="static",
                 framing="medium",
                 duration_seconds=self.DURATION_MAP["dialogue_two_shot"],
@@ -180,10 +250,8 @@ class VideoPromptEngineer:
             ))
             clip_index += 1
 
-            # Over-shoulder on each main character
-            for char in character_names[:2]:
-                others = [c for c in character_names[:2] if c != char]
-                listener = others[0] if others else ""
+            # Over-shoulder on each main character, the other one listening
+            for char, listener in zip(main_chars, reversed(main_chars)):
                 shots.append(ShotSpec(
                     shot_type="dialogue_over_shoulder",
                     clip_index=clip_index,
@@ -211,11 +279,10 @@ class VideoPromptEngineer:
         # 4. Action beats — based on key moment from composition
         key_moment = composition.get("key_moment_description", "")
         if key_moment:
-            action_chars = character_names[:2] if character_names else []
             shots.append(ShotSpec(
                 shot_type="action",
                 clip_index=clip_index,
-                characters=action_chars,
+                characters=main_chars,
                 camera_movement=self.CAMERA_MAP["action"],
                 framing="medium",
                 duration_seconds=self.DURATION_MAP["action"],
@@ -258,7 +325,7 @@ class VideoPromptEngineer:
             shots.append(ShotSpec(
                 shot_type="action",
                 clip_index=clip_index,
-                characters=character_names[:2],
+                characters=main_chars,
                 camera_movement="tracking",
                 framing="medium",
                 duration_seconds=6,
@@ -270,49 +337,18 @@ class VideoPromptEngineer:
     def _build_prompt_from_shot_spec(
         self,
         shot_spec: ShotSpec,
-        scene_breakdown: Dict[str, Any],
+        scene_context: Dict[str, Any],
         novel_id: str,
         scene_id: str,
     ) -> VideoPrompt:
-        """Build a complete VideoPrompt from a ShotSpec and scene breakdown."""
-        
-        characters_with_descs = scene_breakdown.get("characters_with_descriptions", {})
-        composition = scene_breakdown.get("composition", {})
-        location_desc = scene_breakdown.get("location_visual_description", "")
-        slug_line = scene_breakdown.get("slug_line", "")
-        era = self.story_bible.get("timeline", {}).get("era", "")
-        colour_palette = composition.get("colour_palette", "")
-        lighting = composition.get("lighting", "")
-        
-        # Determine time of day and weather from slug line
-        time_of_day = self._extract_time_of_day(slug_line)
-        weather = self._extract_weather(scene_breakdown)
-        atmosphere = scene_breakdown.get("emotional_beat", "")
-
+        """Build a complete VideoPrompt from a ShotSpec and its scene context."""
         # Build the prompt text using templates
-        prompt_text = self._generate_prompt_text(
-            shot_spec=shot_spec,
-            characters_with_descs=characters_with_descs,
-            composition=composition,
-            location_desc=location_desc,
-            slug_line=slug_line,
-            time_of_day=time_of_day,
-            weather=weather,
-            atmosphere=atmosphere,
-            era=era,
-            colour_palette=colour_palette,
-            lighting=lighting,
-        )
+        prompt_text = self._generate_prompt_text(shot_spec, scene_context)
 
         # Build character consistency tags
         consistency_tags = []
         for char_name in shot_spec.characters:
-            tags = self._extract_character_appearance_tags(char_name, characters_with_descs)
-            consistency_tags.extend(tags)
-
-        # Build negative and audio prompts
-        negative_prompt = self.templates.build_negative_prompt(era=era)
-        audio_prompt = self._build_audio_prompt(scene_breakdown)
+            consistency_tags.extend(scene_context["consistency_tags"][char_name])
 
         return VideoPrompt(
             prompt_id=str(uuid.uuid4()),
@@ -321,13 +357,13 @@ class VideoPromptEngineer:
             clip_index=shot_spec.clip_index,
             prompt_type=shot_spec.shot_type,
             prompt_text=prompt_text,
-            negative_prompt=negative_prompt,
+            negative_prompt=scene_context["negative_prompt"],
             duration_seconds=shot_spec.duration_seconds,
             aspect_ratio="16:9",
             motion_intensity=self.MOTION_MAP.get(shot_spec.shot_type, "medium"),
             camera_movement=shot_spec.camera_movement,
             character_consistency_tags=consistency_tags,
-            audio_prompt=audio_prompt,
+            audio_prompt=scene_context["audio_prompt"],
             generation_params={
                 "resolution": "1080p",
                 "fps": 24,
@@ -335,172 +371,160 @@ class VideoPromptEngineer:
             estimated_cost_usd=self._estimate_clip_cost(shot_spec.duration_seconds),
         )
 
-    def _generate_prompt_text(
-        self,
-        shot_spec: ShotSpec,
-        characters_with_descs: Dict[str, str],
-        composition: Dict[str, Any],
-        location_desc: str,
-        slug_line: str,
-        time_of_day: str,
-        weather: str,
-        atmosphere: str,
-        era: str,
-        colour_palette: str,
-        lighting: str,
-    ) -> str:
+    def _generate_prompt_text(self, shot_spec: ShotSpec, scene_context: Dict[str, Any]) -> str:
         """Route to the appropriate template based on shot type."""
+        builder = self._prompt_builders.get(shot_spec.shot_type, self._build_generic_prompt)
+        return builder(shot_spec, scene_context)
+
+    def _build_establishing_prompt(self, shot_spec: ShotSpec, ctx: Dict[str, Any]) -> str:
+        return self.templates.establishing_shot(
+            location=ctx["location_desc"] or ctx["slug_line"],
+            time_of_day=ctx["time_of_day"],
+            weather=ctx["weather"],
+            atmosphere=ctx["atmosphere"],
+            era=ctx["era"],
+            colour_palette=ctx["colour_palette"],
+            camera_movement=shot_spec.camera_movement,
+        )
 
+    def _build_character_intro_prompt(self, shot_spec: ShotSpec, ctx: Dict[str, Any]) -> str:
         char_names = shot_spec.characters
-        char_descs = {name: self._get_short_description(name, characters_with_descs) for name in char_names}
-
-        if shot_spec.shot_type == "establishing":
-            return self.templates.establishing_shot(
-                location=location_desc or slug_line,
-                time_of_day=time_of_day,
-                weather=weather,
-                atmosphere=atmosphere,
-                era=era,
-                colour_palette=colour_palette,
-                camera_movement=shot_spec.camera_movement,
-            )
-
-        elif shot_spec.shot_type == "character_intro":
-            char = char_names[0] if char_names else "Unknown"
-            desc = char_descs.get(char, "")
-            key_moment = composition.get("key_moment_description", "stands in the scene")
-            return self.templates.character_introduction(
-                character_name=char,
-                physical_description=desc,
-                action=self._extract_character_action(char, key_moment),
-                location_context=location_desc or slug_line,
-                lighting=lighting,
-                mood=atmosphere,
-                camera_movement=shot_spec.camera_movement,
-            )
+        char = char_names[0] if char_names else "Unknown"
+        key_moment = ctx["composition"].get("key_moment_description", "stands in the scene")
+        return self.templates.character_introduction(
+            character_name=char,
+            physical_description=ctx["char_descs"].get(char, ""),
+            action=self._extract_character_action(char, key_moment),
+            location_context=ctx["location_desc"] or ctx["slug_line"],
+            lighting=ctx["lighting"],
+            mood=ctx["atmosphere"],
+            camera_movement=shot_spec.camera_movement,
+        )
 
-        elif shot_spec.shot_type == "dialogue_two_shot":
-            c1 = char_names[0] if len(char_names) > 0 else "Character A"
-            c2 = char_names[1] if len(char_names) > 1 else "Character B"
-            return self.templates.dialogue_two_shot(
-                char1_name=c1,
-                char1_desc=char_descs.get(c1, ""),
-                char2_name=c2,
-                char2_desc=char_descs.get(c2, ""),
-                emotional_dynamic=atmosphere,
-                setting_detail=location_desc or slug_line,
-                lighting=lighting,
-            )
+    def _build_dialogue_two_shot_prompt(self, shot_spec: ShotSpec, ctx: Dict[str, Any]) -> str:
+        char_names = shot_spec.characters
+        char_descs = ctx["char_descs"]
+        c1 = char_names[0] if len(char_names) > 0 else "Character A"
+        c2 = char_names[1] if len(char_names) > 1 else "Character B"
+        return self.templates.dialogue_two_shot(
+            char1_name=c1,
+            char1_desc=char_descs.get(c1, ""),
+            char2_name=c2,
+            char2_desc=char_descs.get(c2, ""),
+            emotional_dynamic=ctx["atmosphere"],
+            setting_detail=ctx["location_desc"] or ctx["slug_line"],
+            lighting=ctx["lighting"],
+        )
 
-        elif shot_spec.shot_type == "dialogue_over_shoulder":
-            speaker = char_names[0] if len(char_names) > 0 else "Speaker"
-            listener = char_names[1] if len(char_names) > 1 else "Listener"
-            bg = composition.get("background", location_desc)
-            return self.templates.dialogue_over_shoulder(
-                speaking_char=speaker,
-                speaking_char_desc=char_descs.get(speaker, ""),
-                listening_char=listener,
-                listening_char_desc=char_descs.get(listener, ""),
-                emotional_beat=atmosphere,
-                background=bg,
-                camera_movement=shot_spec.camera_movement,
-            )
+    def _build_dialogue_over_shoulder_prompt(self, shot_spec: ShotSpec, ctx: Dict[str, Any]) -> str:
+        char_names = shot_spec.characters
+        char_descs = ctx["char_descs"]
+        speaker = char_names[0] if len(char_names) > 0 else "Speaker"
+        listener = char_names[1] if len(char_names) > 1 else "Listener"
+        return self.templates.dialogue_over_shoulder(
+            speaking_char=speaker,
+            speaking_char_desc=char_descs.get(speaker, ""),
+            listening_char=listener,
+            listening_char_desc=char_descs.get(listener, ""),
+            emotional_beat=ctx["atmosphere"],
+            background=ctx["composition"].get("background", ctx["location_desc"]),
+            camera_movement=shot_spec.camera_movement,
+        )
 
-        elif shot_spec.shot_type == "action":
-            action_desc = composition.get("key_moment_description", shot_spec.description)
-            chars_in_shot = ", ".join(
-                f"{name} ({char_descs.get(name, '')})" for name in char_names
-            ) if char_names else "scene elements"
-            return self.templates.action_sequence(
-                action_description=action_desc,
-                characters_in_shot=chars_in_shot,
-                environment=location_desc or slug_line,
-                camera_movement=shot_spec.camera_movement,
-                motion_intensity=self.MOTION_MAP.get(shot_spec.shot_type, "medium"),
-                lighting=lighting,
-            )
+    def _build_action_prompt(self, shot_spec: ShotSpec, ctx: Dict[str, Any]) -> str:
+        char_names = shot_spec.characters
+        char_descs = ctx["char_descs"]
+        chars_in_shot = ", ".join(
+            f"{name} ({char_descs.get(name, '')})" for name in char_names
+        ) if char_names else "scene elements"
+        return self.templates.action_sequence(
+            action_description=ctx["composition"].get("key_moment_description", shot_spec.description),
+            characters_in_shot=chars_in_shot,
+            environment=ctx["location_desc"] or ctx["slug_line"],
+            camera_movement=shot_spec.camera_movement,
+            motion_intensity=self.MOTION_MAP.get(shot_spec.shot_type, "medium"),
+            lighting=ctx["lighting"],
+        )
 
-        elif shot_spec.shot_type == "reaction":
-            char = char_names[0] if char_names else "Character"
-            desc = char_descs.get(char, "")
-            return self.templates.reaction_close_up(
-                character_name=char,
-                character_desc=desc,
-                emotion=atmosphere,
-                micro_expression=self._derive_micro_expression(atmosphere),
-                lighting=lighting,
-                camera_movement=shot_spec.camera_movement,
-            )
+    def _build_reaction_prompt(self, shot_spec: ShotSpec, ctx: Dict[str, Any]) -> str:
+        char_names = shot_spec.characters
+        char = char_names[0] if char_names else "Character"
+        return self.templates.reaction_close_up(
+            character_name=char,
+            character_desc=ctx["char_descs"].get(char, ""),
+            emotion=ctx["atmosphere"],
+            micro_expression=self._derive_micro_expression(ctx["atmosphere"]),
+            lighting=ctx["lighting"],
+            camera_movement=shot_spec.camera_movement,
+        )
 
-        elif shot_spec.shot_type == "transition":
-            fg = composition.get("foreground", "")
-            bg = composition.get("background", "")
-            return self.templates.transition_shot(
-                from_element=fg,
-                to_element=bg,
-                transition_type="dissolve",
-            )
+    def _build_transition_prompt(self, shot_spec: ShotSpec, ctx: Dict[str, Any]) -> str:
+        composition = ctx["composition"]
+        return self.templates.transition_shot(
+            from_element=composition.get("foreground", ""),
+            to_element=composition.get("background", ""),
+            transition_type="dissolve",
+        )
 
-        elif shot_spec.shot_type == "insert":
-            props = shot_spec.description.replace("Insert: ", "")
-            return self.templates.insert_shot(
-                object_focus=props,
-                significance="narrative detail",
-                lighting=lighting,
-            )
+    def _build_insert_prompt(self, shot_spec: ShotSpec, ctx: Dict[str, Any]) -> str:
+        return self.templates.insert_shot(
+            object_focus=shot_spec.description.replace("Insert: ", ""),
+            significance="narrative detail",
+            lighting=ctx["lighting"],
+        )
 
-        elif shot_spec.shot_type == "montage":
-            return self.templates.montage_clip(
-                activity=shot_spec.description,
-                setting=location_desc or slug_line,
-                characters=", ".join(char_names) if char_names else "scene elements",
-            )
+    def _build_montage_prompt(self, shot_spec: ShotSpec, ctx: Dict[str, Any]) -> str:
+        char_names = shot_spec.characters
+        return self.templates.montage_clip(
+            activity=shot_spec.description,
+            setting=ctx["location_desc"] or ctx["slug_line"],
+            characters=", ".join(char_names) if char_names else "scene elements",
+        )
 
-        else:
-            # Fallback: build a generic cinematic prompt
-            return (
-                f"{shot_spec.description}. "
-                f"Setting: {location_desc or slug_line}. "
-                f"Lighting: {lighting}. "
-                f"{PromptTemplates.CINEMATIC_SUFFIX}"
-            )
+    def _build_generic_prompt(self, shot_spec: ShotSpec, ctx: Dict[str, Any]) -> str:
+        # Fallback: build a generic cinematic prompt
+        return (
+            f"{shot_spec.description}. "
+            f"Setting: {ctx['location_desc'] or ctx['slug_line']}. "
+            f"Lighting: {ctx['lighting']}. "
+            f"{PromptTemplates.CINEMATIC_SUFFIX}"
+        )
 
     # ------------------------------------------------------------------
     # Helper methods
     # ------------------------------------------------------------------
 
-    def _get_short_description(
+    def _resolve_character(
         self, char_name: str, characters_with_descs: Dict[str, str]
-    ) -> str:
-        """Get a concise character description (max 3 distinctive features)."""
+    ) -> Tuple[str, List[str]]:
+        """
+        Resolve a character's description once for both its uses.
+
+        Args:
+            char_name: Character name as given in the breakdown
+            characters_with_descs: Breakdown's name -> description mapping
+
+        Returns:
+            (concise description of at most ~200 chars, consistency tags
+            carrying 2-3 distinctive physical anchors)
+        """
         full_desc = characters_with_descs.get(char_name, "")
         if not full_desc:
             # Fall back to Story Bible
             char_data = self._character_cache.get(char_name.lower(), {})
             full_desc = char_data.get("physical_description", "")
-        
+
+        # Return the character name + key description as consistency tag
+        tags = [f"{char_name}: {full_desc[:150]}"] if full_desc else [char_name]
+
         if len(full_desc) > 200:
             # Truncate to ~200 chars at a sentence boundary
             truncated = full_desc[:200]
             last_period = truncated.rfind(".")
             if last_period > 100:
-                return truncated[:last_period + 1]
-            return truncated + "..."
-        return full_desc
-
-    def _extract_character_appearance_tags(
-        self, char_name: str, characters_with_descs: Dict[str, str]
-    ) -> List[str]:
-        """Extract 2-3 distinctive physical anchors for character consistency."""
-        desc = characters_with_descs.get(char_name, "")
-        if not desc:
-            char_data = self._character_cache.get(char_name.lower(), {})
-            desc = char_data.get("physical_description", "")
-        
-        # Return the character name + key description as consistency tag
-        if desc:
-            return [f"{char_name}: {desc[:150]}"]
-        return [char_name]
+                return truncated[:last_period + 1], tags
+            return truncated + "...", tags
+        return full_desc, tags
 
     def _extract_time_of_day(self, slug_line: str) -> str:
         """Extract time of day from slug line."""
@@ -536,20 +560,10 @@ class VideoPromptEngineer:
     def _derive_micro_expression(self, emotional_beat: str) -> str:
         """Derive a micro-expression hint from the emotional beat."""
         beat_lower = emotional_beat.lower()
-        if any(w in beat_lower for w in ["fear", "terror", "horror", "dread"]):
-            return "widened eyes, tightened jaw, slight tremor"
-        if any(w in beat_lower for w in ["anger", "rage", "fury"]):
-            return "clenched jaw, narrowed eyes, flared nostrils"
-        if any(w in beat_lower for w in ["sad", "grief", "loss", "sorrow"]):
-            return "glistening eyes, quivering lower lip, downcast gaze"
-        if any(w in beat_lower for w in ["joy", "happy", "relief", "hope"]):
-            return "slight smile, brightened eyes, relaxed brow"
-        if any(w in beat_lower for w in ["shock", "surprise", "discover"]):
-            return "raised eyebrows, parted lips, widened eyes"
-        if any(w in beat_lower for w in ["tension", "suspense", "wary"]):
-            return "tight lips, alert eyes, subtle frown"
-        if any(w in beat_lower for w in ["determination", "resolve"]):
-            return "set jaw, focused gaze, squared shoulders"
+        for keywords, expression in self.MICRO_EXPRESSIONS:
+            for keyword in keywords:
+                if keyword in beat_lower:
+                    return expression
         return "subtle shift in expression, internal processing"
 
     def _build_audio_prompt(self, scene_breakdown: Dict[str, Any]) -> str:
@@ -567,27 +581,46 @@ class VideoPromptEngineer:
 
     def _estimate_clip_cost(self, duration_seconds: int, resolution: str = "1080p") -> float:
         """Estimate cost for a single clip."""
-        # Seedance 2.0 approximate pricing
-        cost_per_minute = {
-            "720p": 0.10,
-            "1080p": 0.30,
-            "2k": 0.80,
-        }
-        rate = cost_per_minute.get(resolution, 0.30)
+        rate = self.COST_PER_MINUTE.get(resolution, 0.30)
         return round((duration_seconds / 60.0) * rate, 4)
 
-    def generate_prompts_for_all_scenes(
+    def iter_prompts_for_all_scenes(
         self,
-        breakdowns: List[Dict[str, Any]],
+        breakdowns: Iterable[Dict[str, Any]],
         novel_id: str,
-    ) -> List[VideoPrompt]:
-        """Generate prompts for all scene breakdowns."""
-        all_prompts = []
+    ) -> Iterator[VideoPrompt]:
+        """
+        Yield prompts scene by scene.
+
+        Only one breakdown is needed at a time, so breakdowns can be
+        streamed from disk (utils.json_io.iter_json_array) instead of
+        loading the whole file first.
+
+        Args:
+            breakdowns: Scene breakdown dicts, in scene order
+            novel_id: Novel UUID
+
+        Yields:
+            VideoPrompt objects in scene and clip order
+        """
+        scene_count = 0
+        prompt_count = 0
         for breakdown in breakdowns:
             scene_prompts = self.generate_prompts_for_scene(breakdown, novel_id)
-            all_prompts.extend(scene_prompts)
-            logger.info(
+            # Per-scene lines cost more than generating the prompts, so keep them at DEBUG
+            logger.debug(
                 f"Scene {breakdown.get('scene_number', '?')}: "
                 f"generated {len(scene_prompts)} prompts"
             )
-        return all_prompts
+            scene_count += 1
+            prompt_count += len(scene_prompts)
+            yield from scene_prompts
+        logger.info(f"Generated {prompt_count} prompts across {scene_count} scenes")
+
+    def generate_prompts_for_all_scenes(
+        self,
+        breakdowns: Iterable[Dict[str, Any]],
+        novel_id: str,
+    ) -> List[VideoPrompt]:
+        """Generate prompts for all scene breakdowns."""
+        return list(self.iter_prompts_for_all_scenes(breakdowns, novel_id))
@@ -3,7 +3,7 @@ import json
 import time
 import uuid
 import re
-from typing import List, Dict, Any, Optional
+from typing import Callable, List, Dict, Any, Optional
 from anthropic import Anthropic
 from pathlib import Path
 
@@ -19,7 +19,7 @@ from extraction.models import (
     Screenplay,
     DialogueLine
 )
-from ingestion.models import NarrativeChunk
+from ingestion.models import NarrativeChunk, NarrativeChunkList
 from screenplay import prompts
 import config
 
@@ -95,13 +95,15 @@ class ScreenplayConverter:
     def convert(
         self,
         novel_id: str,
-        use_checkpoints: bool = True
+        use_checkpoints: bool = True,
+        progress_callback: Optional[Callable[[int, int], None]] = None
     ) -> Screenplay:
         """Convert novel to screenplay.
         
         Args:
             novel_id: Novel UUID
             use_checkpoints: Whether to use checkpointing
+            progress_callback: Optional callback receiving (chunks_done, chunk_count)
             
         Returns:
             Complete Screenplay
@@ -119,11 +121,11 @@ class ScreenplayConverter:
                 logger.info(f"📁 Found checkpoint at stage: {checkpoint_data.get('stage', 'unknown')}")
         
         # Load Story Bible and chunks
-        story_bible_dict = self.db.get_story_bible(novel_id)
-        if not story_bible_dict:
+        story_bible_json = self.db.get_story_bible_json(novel_id)
+        if not story_bible_json:
             raise ValueError(f"No Story Bible found for novel {novel_id}. Run Phase 1 first.")
         
-        story_bible = StoryBible(**story_bible_dict)
+        story_bible = StoryBible.model_validate_json(story_bible_json)
         chunks = self._load_chunks_sequential(novel_id)
         
         if not chunks:
@@ -203,6 +205,9 @@ class ScreenplayConverter:
                     'tokens_used': self.total_tokens_used
                 })
             
+            if progress_callback:
+                progress_callback(i + 1, len(chunks))
+            
             # Rate limiting
             time.sleep(config.API_CALL_DELAY)
         
@@ -234,23 +239,7 @@ class ScreenplayConverter:
     
     def _load_chunks_sequential(self, novel_id: str) -> List[NarrativeChunk]:
         """Load chunks in sequential order."""
-        chunk_dicts = self.db.get_chunks(novel_id)
-        
-        chunks = [
-            NarrativeChunk(
-                chunk_id=c['id'],
-                novel_title=c.get('novel_title', ''),
-                chapter_number=c['chapter_number'],
-                chunk_index=c['chunk_index'],
-                text=c['text'],
-                token_count=c['token_count'],
-                start_char=c['start_char'],
-                end_char=c['end_char']
-            )
-            for c in chunk_dicts
-        ]
-        
-        return chunks
+        return NarrativeChunkList.validate_python(self.db.get_chunk_fields(novel_id))
     
     def _determine_act_structure(
         self,
@@ -1,8 +1,8 @@
 """Fountain screenplay formatter."""
-import json
 from pathlib import Path
 from typing import List
 
+from utils.json_io import write_bytes_atomic
 from utils.logger import setup_logger
 from extraction.models import Screenplay, ScreenplayScene, DialogueLine
 
@@ -74,20 +74,34 @@ class FountainFormatter:
         
         return "\n".join(lines)
     
+    def export_files(self, screenplay: Screenplay, fountain_path: str, json_path: str) -> None:
+        """Format the screenplay once and export both the .fountain and JSON files.
+        
+        The formatted text is stored on screenplay.fountain_text (the JSON
+        includes it) and written as-is, so the scene tree is only walked once.
+        
+        Args:
+            screenplay: Complete Screenplay object
+            fountain_path: Destination .fountain path
+            json_path: Destination JSON path
+        """
+        screenplay.fountain_text = self.format(screenplay)
+        
+        write_bytes_atomic(fountain_path, screenplay.fountain_text.encode('utf-8'))
+        logger.info(f"Exported Fountain screenplay to {fountain_path}")
+        
+        self.export_json(screenplay, json_path)
+    
     def export_fountain_file(self, screenplay: Screenplay, output_path: str) -> None:
         """Export screenplay as .fountain file."""
         fountain_text = self.format(screenplay)
         
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(fountain_text)
+        write_bytes_atomic(output_path, fountain_text.encode('utf-8'))
         
         logger.info(f"Exported Fountain screenplay to {output_path}")
     
     def export_json(self, screenplay: Screenplay, output_path: str) -> None:
-        """Export screenplay as JSON."""
-        screenplay_dict = screenplay.model_dump()
-        
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(screenplay_dict, f, indent=2, ensure_ascii=False)
+        """Export screenplay as JSON, serialized straight from the model."""
+        write_bytes_atomic(output_path, screenplay.model_dump_json(indent=2).encode('utf-8'))
         
         logger.info(f"Exported JSON screenplay to {output_path}")
@@ -1,10 +1,11 @@
 """Scene breakdown extractor for Phase 3 video generation."""
+import asyncio
 import json
 import time
 import uuid
-from typing import List, Dict, Any
+from typing import Callable, List, Dict, Any, Optional
 
-from anthropic import Anthropic
+from anthropic import Anthropic, AsyncAnthropic
 from utils.logger import setup_logger
 from storage.database import Database
 from extraction.models import (
@@ -22,16 +23,28 @@ logger = setup_logger(__name__)
 class SceneBreakdownExtractor:
     """Extracts detailed scene breakdowns for video generation."""
     
+    MAX_LLM_RETRIES = 10
+    RETRY_BASE_DELAY = 2.0
+    
     def __init__(
         self,
         anthropic_client: Anthropic,
         db: Database,
-        model: str = config.ANTHROPIC_MODEL
+        model: str = config.ANTHROPIC_MODEL,
+        max_concurrency: int = config.MAX_CONCURRENT_LLM_CALLS
     ):
-        """Initialize extractor."""
+        """Initialize extractor.
+        
+        Args:
+            anthropic_client: Anthropic API client
+            db: Database instance
+            model: Model name to use
+            max_concurrency: Maximum scenes being broken down at once
+        """
         self.client = anthropic_client
         self.db = db
         self.model = model
+        self.max_concurrency = max_concurrency
         self.total_tokens_used = 0
         
         logger.info(f"SceneBreakdownExtractor initialized")
@@ -39,30 +52,65 @@ class SceneBreakdownExtractor:
     def process_all_scenes(
         self,
         scenes: List[ScreenplayScene],
-        story_bible: StoryBible
+        story_bible: StoryBible,
+        progress_callback: Optional[Callable[[int, int], None]] = None
     ) -> List[SceneBreakdown]:
         """Process all scenes to generate breakdowns.
         
+        Scenes are independent, so their LLM calls run concurrently (see
+        aprocess_all_scenes); breakdowns are returned in scene order.
+        
         Args:
             scenes: List of screenplay scenes
             story_bible: Complete Story Bible
+            progress_callback: Optional callback receiving (scenes_done, scene_count)
             
         Returns:
             List of scene breakdowns
         """
-        breakdowns = []
+        return asyncio.run(self.aprocess_all_scenes(scenes, story_bible, progress_callback))
+    
+    async def aprocess_all_scenes(
+        self,
+        scenes: List[ScreenplayScene],
+        story_bible: StoryBible,
+        progress_callback: Optional[Callable[[int, int], None]] = None
+    ) -> List[SceneBreakdown]:
+        """Break down scenes concurrently on an async client, capped by a semaphore.
         
-        for scene in scenes:
-            logger.info(f"Processing scene {scene.scene_number}/{len(scenes)}: {scene.slug_line}")
+        Args:
+            scenes: List of screenplay scenes
+            story_bible: Complete Story Bible
+            progress_callback: Optional callback receiving (scenes_done, scene_count)
             
-            breakdown = self.process_scene(scene, story_bible)
-            breakdowns.append(breakdown)
+        Returns:
+            List of scene breakdowns, in the same order as scenes
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        story_bible_data = story_bible.model_dump()
+        done = 0
+        logger.info(f"Processing {len(scenes)} scenes ({self.max_concurrency} concurrent)")
+        
+        # The async client's connection pool is bound to this event loop
+        async with AsyncAnthropic(api_key=self.client.api_key) as async_client:
+            
+            async def bounded_scene(scene: ScreenplayScene) -> SceneBreakdown:
+                nonlocal done
+                async with semaphore:
+                    logger.info(f"Processing scene {scene.scene_number}/{len(scenes)}: {scene.slug_line}")
+                    prompt = prompts.scene_breakdown_prompt(scene.model_dump(), story_bible_data)
+                    result = await self._acall_llm(async_client, prompt)
+                    done += 1
+                    if progress_callback:
+                        progress_callback(done, len(scenes))
+                    # Keep each slot paced as the sequential loop was
+                    await asyncio.sleep(config.API_CALL_DELAY)
+                    return self._build_breakdown(scene, json.loads(result))
             
-            # Rate limiting
-            time.sleep(config.API_CALL_DELAY)
+            breakdowns = await asyncio.gather(*(bounded_scene(scene) for scene in scenes))
         
         logger.info(f"Completed {len(breakdowns)} scene breakdowns")
-        return breakdowns
+        return list(breakdowns)
     
     def process_scene(
         self,
@@ -76,10 +124,11 @@ class SceneBreakdownExtractor:
         )
         
         result = self._call_llm(prompt)
-        breakdown_data = json.loads(result)
-        
-        # Build SceneBreakdown
-        breakdown = SceneBreakdown(
+        return self._build_breakdown(scene, json.loads(result))
+    
+    def _build_breakdown(self, scene: ScreenplayScene, breakdown_data: Dict[str, Any]) -> SceneBreakdown:
+        """Build a SceneBreakdown from the LLM's JSON, defaulting from the scene."""
+        return SceneBreakdown(
             breakdown_id=str(uuid.uuid4()),
             scene_id=scene.scene_id,
             scene_number=scene.scene_number,
@@ -98,15 +147,10 @@ class SceneBreakdownExtractor:
             continuity_notes=breakdown_data.get('continuity_notes', ''),
             prompt_ready=breakdown_data.get('prompt_ready', True)
         )
-        
-        return breakdown
     
     def _call_llm(self, prompt: str) -> str:
         """Call LLM with retry logic."""
-        max_retries = 10
-        base_delay = 2.0
-        
-        for attempt in range(max_retries):
+        for attempt in range(self.MAX_LLM_RETRIES):
             try:
                 message = self.client.messages.create(
                     model=self.model,
@@ -114,53 +158,72 @@ class SceneBreakdownExtractor:
                     temperature=config.LLM_TEMPERATURE,
                     messages=[{"role": "user", "content": prompt}]
                 )
-                
-                self.total_tokens_used += message.usage.input_tokens + message.usage.output_tokens
-                response_text = message.content[0].text
-                
-                # Extract JSON
-                try:
-                    json.loads(response_text)
-                    return response_text
-                except json.JSONDecodeError:
-                    if "```json" in response_text:
-                        extracted = response_text.split("```json")[1].split("```")[0].strip()
-                        json.loads(extracted)
-                        return extracted
-                    elif "```" in response_text:
-                        parts = response_text.split("```")
-                        if len(parts) >= 3:
-                            extracted = parts[1].strip()
-                            json.loads(extracted)
-                            return extracted
-                    
-                    start = response_text.find('{')
-                    if start != -1:
-                        end = response_text.rfind('}')
-                        if end != -1:
-                            extracted = response_text[start:end+1]
-                            json.loads(extracted)
-                            return extracted
-                    
-                    raise json.JSONDecodeError("Could not extract JSON", response_text, 0)
-                    
+                return self._read_response(message)
+            except Exception as e:
+                time.sleep(self._retry_wait(e, attempt))
+        
+        raise Exception(f"Failed after {self.MAX_LLM_RETRIES} retries")
+    
+    async def _acall_llm(self, async_client: AsyncAnthropic, prompt: str) -> str:
+        """Async counterpart of _call_llm with the same retry policy."""
+        for attempt in range(self.MAX_LLM_RETRIES):
+            try:
+                message = await async_client.messages.create(
+                    model=self.model,
+                    max_tokens=4096,
+                    temperature=config.LLM_TEMPERATURE,
+                    messages=[{"role": "user", "content": prompt}]
+                )
+                return self._read_response(message)
             except Exception as e:
-                is_overload = "overloaded_error" in str(e) or "529" in str(e)
-                is_rate_limit = "rate_limit_error" in str(e) or "429" in str(e)
-                
-                if is_overload or is_rate_limit:
-                    wait_time = min(base_delay * (2 ** attempt), 60)
-                    if attempt < max_retries - 1:
-                        logger.warning(f"API error. Waiting {wait_time:.1f}s...")
-                        time.sleep(wait_time)
-                        continue
-                elif attempt < 3:
-                    wait_time = base_delay * (attempt + 1)
-                    logger.warning(f"Error: {e}. Retrying...")
-                    time.sleep(wait_time)
-                    continue
-                
-                logger.error(f"LLM call failed: {e}")
-                raise
+                await asyncio.sleep(self._retry_wait(e, attempt))
+        
+        raise Exception(f"Failed after {self.MAX_LLM_RETRIES} retries")
+    
+    def _retry_wait(self, error: Exception, attempt: int) -> float:
+        """Seconds to wait before retrying a failed call; re-raises when out of retries."""
+        is_overload = "overloaded_error" in str(error) or "529" in str(error)
+        is_rate_limit = "rate_limit_error" in str(error) or "429" in str(error)
+        
+        if is_overload or is_rate_limit:
+            if attempt < self.MAX_LLM_RETRIES - 1:
+                wait_time = min(self.RETRY_BASE_DELAY * (2 ** attempt), 60)
+                logger.warning(f"API error. Waiting {wait_time:.1f}s...")
+                return wait_time
+        elif attempt < 3:
+            logger.warning(f"Error: {error}. Retrying...")
+            return self.RETRY_BASE_DELAY * (attempt + 1)
         
-        raise Exception(f"Failed after {max_retries} retries")
+        logger.error(f"LLM call failed: {error}")
+        raise error
+    
+    def _read_response(self, message: Any) -> str:
+        """Record token usage and extract the JSON response text."""
+        self.total_tokens_used += message.usage.input_tokens + message.usage.output_tokens
+        response_text = message.content[0].text
+        
+        # Extract JSON
+        try:
+            json.loads(response_text)
+            return response_text
+        except json.JSONDecodeError:
+            if "```json" in response_text:
+                extracted = response_text.split("```json")[1].split("```")[0].strip()
+                json.loads(extracted)
+                return extracted
+            elif "```" in response_text:
+                parts = response_text.split("```")
+                if len(parts) >= 3:
+                    extracted = parts[1].strip()
+                    json.loads(extracted)
+                    return extracted
+            
+            start = response_text.find('{')
+            if start != -1:
+                end = response_text.rfind('}')
+                if end != -1:
+                    extracted = response_text[start:end+1]
+                    json.loads(extracted)
+                    return extracted
+            
+            raise json.JSONDecodeError("Could not extract JSON", response_text, 0)
@@ -4,10 +4,11 @@ import json
 import uuid
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterable
 from contextlib import contextmanager
 
 from utils.logger import setup_logger
+from utils.paths import slugify_title
 import config
 
 logger = setup_logger(__name__)
@@ -16,6 +17,24 @@ logger = setup_logger(__name__)
 class Database:
     """Manages SQLite database operations."""
     
+    # Applied to every connection. WAL lets readers run alongside the bulk
+    # insert paths, and with WAL, synchronous=NORMAL only fsyncs at
+    # checkpoints instead of on every commit.
+    CONNECTION_PRAGMAS = (
+        "PRAGMA synchronous=NORMAL",
+        "PRAGMA temp_store=MEMORY",
+        "PRAGMA mmap_size=268435456",
+    )
+    
+    # Columns added after their table first shipped: (table, column, type).
+    # Databases created before then are migrated on startup.
+    ADDED_COLUMNS = (
+        ("novels", "slug", "TEXT"),
+        ("novels", "file_size", "INTEGER"),
+        ("novels", "file_mtime_ns", "INTEGER"),
+        ("novels", "prefix_hash", "TEXT"),
+    )
+    
     def __init__(self, db_path: Path = config.DB_PATH):
         """Initialize database connection.
         
@@ -54,16 +73,48 @@ class Database:
             schema_sql += "\n" + schema_phase4_sql
         
         with self._get_connection() as conn:
+            # journal_mode is persistent, so it only needs setting once
+            conn.execute("PRAGMA journal_mode=WAL")
+            # Migrate first so indexes in the schema can reference new columns
+            self._add_missing_columns(conn)
             conn.executescript(schema_sql)
+            self._backfill_slugs(conn)
             conn.commit()
         
         logger.info(f"Database initialized at {self.db_path}")
     
+    def _add_missing_columns(self, conn: sqlite3.Connection) -> None:
+        """Add columns introduced after a table was created.
+        
+        Args:
+            conn: Open database connection
+        """
+        for table, column, column_type in self.ADDED_COLUMNS:
+            existing = {row['name'] for row in conn.execute(f"PRAGMA table_info({table})")}
+            # An empty result means the table is new and the schema will create it
+            if existing and column not in existing:
+                conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {column_type}")
+                logger.info(f"Migrated schema: added {table}.{column}")
+    
+    def _backfill_slugs(self, conn: sqlite3.Connection) -> None:
+        """Fill in slugs for novels ingested before the slug column existed.
+        
+        Args:
+            conn: Open database connection
+        """
+        rows = conn.execute("SELECT id, title FROM novels WHERE slug IS NULL").fetchall()
+        conn.executemany(
+            "UPDATE novels SET slug = ? WHERE id = ?",
+            [(slugify_title(row['title']), row['id']) for row in rows]
+        )
+    
     @contextmanager
     def _get_connection(self):
         """Context manager for database connections."""
         conn = sqlite3.connect(self.db_path)
         conn.row_factory = sqlite3.Row
+        for pragma in self.CONNECTION_PRAGMAS:
+            conn.execute(pragma)
         try:
             yield conn
         finally:
@@ -75,7 +126,10 @@ class Database:
         file_path: str,
         file_hash: str,
         page_count: int,
-        word_count: int
+        word_count: int,
+        file_size: Optional[int] = None,
+        file_mtime_ns: Optional[int] = None,
+        prefix_hash: Optional[str] = None
     ) -> str:
         """Insert a new novel record.
         
@@ -85,6 +139,9 @@ class Database:
             file_hash: SHA256 hash of file
             page_count: Number of pages
             word_count: Word count
+            file_size: File size in bytes (quick duplicate key)
+            file_mtime_ns: File modification time in ns (quick duplicate key)
+            prefix_hash: Hash of the file's first bytes (quick duplicate key)
             
         Returns:
             Novel UUID
@@ -95,10 +152,12 @@ class Database:
         with self._get_connection() as conn:
             conn.execute(
                 """
-                INSERT INTO novels (id, title, file_path, file_hash, page_count, word_count, ingested_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
+                INSERT INTO novels (id, title, slug, file_path, file_hash, page_count, word_count, ingested_at,
+                                    file_size, file_mtime_ns, prefix_hash)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                 """,
-                (novel_id, title, file_path, file_hash, page_count, word_count, ingested_at)
+                (novel_id, title, slugify_title(title), file_path, file_hash, page_count, word_count, ingested_at,
+                 file_size, file_mtime_ns, prefix_hash)
             )
             conn.commit()
         
@@ -122,14 +181,82 @@ class Database:
             
             return dict(row) if row else None
     
-    def insert_chunks(self, chunks: List[Dict[str, Any]]) -> None:
+    def get_novel_by_quick_key(
+        self,
+        file_size: int,
+        file_mtime_ns: int,
+        prefix_hash: str
+    ) -> Optional[Dict[str, Any]]:
+        """Find an ingested novel by file size, mtime and prefix hash.
+        
+        Lets an unchanged PDF be recognised without hashing all of it.
+        Novels ingested before these keys were recorded never match, and
+        fall back to get_novel_by_hash.
+        
+        Args:
+            file_size: File size in bytes
+            file_mtime_ns: File modification time in ns
+            prefix_hash: Hash of the file's first bytes
+            
+        Returns:
+            Novel record dict or None
+        """
+        with self._get_connection() as conn:
+            row = conn.execute(
+                """SELECT * FROM novels
+                   WHERE file_size = ? AND prefix_hash = ? AND file_mtime_ns = ?""",
+                (file_size, prefix_hash, file_mtime_ns)
+            ).fetchone()
+            
+            return dict(row) if row else None
+    
+    def get_novel_by_id(self, novel_id: str) -> Optional[Dict[str, Any]]:
+        """Get a novel record by its ID.
+        
+        Args:
+            novel_id: Novel UUID
+            
+        Returns:
+            Novel record dict or None
+        """
+        with self._get_connection() as conn:
+            row = conn.execute(
+                "SELECT * FROM novels WHERE id = ?",
+                (novel_id,)
+            ).fetchone()
+            
+            return dict(row) if row else None
+    
+    def get_novel_id_for_scene(self, scene_id: str) -> Optional[str]:
+        """Get the ID of the novel a scene belongs to.
+        
+        Args:
+            scene_id: Scene UUID
+            
+        Returns:
+            Novel UUID or None if the scene is unknown
+        """
+        with self._get_connection() as conn:
+            row = conn.execute(
+                """
+                SELECT novel_id FROM screenplay_scenes WHERE id = ?
+                UNION ALL
+                SELECT novel_id FROM generation_jobs WHERE scene_id = ?
+                LIMIT 1
+                """,
+                (scene_id, scene_id)
+            ).fetchone()
+            
+            return row['novel_id'] if row else None
+    
+    def insert_chunks(self, chunks: Iterable[Dict[str, Any]]) -> None:
         """Bulk insert narrative chunks.
         
         Args:
-            chunks: List of chunk dictionaries
+            chunks: Chunk dictionaries (any iterable, including a generator)
         """
         with self._get_connection() as conn:
-            conn.executemany(
+            cursor = conn.executemany(
                 """
                 INSERT INTO chunks (id, novel_id, chapter_number, chunk_index, text, token_count, start_char, end_char)
                 VALUES (:id, :novel_id, :chapter_number, :chunk_index, :text, :token_count, :start_char, :end_char)
@@ -138,7 +265,7 @@ class Database:
             )
             conn.commit()
         
-        logger.info(f"Inserted {len(chunks)} chunks")
+        logger.info(f"Inserted {cursor.rowcount} chunks")
     
     def get_chunks(self, novel_id: str) -> List[Dict[str, Any]]:
         """Retrieve all chunks for a novel.
@@ -157,6 +284,30 @@ class Database:
             
             return [dict(row) for row in rows]
     
+    def get_chunk_fields(self, novel_id: str, novel_title: str = '') -> List[Dict[str, Any]]:
+        """Retrieve all chunks for a novel, keyed by NarrativeChunk field names.
+        
+        Columns are renamed in SQL so the rows can be validated into
+        NarrativeChunks in one pass (ingestion.models.NarrativeChunkList).
+        
+        Args:
+            novel_id: Novel UUID
+            novel_title: Title to stamp on every chunk
+            
+        Returns:
+            List of chunk dictionaries in reading order
+        """
+        with self._get_connection() as conn:
+            rows = conn.execute(
+                """SELECT id AS chunk_id, ? AS novel_title, chapter_number, chunk_index,
+                          text, token_count, start_char, end_char
+                   FROM chunks WHERE novel_id = ?
+                   ORDER BY chapter_number, chunk_index""",
+                (novel_title, novel_id)
+            ).fetchall()
+            
+            return [dict(row) for row in rows]
+    
     def insert_story_bible(
         self,
         novel_id: str,
@@ -190,14 +341,17 @@ class Database:
         logger.info(f"Inserted Story Bible for novel {novel_id}")
         return bible_id
     
-    def get_story_bible(self, novel_id: str) -> Optional[Dict[str, Any]]:
-        """Retrieve Story Bible for a novel.
+    def get_story_bible_json(self, novel_id: str) -> Optional[str]:
+        """Retrieve the raw Story Bible JSON for a novel.
+        
+        Lets callers validate straight into a model with
+        StoryBible.model_validate_json, skipping the intermediate dict.
         
         Args:
             novel_id: Novel UUID
             
         Returns:
-            Story Bible dictionary or None
+            Story Bible JSON string or None
         """
         with self._get_connection() as conn:
             row = conn.execute(
@@ -205,17 +359,30 @@ class Database:
                 (novel_id,)
             ).fetchone()
             
-            if row:
-                json_str = row['bible_json']
-                try:
-                    return json.loads(json_str)
-                except json.JSONDecodeError as e:
-                    logger.error(f"Failed to decode bible_json for novel {novel_id}")
-                    logger.error(f"Error: {e}")
-                    logger.error(f"Content length: {len(json_str) if json_str else 0}")
-                    if json_str:
-                         logger.error(f"First 100 chars: {json_str[:100]}")
-                    raise
+            return row['bible_json'] if row else None
+    
+    def get_story_bible(self, novel_id: str) -> Optional[Dict[str, Any]]:
+        """Retrieve Story Bible for a novel.
+        
+        Args:
+            novel_id: Novel UUID
+            
+        Returns:
+            Story Bible dictionary or None
+        """
+        json_str = self.get_story_bible_json(novel_id)
+        if json_str is None:
+            return None
+        
+        try:
+            return json.loads(json_str)
+        except json.JSONDecodeError as e:
+            logger.error(f"Failed to decode bible_json for novel {novel_id}")
+            logger.error(f"Error: {e}")
+            logger.error(f"Content length: {len(json_str) if json_str else 0}")
+            if json_str:
+                 logger.error(f"First 100 chars: {json_str[:100]}")
+            raise
             return None
     
     def insert_pipeline_run(
@@ -284,3 +451,45 @@ class Database:
         with self._get_connection() as conn:
             rows = conn.execute("SELECT * FROM novels ORDER BY ingested_at DESC").fetchall()
             return [dict(row) for row in rows]
+    
+    def get_clips_by_prompt_hashes(self, prompt_hashes: Iterable[str]) -> Dict[str, str]:
+        """Look up previously generated clips for many prompts at once.
+        
+        Args:
+            prompt_hashes: Hashes of canonicalized prompt payloads
+            
+        Returns:
+            Dict mapping each cached prompt hash to its clip path
+        """
+        prompt_hashes = list(prompt_hashes)
+        clips: Dict[str, str] = {}
+        with self._get_connection() as conn:
+            # Stay under SQLite's bound-parameter limit
+            for i in range(0, len(prompt_hashes), 500):
+                batch = prompt_hashes[i:i + 500]
+                placeholders = ", ".join("?" for _ in batch)
+                rows = conn.execute(
+                    f"SELECT prompt_hash, clip_path FROM clip_cache WHERE prompt_hash IN ({placeholders})",
+                    batch
+                ).fetchall()
+                clips.update((row['prompt_hash'], row['clip_path']) for row in rows)
+        
+        return clips
+    
+    def insert_clip_hash(self, prompt_hash: str, clip_path: str, job_id: str) -> None:
+        """Record the clip generated for a prompt so identical prompts can reuse it.
+        
+        Args:
+            prompt_hash: Hash of the canonicalized prompt payload
+            clip_path: Path of the generated clip
+            job_id: Job that generated the clip
+        """
+        with self._get_connection() as conn:
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO clip_cache (prompt_hash, clip_path, job_id, created_at)
+                VALUES (?, ?, ?, ?)
+                """,
+                (prompt_hash, clip_path, job_id, datetime.now().isoformat())
+            )
+            conn.commit()
@@ -3,11 +3,15 @@
 CREATE TABLE IF NOT EXISTS novels (
     id TEXT PRIMARY KEY,           -- UUID
     title TEXT NOT NULL,
+    slug TEXT,                     -- Filesystem-safe title used for output file names
     file_path TEXT NOT NULL,
     file_hash TEXT NOT NULL,       -- SHA256 — prevents re-processing same file
     page_count INTEGER,
     word_count INTEGER,
-    ingested_at TEXT NOT NULL
+    ingested_at TEXT NOT NULL,
+    file_size INTEGER,             -- Quick duplicate key: size, mtime and
+    file_mtime_ns INTEGER,         -- BLAKE2b of the first MiB, checked before
+    prefix_hash TEXT               -- hashing the whole file
 );
 
 CREATE TABLE IF NOT EXISTS chunks (
@@ -47,3 +51,5 @@ CREATE INDEX IF NOT EXISTS idx_chunks_novel_id ON chunks(novel_id);
 CREATE INDEX IF NOT EXISTS idx_chunks_chapter ON chunks(novel_id, chapter_number);
 CREATE INDEX IF NOT EXISTS idx_pipeline_runs_novel ON pipeline_runs(novel_id);
 CREATE INDEX IF NOT EXISTS idx_novels_hash ON novels(file_hash);
+CREATE INDEX IF NOT EXISTS idx_novels_slug ON novels(slug);
+CREATE INDEX IF NOT EXISTS idx_novels_quick_key ON novels(file_size, prefix_hash);
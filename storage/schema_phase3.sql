@@ -52,3 +52,5 @@ CREATE TABLE IF NOT EXISTS prompt_iterations (
     created_at TEXT NOT NULL,
     FOREIGN KEY (scene_id) REFERENCES screenplay_scenes(id)
 );
+
+CREATE INDEX IF NOT EXISTS idx_generation_jobs_scene ON generation_jobs(scene_id, clip_index);
@@ -37,6 +37,14 @@ CREATE TABLE IF NOT EXISTS download_cache (
     FOREIGN KEY (job_id) REFERENCES generation_jobs(id)
 );
 
+CREATE TABLE IF NOT EXISTS clip_cache (
+    prompt_hash TEXT PRIMARY KEY,      -- BLAKE2b of the canonicalized prompt JSON
+    clip_path TEXT NOT NULL,
+    job_id TEXT NOT NULL,              -- Job that generated the clip
+    created_at TEXT NOT NULL,
+    FOREIGN KEY (job_id) REFERENCES generation_jobs(id)
+);
+
 CREATE TABLE IF NOT EXISTS assembly_log (
     id TEXT PRIMARY KEY,
     scene_id TEXT NOT NULL,
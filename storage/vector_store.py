@@ -2,6 +2,7 @@
 import chromadb
 from chromadb.config import Settings
 from sentence_transformers import SentenceTransformer
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional
 from pathlib import Path
 
@@ -62,13 +63,21 @@ class VectorStore:
     def add_chunks(
         self,
         chunks: List[Dict[str, Any]],
-        novel_id: str
+        novel_id: str,
+        batch_size: int = config.EMBEDDING_BATCH_SIZE
     ) -> None:
         """Add narrative chunks to vector store.
         
+        Chunks are embedded and written in groups of batch_size, so each
+        group costs one encode call and one collection.add call, and no
+        single add exceeds ChromaDB's maximum batch size. Each group's add
+        runs on a writer thread while the next group is encoded; at most one
+        encoded group waits to be written.
+        
         Args:
             chunks: List of chunk dictionaries with 'id', 'text', and metadata
             novel_id: Novel UUID
+            batch_size: Number of chunks per embedding/insert batch
         """
         if not chunks:
             logger.warning("No chunks to add")
@@ -82,31 +91,49 @@ class VectorStore:
             metadata={"novel_id": novel_id}
         )
         
-        # Extract text and generate embeddings
-        texts = [chunk['text'] for chunk in chunks]
-        logger.info(f"Generating embeddings for {len(texts)} chunks...")
-        embeddings = self.embedding_model.encode(texts, show_progress_bar=True).tolist()
-        
-        # Prepare metadata
-        metadatas = [
-            {
-                "chunk_id": chunk['id'],
-                "novel_id": novel_id,
-                "chapter_number": str(chunk.get('chapter_number', 0)),
-                "chunk_index": str(chunk.get('chunk_index', 0)),
-                "token_count": str(chunk.get('token_count', 0))
-            }
-            for chunk in chunks
-        ]
-        
-        # Add to collection
-        ids = [chunk['id'] for chunk in chunks]
-        collection.add(
-            ids=ids,
-            embeddings=embeddings,
-            documents=texts,
-            metadatas=metadatas
-        )
+        batch_size = min(batch_size, self.client.get_max_batch_size())
+        logger.info(f"Generating embeddings for {len(chunks)} chunks (batch size {batch_size})...")
+        
+        pending_add = None
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="chroma-add") as writer:
+            for start in range(0, len(chunks), batch_size):
+                batch = chunks[start:start + batch_size]
+                
+                # Extract text and generate embeddings
+                texts = [chunk['text'] for chunk in batch]
+                embeddings = self.embedding_model.encode(
+                    texts,
+                    batch_size=batch_size,
+                    show_progress_bar=False
+                ).tolist()
+                
+                # Prepare metadata
+                metadatas = [
+                    {
+                        "chunk_id": chunk['id'],
+                        "novel_id": novel_id,
+                        "chapter_number": str(chunk.get('chapter_number', 0)),
+                        "chunk_index": str(chunk.get('chunk_index', 0)),
+                        "token_count": str(chunk.get('token_count', 0))
+                    }
+                    for chunk in batch
+                ]
+                
+                # Finish writing the previous group before queueing this one
+                if pending_add is not None:
+                    pending_add.result()
+                
+                # Add to collection
+                ids = [chunk['id'] for chunk in batch]
+                pending_add = writer.submit(
+                    collection.add,
+                    ids=ids,
+                    embeddings=embeddings,
+                    documents=texts,
+                    metadatas=metadatas
+                )
+            
+            pending_add.result()
         
         logger.info(f"Added {len(chunks)} chunks to vector store")
     
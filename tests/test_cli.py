@@ -0,0 +1,86 @@
+"""Test that CLI steps agree on where a novel's outputs live."""
+import pytest
+from click.testing import CliRunner
+import config
+import main
+from extraction.models import ActStructure, Screenplay
+from storage.database import Database
+from utils import paths
+
+
+class FakeConverter:
+    """Returns a screenplay whose title slugifies differently from the stored slug."""
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def convert(self, novel_id, progress_callback=None):
+        return Screenplay(
+            screenplay_id="sp1", novel_id=novel_id, novel_title="A Different Title!",
+            act_structure=ActStructure(act_one_chunk_range=(0, 0), act_two_a_chunk_range=(0, 0),
+                                       act_two_b_chunk_range=(0, 0), act_three_chunk_range=(0, 0))
+        )
+
+
+class FakeExtractor:
+    """Skips the LLM and returns no breakdowns."""
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def process_all_scenes(self, scenes, story_bible, progress_callback=None):
+        return []
+
+
+def test_convert_script_and_breakdown_scenes_share_slug(tmp_path, monkeypatch):
+    """convert-script writes the screenplay where breakdown-scenes looks for it."""
+    pytest.importorskip("chromadb")
+    pytest.importorskip("sentence_transformers")
+
+    db = Database(tmp_path / "cli.db")
+    novel_id = db.insert_novel("The Stored Title", "novel.pdf", "hash", 1, 100)
+    db.insert_story_bible(novel_id, {
+        "novel_title": "The Stored Title",
+        "timeline": {"description": "", "era": "", "technology_level": "", "cultural_notes": ""},
+        "tone": {"mood": "", "pacing": "", "style_notes": "", "violence_level": ""},
+        "plot": {"logline": "", "synopsis": ""},
+    }, "test-model")
+
+    monkeypatch.setattr(config, "ANTHROPIC_API_KEY", "test-key")
+    monkeypatch.setattr(config, "SCREENPLAYS_DIR", tmp_path)
+    monkeypatch.setattr(config, "SCENE_BREAKDOWNS_DIR", tmp_path)
+    monkeypatch.setattr(main, "get_db", lambda: db)
+    monkeypatch.setattr(main, "get_vector_store", lambda: None)
+    monkeypatch.setattr(main, "get_anthropic_client", lambda: None)
+    monkeypatch.setattr("screenplay.converter.ScreenplayConverter", FakeConverter)
+    monkeypatch.setattr("screenplay.scene_breakdown.SceneBreakdownExtractor", FakeExtractor)
+
+    runner = CliRunner()
+    result = runner.invoke(main.cli, ["convert-script", "--novel-id", novel_id])
+    assert result.exit_code == 0, result.output
+
+    slug = db.get_novel_by_id(novel_id)["slug"]
+    assert paths.screenplay_json_path(slug).exists()
+    assert paths.fountain_path(slug).exists()
+
+    result = runner.invoke(main.cli, ["breakdown-scenes", "--novel-id", novel_id])
+    assert result.exit_code == 0, result.output
+    assert "Screenplay not found" not in result.output
+    assert paths.breakdown_path(slug).exists()
+
+
+def test_find_prompt_file_ignores_other_novels(tmp_path, monkeypatch):
+    """A novel without prompts never resolves to another novel's prompts file."""
+    db = Database(tmp_path / "cli.db")
+    novel_id = db.insert_novel("Great Expectations, Vol. 1", "a.pdf", "hash-a", 1, 100)
+    other_id = db.insert_novel("Bleak House", "b.pdf", "hash-b", 1, 100)
+    monkeypatch.setattr(config, "PROMPTS_DIR", tmp_path)
+    monkeypatch.setattr(main, "get_db", lambda: db)
+
+    paths.prompts_path(db.get_novel_by_id(other_id)["slug"]).write_text("[]")
+    assert main.find_prompt_file(novel_id) is None
+    assert main.find_prompt_file("missing") is None
+
+    legacy_file = tmp_path / "great_expectations,_vol._1_prompts.json"
+    legacy_file.write_text("[]")
+    assert main.find_prompt_file(novel_id) == legacy_file
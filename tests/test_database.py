@@ -0,0 +1,74 @@
+"""Test SQLite database operations."""
+import sqlite3
+import pytest
+from ingestion.models import NarrativeChunk, NarrativeChunkList
+from storage.database import Database
+
+
+@pytest.fixture
+def db(tmp_path):
+    """Fresh database in a temporary directory."""
+    return Database(tmp_path / "pipeline.db")
+
+
+def test_get_novel_by_id(db):
+    """Test that inserted novels can be fetched by ID with their slug."""
+    novel_id = db.insert_novel("My Book", "/tmp/my_book.pdf", "abc123", 10, 2500)
+
+    novel = db.get_novel_by_id(novel_id)
+
+    assert novel['title'] == "My Book"
+    assert novel['slug'] == "my_book"
+    assert db.get_novel_by_id("missing") is None
+
+
+def test_get_novel_by_quick_key(db):
+    """Test that novels match on size, mtime and prefix hash, and legacy rows never do."""
+    quick_key = {"file_size": 2048, "file_mtime_ns": 1_700_000_000_000_000_000, "prefix_hash": "beef"}
+    novel_id = db.insert_novel("My Book", "/tmp/my_book.pdf", "abc123", 10, 2500, **quick_key)
+    db.insert_novel("Old Book", "/tmp/old_book.pdf", "def456", 10, 2500)
+
+    assert db.get_novel_by_quick_key(**quick_key)['id'] == novel_id
+    assert db.get_novel_by_quick_key(**dict(quick_key, file_mtime_ns=0)) is None
+
+
+def test_existing_database_gains_slug_column(tmp_path):
+    """Test that databases created before the slug column are migrated."""
+    db_path = tmp_path / "pipeline.db"
+    conn = sqlite3.connect(db_path)
+    conn.execute(
+        """CREATE TABLE novels (id TEXT PRIMARY KEY, title TEXT NOT NULL, file_path TEXT NOT NULL,
+           file_hash TEXT NOT NULL, page_count INTEGER, word_count INTEGER, ingested_at TEXT NOT NULL)"""
+    )
+    conn.execute("INSERT INTO novels VALUES ('n1', 'Old Novel', 'p', 'h', 1, 1, 't')")
+    conn.commit()
+    conn.close()
+
+    db = Database(db_path)
+
+    assert db.get_novel_by_id('n1')['slug'] == "old_novel"
+
+
+def test_get_novel_id_for_scene(db):
+    """Test that a scene's novel is found from its generation jobs."""
+    with db._get_connection() as conn:
+        conn.execute(
+            """INSERT INTO generation_jobs (id, prompt_id, novel_id, scene_id, clip_index, api_provider, created_at)
+               VALUES ('j1', 'p1', 'n1', 's1', 0, 'seedance', 't')"""
+        )
+        conn.commit()
+
+    assert db.get_novel_id_for_scene("s1") == "n1"
+    assert db.get_novel_id_for_scene("missing") is None
+
+
+def test_get_chunk_fields_round_trip(db):
+    """Test that stored chunks validate back into identical NarrativeChunks."""
+    chunks = [
+        NarrativeChunk(chunk_id=f"c{i}", novel_title="My Book", chapter_number=1, chunk_index=i,
+                       text=f"Paragraph {i}.", token_count=3, start_char=i * 10, end_char=i * 10 + 9)
+        for i in range(3)
+    ]
+    db.insert_chunks(chunk.to_dict(novel_id="n1") for chunk in reversed(chunks))
+
+    assert NarrativeChunkList.validate_python(db.get_chunk_fields("n1", "My Book")) == chunks
@@ -0,0 +1,231 @@
+"""Test bounded-concurrency job execution."""
+import asyncio
+import pytest
+from extraction.models import VideoPrompt
+from execution.api_clients import BaseVideoAPIClient, JobStatus, RateLimits, SeedanceClient
+from execution.downloader import DownloadResult
+from execution.job_executor import JobExecutor, JobResult
+from execution.poller import AsyncJobPoller
+from execution.rate_limiter import RateLimiter
+from generation.job_queue import JobQueue
+from storage.database import Database
+
+
+def _queue_prompts(db, texts):
+    """Insert one video prompt and queued job per prompt text."""
+    prompts = [
+        VideoPrompt(prompt_id=f"p{i}", scene_id="s1", novel_id="n1", clip_index=i,
+                    prompt_type="action", prompt_text=text)
+        for i, text in enumerate(texts)
+    ]
+    with db._get_connection() as conn:
+        conn.executemany(
+            """INSERT INTO video_prompts (id, scene_id, novel_id, clip_index, prompt_type,
+               prompt_text, duration_seconds, created_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
+            [(p.prompt_id, p.scene_id, p.novel_id, p.clip_index, p.prompt_type,
+              p.prompt_text, p.duration_seconds, p.created_at) for p in prompts]
+        )
+        conn.commit()
+    JobQueue(db).add_jobs_from_prompts(prompts)
+
+
+@pytest.fixture
+def db(tmp_path):
+    """Database with six queued jobs for one novel."""
+    db = Database(tmp_path / "pipeline.db")
+    _queue_prompts(db, [f"shot {i}" for i in range(6)])
+    return db
+
+
+def test_execute_queue_bounds_concurrency(db):
+    """Test that no more than max_concurrent_jobs run at once and results are recorded."""
+    executor = JobExecutor(db)
+    in_flight, peak = 0, 0
+
+    async def fake_single_job(job):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        if job['clip_index'] == 3:
+            return JobResult(success=False, file_path=None, generation_time_seconds=None,
+                             cost_usd=None, error="boom")
+        return JobResult(success=True, file_path=f"{job['prompt']['prompt_text']}.mp4",
+                         generation_time_seconds=1.0, cost_usd=0.5, error=None)
+
+    executor.execute_single_job = fake_single_job
+    progress = []
+
+    report = asyncio.run(executor.execute_queue(
+        "n1", max_concurrent_jobs=2, progress_callback=lambda done, total: progress.append(done)
+    ))
+
+    assert peak == 2
+    assert (report.completed, report.failed) == (5, 1)
+    assert report.error_summary == {"boom": 1}
+    assert progress == [0, 1, 2, 3, 4, 5, 6]
+
+    stats = JobQueue(db).get_queue_stats("n1")
+    assert (stats.complete, stats.failed) == (5, 1)
+
+    # A resumed run skips completed jobs and retries the failure
+    rerun = asyncio.run(executor.execute_queue("n1", max_concurrent_jobs=2))
+    assert (rerun.skipped, rerun.failed, rerun.total_jobs) == (5, 1, 6)
+
+
+class FakeDownloader:
+    async def download(self, video_url, job_id, novel_id, scene_id, clip_index):
+        return DownloadResult(success=True, file_path=video_url, file_size_bytes=1, error=None)
+
+    async def aclose(self):
+        pass
+
+
+def test_execute_queue_submits_in_batches(db):
+    """Test that batch-capable clients get one submit and status call per batch."""
+    client = SeedanceClient(api_key="test", base_url="test")
+    calls = {"submit_batch": 0, "get_statuses": 0}
+
+    async def submit_batch(prompts):
+        calls["submit_batch"] += 1
+        return [p["prompt_text"] for p in prompts]
+
+    async def get_statuses(job_ids):
+        calls["get_statuses"] += 1
+        return {job_id: JobStatus(status="completed", progress=100, eta_seconds=0, error=None) for job_id in job_ids}
+
+    client.submit_batch, client.get_statuses = submit_batch, get_statuses
+    rate_limiter = RateLimiter(db)
+    rate_limiter.set_rate("seedance", 60000)
+    executor = JobExecutor(db, client=client, downloader=FakeDownloader(), rate_limiter=rate_limiter)
+
+    report = asyncio.run(executor.execute_queue("n1", batch_size=4))
+
+    assert report.completed == 6
+    assert calls == {"submit_batch": 2, "get_statuses": 2}
+
+
+class SingleJobClient(BaseVideoAPIClient):
+    """Client with no bulk endpoints, relying on the base-class batch defaults."""
+
+    def __init__(self):
+        super().__init__(api_key="test", base_url="test")
+        self.submitted = []
+
+    async def submit_job(self, prompt):
+        self.submitted.append(prompt["prompt_text"])
+        return prompt["prompt_text"]
+
+    async def poll_status(self, job_id):
+        return JobStatus(status="completed", progress=100, eta_seconds=0, error=None)
+
+    async def get_result_url(self, job_id):
+        return f"https://example.com/{job_id}.mp4"
+
+    def get_rate_limits(self):
+        return RateLimits(requests_per_minute=60, requests_per_hour=1000, requests_per_day=10000)
+
+
+def test_execute_queue_submits_singly_without_batch_support(db):
+    """Test that clients without supports_batch get one submit per job via the base defaults."""
+    client = SingleJobClient()
+    assert asyncio.run(client.submit_batch([{"prompt_text": "a"}, {"prompt_text": "b"}])) == ["a", "b"]
+    assert set(asyncio.run(client.get_statuses(["a", "b"]))) == {"a", "b"}
+    client.submitted.clear()
+
+    rate_limiter = RateLimiter(db)
+    rate_limiter.set_rate("seedance", 60000)
+    executor = JobExecutor(db, client=client, downloader=FakeDownloader(), rate_limiter=rate_limiter)
+
+    report = asyncio.run(executor.execute_queue("n1", batch_size=4))
+
+    assert report.completed == 6
+    assert sorted(client.submitted) == [f"shot {i}" for i in range(6)]
+
+
+def test_execute_queue_reuses_clips_for_identical_prompts(tmp_path):
+    """Test that repeated prompts are generated once and later runs hit the cache."""
+    db = Database(tmp_path / "pipeline.db")
+    _queue_prompts(db, ["close-up", "close-up", "wide shot"])
+    executor = JobExecutor(db)
+    generated = []
+
+    async def fake_single_job(job):
+        clip = tmp_path / f"{job['id']}.mp4"
+        clip.write_bytes(b"video")
+        generated.append(job['prompt']['prompt_text'])
+        return JobResult(success=True, file_path=str(clip), generation_time_seconds=1.0, cost_usd=0.5, error=None)
+
+    executor.execute_single_job = fake_single_job
+
+    report = asyncio.run(executor.execute_queue("n1"))
+
+    assert sorted(generated) == ["close-up", "wide shot"]
+    assert (report.completed, report.skipped) == (2, 1)
+    clips = JobQueue(db).get_clip_paths("n1")["s1"]
+    assert len(clips) == 3 and clips[0] == clips[1]
+
+    # Re-queue the same prompt: the stored clip is reused without generating
+    with db._get_connection() as conn:
+        conn.execute("UPDATE generation_jobs SET status = 'queued'")
+        conn.commit()
+    generated.clear()
+    rerun = asyncio.run(executor.execute_queue("n1"))
+    assert generated == []
+    assert rerun.skipped == 3
+
+    # Bypassing the cache regenerates everything
+    with db._get_connection() as conn:
+        conn.execute("UPDATE generation_jobs SET status = 'queued'")
+        conn.commit()
+    uncached = asyncio.run(executor.execute_queue("n1", use_cache=False))
+    assert (uncached.completed, len(generated)) == (3, 3)
+
+
+def test_rate_limiter_spaces_concurrent_requests():
+    """Test that concurrent acquires are paced instead of bursting together."""
+    limiter = RateLimiter(db=None)
+    limiter.set_rate("seedance", 1200)  # One request per 50ms
+
+    async def acquire_all():
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        times = []
+
+        async def acquire():
+            await limiter.acquire("seedance")
+            times.append(loop.time() - start)
+
+        await asyncio.gather(*(acquire() for _ in range(4)))
+        return sorted(times)
+
+    times = asyncio.run(acquire_all())
+
+    assert times[0] < 0.04
+    assert times[-1] >= 0.14
+
+
+def test_poll_many_retries_failed_result_url(db):
+    """Test that a get_result_url error only delays that job instead of failing the batch."""
+    client = SeedanceClient(api_key="test", base_url="test")
+    attempts = {}
+
+    async def get_result_url(job_id):
+        attempts[job_id] = attempts.get(job_id, 0) + 1
+        if job_id == "b" and attempts[job_id] == 1:
+            raise RuntimeError("result not ready")
+        return f"https://example.com/{job_id}.mp4"
+
+    client.get_result_url = get_result_url
+    poller = AsyncJobPoller(client, db)
+
+    results = asyncio.run(poller.poll_many_until_complete(
+        [("j1", "a"), ("j2", "b"), ("j3", "c")], poll_interval_seconds=0
+    ))
+
+    assert {job_id: result.status for job_id, result in results.items()} == {
+        "j1": "completed", "j2": "completed", "j3": "completed"
+    }
+    assert results["j2"].video_url == "https://example.com/b.mp4"
+    assert attempts == {"a": 1, "b": 2, "c": 1}
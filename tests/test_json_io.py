@@ -0,0 +1,28 @@
+"""Test JSON file helpers."""
+import pytest
+from utils.json_io import count_json_array, dump_json, iter_json_array, load_json
+
+
+def test_json_round_trip(tmp_path):
+    """Test that dumped files load back identically through every reader."""
+    path = tmp_path / "data.json"
+    data = [{"name": "Élodie", "scores": [1, 2.5]}, {"name": "Sam", "scores": []}]
+
+    dump_json(data, path)
+
+    assert load_json(path) == data
+    assert list(iter_json_array(path)) == data
+    assert count_json_array(path) == 2
+    assert "Élodie" in path.read_text(encoding="utf-8")
+
+
+def test_dump_json_keeps_old_file_on_failure(tmp_path):
+    """Test that a failed write leaves the previous file intact and no temp file."""
+    path = tmp_path / "data.json"
+    dump_json([1, 2, 3], path)
+
+    with pytest.raises(TypeError):
+        dump_json([object()], path)
+
+    assert load_json(path) == [1, 2, 3]
+    assert [p.name for p in tmp_path.iterdir()] == ["data.json"]
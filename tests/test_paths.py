@@ -0,0 +1,23 @@
+"""Test output file naming."""
+from utils.paths import natural_sort_key, scene_clip_paths, slugify_title
+
+
+def test_slugify_title():
+    """Test that titles become filesystem-safe slugs."""
+    assert slugify_title("The Auran Chronicles - Message Bearer") == "the_auran_chronicles_message_bearer"
+    assert slugify_title("  My Book! ") == "my_book"
+    assert slugify_title("???") == "novel"
+
+
+def test_natural_sort_key():
+    """Test that clip numbers sort numerically rather than lexically."""
+    names = ["clip_10.mp4", "clip_2.mp4", "clip_1.mp4"]
+    assert sorted(names, key=natural_sort_key) == ["clip_1.mp4", "clip_2.mp4", "clip_10.mp4"]
+
+
+def test_scene_clip_paths(tmp_path):
+    """Test that a scene directory's clips list in playback order, ignoring other files."""
+    for name in ["clip_10.mp4", "clip_2.mp4", "clip_1.mp4", "notes.txt"]:
+        (tmp_path / name).write_bytes(b"")
+
+    assert scene_clip_paths(tmp_path) == [str(tmp_path / f"clip_{i}.mp4") for i in (1, 2, 10)]
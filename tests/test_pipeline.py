@@ -0,0 +1,75 @@
+"""Test pipelined chunk storage."""
+import pytest
+from ingestion.models import ExtractedDocument, NarrativeChunk
+from ingestion.pipeline import IngestionPipeline
+
+
+class FakeChunker:
+    """Splits on blank lines and emits one chunk per paragraph."""
+
+    def split_chapters(self, doc):
+        return doc.raw_text.split("\n\n")
+
+    def iter_chapter_chunks(self, chapters, novel_title):
+        for chapter_num, text in enumerate(chapters, start=1):
+            yield [
+                NarrativeChunk(
+                    chunk_id=f"{chapter_num}-{i}",
+                    novel_title=novel_title,
+                    chapter_number=chapter_num,
+                    chunk_index=i,
+                    text=word,
+                    token_count=1,
+                    start_char=0,
+                    end_char=len(word)
+                )
+                for i, word in enumerate(text.split())
+            ]
+
+
+class FakeDatabase:
+    def __init__(self):
+        self.rows = []
+
+    def insert_chunks(self, chunks):
+        self.rows.extend(chunks)
+
+
+class FakeVectorStore:
+    def __init__(self, fail=False):
+        self.ids = []
+        self.fail = fail
+
+    def add_chunks(self, chunks, novel_id):
+        if self.fail:
+            raise RuntimeError("embedding failed")
+        self.ids.extend(c['id'] for c in chunks)
+
+
+def _doc(chapters=5):
+    text = "\n\n".join(f"alpha beta gamma {i}" for i in range(chapters))
+    return ExtractedDocument(title="Test", raw_text=text, page_count=1)
+
+
+def test_pipeline_stores_every_chunk():
+    """Test that all chunks reach both the database and vector store."""
+    db, store = FakeDatabase(), FakeVectorStore()
+    progress = []
+
+    count = IngestionPipeline(db, store, FakeChunker(), max_pending=1).run(
+        _doc(), "novel-1", progress_callback=lambda stage, n: progress.append((stage, n))
+    )
+
+    assert count == 20
+    assert [r['id'] for r in db.rows] == store.ids
+    assert all(r['novel_id'] == "novel-1" for r in db.rows)
+    for stage in IngestionPipeline.STAGES:
+        assert sum(n for s, n in progress if s == stage) == 5
+
+
+def test_pipeline_propagates_stage_errors():
+    """Test that a failing stage raises instead of hanging."""
+    pipeline = IngestionPipeline(FakeDatabase(), FakeVectorStore(fail=True), FakeChunker(), max_pending=1)
+
+    with pytest.raises(RuntimeError, match="embedding failed"):
+        pipeline.run(_doc(50), "novel-1")
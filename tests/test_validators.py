@@ -0,0 +1,42 @@
+"""Test prompt validators."""
+import pytest
+from extraction.models import VideoPrompt
+from prompts import validators
+from prompts.validators import PromptValidator
+
+NAMES = ["Ann", "Anna", "Bob", ""]
+
+
+def _prompts():
+    texts = ["Anna walks in.", "Bob waves at ann.", "An empty street."]
+    tags = [["Anna: red coat", "Ann: red coat"], ["Bob: tall", ": unnamed"], []]
+    return [
+        VideoPrompt(prompt_id=f"p{i}", scene_id="s1", novel_id="n1", clip_index=i,
+                    prompt_type="action", prompt_text=text, character_consistency_tags=tag_list)
+        for i, (text, tag_list) in enumerate(zip(texts, tags))
+    ]
+
+
+def _index(monkeypatch, module):
+    monkeypatch.setattr(validators, "ahocorasick", module)
+    prompts = _prompts()
+    return PromptValidator.index_characters(prompts, NAMES, PromptValidator.lowercase_prompts(prompts))
+
+
+def test_index_characters_substring_fallback(monkeypatch):
+    """Test overlapping names and that an empty name matches nothing."""
+    index = _index(monkeypatch, None)
+
+    assert index == {
+        "ann": (["p0", "p1"], {"Anna: red coat", "Ann: red coat"}),
+        "anna": (["p0"], {"Anna: red coat"}),
+        "bob": (["p1"], {"Bob: tall"}),
+        "": ([], set()),
+    }
+
+
+def test_index_characters_automaton_matches_fallback(monkeypatch):
+    """Test that the pyahocorasick scan gives the same index as the substring loop."""
+    ahocorasick = pytest.importorskip("ahocorasick")
+
+    assert _index(monkeypatch, ahocorasick) == _index(monkeypatch, None)
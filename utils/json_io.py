@@ -0,0 +1,121 @@
+"""JSON file helpers for large pipeline outputs."""
+import json
+import os
+from pathlib import Path
+from typing import Any, Iterator, Union
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover - falls back to a full json.load
+    ijson = None
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - falls back to the stdlib json module
+    orjson = None
+
+# ijson events that begin a new element of the top-level array
+_ITEM_START_EVENTS = frozenset(
+    ("start_map", "start_array", "null", "boolean", "integer", "double", "number", "string")
+)
+
+
+def iter_json_array(path: Union[str, Path]) -> Iterator[Any]:
+    """Lazily yield the elements of a file containing a top-level JSON array.
+
+    Uses ijson when available so only one element is in memory at a time.
+
+    Args:
+        path: Path to JSON file
+
+    Yields:
+        Each array element, decoded
+
+    Raises:
+        ValueError: If the file is not valid JSON
+    """
+    with open(path, 'rb') as f:
+        if ijson is None:
+            yield from json.load(f)
+            return
+        try:
+            yield from ijson.items(f, 'item', use_float=True)
+        except ijson.JSONError as e:
+            raise ValueError(f"Invalid JSON in {path}: {e}") from e
+
+
+def count_json_array(path: Union[str, Path]) -> int:
+    """Count the elements of a top-level JSON array without decoding them.
+
+    Args:
+        path: Path to JSON file
+
+    Returns:
+        Number of array elements
+
+    Raises:
+        ValueError: If the file is not valid JSON
+    """
+    with open(path, 'rb') as f:
+        if ijson is None:
+            return len(json.load(f))
+        try:
+            return sum(
+                1 for prefix, event, _ in ijson.parse(f)
+                if prefix == 'item' and event in _ITEM_START_EVENTS
+            )
+        except ijson.JSONError as e:
+            raise ValueError(f"Invalid JSON in {path}: {e}") from e
+
+
+def load_json(path: Union[str, Path]) -> Any:
+    """Read and decode a whole JSON file, using orjson when available.
+
+    Args:
+        path: Path to JSON file
+
+    Returns:
+        Decoded JSON value
+    """
+    if orjson is None:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    with open(path, 'rb') as f:
+        return orjson.loads(f.read())
+
+
+def write_bytes_atomic(path: Union[str, Path], data: bytes) -> None:
+    """Write a file so readers see either the old or the complete new contents.
+
+    Data goes to a sibling temp file that is renamed over the target, so an
+    interrupted write never leaves a truncated file behind.
+
+    Args:
+        path: Destination file path
+        data: File contents
+    """
+    path = Path(path)
+    tmp_path = path.with_name(path.name + '.tmp')
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def dump_json(data: Any, path: Union[str, Path]) -> None:
+    """Atomically write data as indented UTF-8 JSON, using orjson when available.
+
+    Like json.dumps, non-string dict keys (e.g. ints) are written as strings.
+
+    Args:
+        data: JSON-serializable value
+        path: Destination file path
+    """
+    if orjson is None:
+        encoded = json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+    else:
+        encoded = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    write_bytes_atomic(path, encoded)
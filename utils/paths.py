@@ -0,0 +1,75 @@
+"""Output file naming shared by every pipeline phase."""
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import List, Union
+
+import config
+
+_NON_WORD = re.compile(r"\W+")
+_DIGIT_RUNS = re.compile(r"(\d+)")
+
+
+@lru_cache(maxsize=None)
+def slugify_title(title: str) -> str:
+    """Convert a novel title into a filesystem-safe slug.
+
+    Args:
+        title: Novel title
+
+    Returns:
+        Lowercase slug with runs of non-word characters collapsed to "_"
+    """
+    return _NON_WORD.sub("_", title.strip().lower()).strip("_") or "novel"
+
+
+def story_bible_path(slug: str) -> Path:
+    """Path of the exported Story Bible JSON for a novel slug."""
+    return config.STORY_BIBLES_DIR / f"{slug}.json"
+
+
+def fountain_path(slug: str) -> Path:
+    """Path of the Fountain screenplay for a novel slug."""
+    return config.SCREENPLAYS_DIR / f"{slug}.fountain"
+
+
+def screenplay_json_path(slug: str) -> Path:
+    """Path of the screenplay JSON for a novel slug."""
+    return config.SCREENPLAYS_DIR / f"{slug}_screenplay.json"
+
+
+def breakdown_path(slug: str) -> Path:
+    """Path of the scene breakdowns JSON for a novel slug."""
+    return config.SCENE_BREAKDOWNS_DIR / f"{slug}_breakdown.json"
+
+
+def prompts_path(slug: str) -> Path:
+    """Path of the video prompts JSON for a novel slug."""
+    return config.PROMPTS_DIR / f"{slug}_prompts.json"
+
+
+def queue_path(slug: str, api: str) -> Path:
+    """Path of the exported job queue JSON for a novel slug and provider."""
+    return config.JOBS_DIR / f"{slug}_{api}_queue.json"
+
+
+def scene_video_path(slug: str, scene_id: str) -> Path:
+    """Path of an assembled scene video for a novel slug."""
+    return config.SCENES_DIR / f"{slug}_{scene_id}.mp4"
+
+
+def natural_sort_key(name: str) -> list:
+    """Sort key that orders embedded numbers numerically (clip_2 before clip_10)."""
+    return [int(part) if part.isdigit() else part for part in _DIGIT_RUNS.split(name)]
+
+
+def scene_clip_paths(scene_dir: Union[str, Path]) -> List[str]:
+    """List a scene directory's MP4 clips in playback order.
+
+    Args:
+        scene_dir: Directory holding clip_NNN.mp4 files
+
+    Returns:
+        Clip paths sorted naturally by file name
+    """
+    return [str(p) for p in sorted(Path(scene_dir).glob("*.mp4"), key=lambda p: natural_sort_key(p.name))]